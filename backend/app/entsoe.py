@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
-from entsoe_core import build_config, parse_results, run_request, setup_directories
+from entsoe_core import (
+    EntsoeConfig,
+    build_config,
+    parse_results,
+    run_batch,
+    run_batch_async,
+    setup_directories,
+)
+from entsoe_core.service import columnar_output_path, load_batch_documents
 
 from backend.app.storage import RESULTS_DIR, ensure_storage
 
@@ -15,7 +25,7 @@ class EntsoeError(RuntimeError):
     """Raised when ENTSO-E execution fails."""
 
 
-def run_requests(requests_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _build_config() -> EntsoeConfig:
     api_key = os.getenv("ENTSOE_API_KEY")
     if not api_key:
         raise EntsoeError("ENTSOE_API_KEY is not set.")
@@ -25,25 +35,45 @@ def run_requests(requests_list: List[Dict[str, Any]]) -> Dict[str, Any]:
         api_key,
         project_root=Path(__file__).resolve().parents[2],
         output_dir=RESULTS_DIR,
+        # Optional Parquet/Arrow output ("parquet" or "arrow", requires pyarrow)
+        columnar_format=os.getenv("ENTSO_COLUMNAR_FORMAT") or None,
+        # Follow-up questions over wider periods only fetch what is missing
+        incremental=os.getenv("ENTSO_INCREMENTAL", "1") != "0",
     )
     setup_directories(config)
+    return config
+
+
+def run_requests(requests_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    config = _build_config()
+    results = run_batch(requests_list, config)["results"]
+    return _with_combined_results(results, config)
+
 
-    results = [run_request(req["params"], req.get("name"), config) for req in requests_list]
-    
+async def run_requests_async(requests_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Like run_requests, but fetches on the running event loop."""
+    config = _build_config()
+    results = (await run_batch_async(requests_list, config))["results"]
+    return await asyncio.to_thread(_with_combined_results, results, config)
+
+
+def _with_combined_results(results: List[Dict[str, Any]], config: EntsoeConfig) -> Dict[str, Any]:
     # If there are multiple successful results, create a combined CSV/JSON
-    from entsoe_core.parser import merge_parsed_results, parsed_to_csv, parse_entsoe_xml
+    from entsoe_core.parser import (
+        merge_parsed_results,
+        parsed_to_columnar_file,
+        parsed_to_csv,
+    )
     import json
 
     successful_results = [r for r in results if r.get("success")]
     if len(successful_results) > 1:
         try:
-            # Parse all successful results to get their dict representations
-            all_parsed = []
-            for res in successful_results:
-                # Find the XML file in the result
-                xml_path = next((f["path"] for f in res["files"] if f["type"] == "xml"), None)
-                if xml_path:
-                    all_parsed.append(parse_entsoe_xml(xml_path))
+            # Parse all successful results to their columnar representations
+            # The per-request parses above populated the cache, so these are hits
+            # (incremental results are re-assembled from their stored segments,
+            # and overlapping requests that shared a fetch count each point once)
+            all_parsed = load_batch_documents(successful_results, config)
             
             if all_parsed:
                 merged = merge_parsed_results(all_parsed)
@@ -55,21 +85,27 @@ def run_requests(requests_list: List[Dict[str, Any]]) -> Dict[str, Any]:
                 csv_path = config.csv_dir / f"{combined_name}.csv"
                 
                 with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(merged, f, indent=2, default=str)
+                    json.dump(merged.to_dict(), f, indent=2, default=str)
                 
                 csv_info = parsed_to_csv(merged, str(csv_path))
                 
+                combined_files = [
+                    {"type": "json", "path": str(json_path)},
+                    {"type": "csv", "path": str(csv_path)}
+                ]
+                columnar_path = columnar_output_path(combined_name, config)
+                if columnar_path is not None:
+                    parsed_to_columnar_file(merged, str(columnar_path), config.columnar_format)
+                    combined_files.append({"type": config.columnar_format, "path": str(columnar_path)})
+                
                 # Add combined files to the execution summary
                 combined_result = {
                     "name": "Combined Results",
                     "success": True,
-                    "files": [
-                        {"type": "json", "path": str(json_path)},
-                        {"type": "csv", "path": str(csv_path)}
-                    ],
+                    "files": combined_files,
                     "summary": {
-                        "timeseries_count": merged.get("timeseriesCount", 0),
-                        "data_points": merged.get("totalDataPoints", 0),
+                        "timeseries_count": len(merged.series),
+                        "data_points": merged.total_points,
                     },
                     "csv_info": csv_info,
                     "is_combined": True
@@ -31,7 +31,8 @@ from backend.app.database import (
     list_messages,
     create_conversation,
 )
-from backend.app.entsoe import EntsoeError, run_requests
+from backend.app.entsoe import EntsoeError, run_requests, run_requests_async
+from entsoe_core.resilience import circuit_breaker_states
 from backend.app.llm import LLMError, generate_requests, generator_pass, router_pass
 from backend.app import llm_gemini
 from backend.app.llm_context import load_endpoint_titles, load_endpoint_article_map
@@ -70,8 +71,8 @@ async def startup() -> None:
 
 
 @app.get("/health")
-async def health() -> Dict[str, str]:
-    return {"status": "ok"}
+async def health() -> Dict[str, Any]:
+    return {"status": "ok", "entsoe_circuit": circuit_breaker_states()}
 
 
 def _register_result_files(
@@ -265,7 +266,7 @@ async def chat_stream(request: ChatRequest) -> StreamingResponse:
             yield send_event("status", {"message": "Connecting to ENTSO-E APIs"})
             await asyncio.sleep(0)
 
-            execution = await asyncio.to_thread(run_requests, requests_list)
+            execution = await run_requests_async(requests_list)
             payload = normalize_results(llm_response, execution)
             yield send_event("results", payload)
             await asyncio.sleep(0)
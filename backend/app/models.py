@@ -39,6 +39,16 @@ class RequestResult(BaseModel):
     chunks_success: Optional[int] = None
     chunks_with_data: Optional[int] = None
     csv_info: Optional[Dict[str, Any]] = None
+    retry_attempts: Optional[int] = None
+    retry_wait: Optional[float] = None
+    cache_hit: Optional[bool] = None
+    chunks_cached: Optional[int] = None
+    incremental: Optional[bool] = None
+    segments: Optional[int] = None
+    pages: Optional[int] = None
+    truncated: Optional[bool] = None
+    shared_fetch: Optional[str] = None
+    no_data_reason: Optional[Dict[str, str]] = None
 
 
 class ChatResponse(BaseModel):
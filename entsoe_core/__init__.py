@@ -6,6 +6,8 @@ from .service import (
     setup_directories,
     run_request,
     run_batch,
+    run_request_async,
+    run_batch_async,
     parse_results,
     format_datetime,
     get_time_range,
@@ -17,6 +19,8 @@ __all__ = [
     "setup_directories",
     "run_request",
     "run_batch",
+    "run_request_async",
+    "run_batch_async",
     "parse_results",
     "format_datetime",
     "get_time_range",
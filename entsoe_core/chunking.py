@@ -0,0 +1,126 @@
+"""
+Planning of API query windows and pages.
+
+The ENTSO-E API rejects a query whose period is longer than a maximum span,
+and that maximum depends on the data requested: a year for most document
+types, a single day for very granular or high-volume data. The planner splits
+a period into the fewest consecutive windows that each stay within the limit
+for the request's documentType/businessType.
+
+Document-based endpoints (outages, bids, ...) also cap the number of documents
+per response; the rest is reached by paging with the `offset` parameter.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class MaxSpan:
+    """Longest period a single query may cover (calendar years plus days)."""
+
+    years: int = 0
+    days: int = 0
+
+    def __post_init__(self) -> None:
+        if self.years < 0 or self.days < 0 or not (self.years or self.days):
+            raise ValueError("MaxSpan must be a positive span")
+
+    def advance(self, start: datetime) -> datetime:
+        """End of the longest valid window starting at start."""
+        end = start
+        if self.years:
+            try:
+                end = end.replace(year=end.year + self.years)
+            except ValueError:  # 29 February
+                end = end.replace(year=end.year + self.years, day=28)
+        return end + timedelta(days=self.days)
+
+
+DEFAULT_MAX_SPAN = MaxSpan(years=1)
+
+# Maximum query span per (documentType, businessType); businessType None matches
+# any business type. Types not listed use DEFAULT_MAX_SPAN. Seeded from
+# docs/api/ENTSOE_Transparency_API_Documentation.md (1.4.1 and the endpoint sections);
+# no endpoint there varies its limit by processType.
+MAX_QUERY_SPANS: Dict[Tuple[str, Optional[str]], MaxSpan] = {
+    ("A73", None): MaxSpan(days=1),  # Actual generation per generation unit (16.1.A)
+    ("A86", "B33"): MaxSpan(days=1),  # Current balancing state / ACE (12.3.A), minute resolution
+    # Balancing energy bids (12.3.B&C): 1.4.1 gives ~1 day to 1 week; the short end always works
+    ("A37", None): MaxSpan(days=1),
+}
+
+
+def max_query_span(params: Dict[str, str]) -> MaxSpan:
+    """Maximum span of a single query for the request's document and business type."""
+    document_type = params.get("documentType")
+    business_type = params.get("businessType")
+    return (
+        MAX_QUERY_SPANS.get((document_type, business_type))
+        or MAX_QUERY_SPANS.get((document_type, None))
+        or DEFAULT_MAX_SPAN
+    )
+
+
+def plan_windows(start: datetime, end: datetime, span: MaxSpan) -> List[Tuple[datetime, datetime]]:
+    """
+    Split [start, end) into the fewest consecutive windows no longer than span.
+
+    Windows are anchored at start rather than at calendar boundaries, so a
+    period that fits in one query is never split.
+    """
+    windows = []
+    current = start
+    while current < end:
+        window_end = min(span.advance(current), end)
+        windows.append((current, window_end))
+        current = window_end
+    return windows
+
+
+# Documents per response for endpoints paged with `offset`, per documentType
+# (from the same documentation; 100 unless stated otherwise there)
+PAGE_SIZES: Dict[str, int] = {
+    "A15": 100,  # Procured balancing capacity
+    "A37": 100,  # Balancing energy bids
+    "A77": 100,  # Unavailability of production units
+    "A78": 200,  # Unavailability of transmission infrastructure
+    "A79": 100,  # Unavailability of offshore grid infrastructure
+    "A80": 200,  # Unavailability of generation units
+    "A81": 100,  # Contracted reserves
+}
+
+# Highest offset the API accepts
+MAX_OFFSET = 4800
+OFFSET_PARAM = "offset"
+
+
+def canonical_params(params: Dict[str, str]) -> Dict[str, str]:
+    """
+    params with the paging offset spelled `offset`.
+
+    Parts of the API documentation spell it `Offset`; paging and batch
+    planning only look for the lowercase name, which is also what is sent.
+    """
+    variants = [key for key in params if key.lower() == OFFSET_PARAM]
+    if not variants or variants == [OFFSET_PARAM]:
+        return params
+    if len(variants) > 1:
+        raise ValueError(f"Conflicting offset parameters: {', '.join(variants)}")
+    return {OFFSET_PARAM if key == variants[0] else key: value for key, value in params.items()}
+
+
+def page_size(params: Dict[str, str]) -> Optional[int]:
+    """Documents per page for the request, or None if it is not paged automatically."""
+    if OFFSET_PARAM in params:
+        # An explicit offset asks for that page only
+        return None
+    return PAGE_SIZES.get(params.get("documentType"))
+
+
+def page_offsets(size: int) -> List[int]:
+    """Offsets of the pages following the first one, up to MAX_OFFSET."""
+    return list(range(size, MAX_OFFSET + 1, size))
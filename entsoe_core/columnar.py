@@ -0,0 +1,364 @@
+"""
+Columnar representation of parsed ENTSO-E documents.
+
+Instead of one dict per Point, each Period keeps its positions and values in
+typed arrays (int64 positions, float64 values) plus a start epoch and the
+resolution. Timestamps are derived from those on demand. to_dict() rebuilds
+exactly the structure produced by ENTSOEXMLParser.to_dict().
+
+The arrays are stdlib array.array buffers, so NumPy is optional. When it is
+installed, point timestamps are computed with vectorized NumPy arithmetic over
+the position buffer and to_numpy() returns zero-copy views; without it the
+same values are computed in plain Python.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - pure Python fallback
+    np = None
+
+
+# Point value fields in the order they appear in the dict output
+POINT_VALUE_FIELDS = (
+    'quantity',
+    'price',
+    'imbalancePrice',
+    'secondaryQuantity',
+    'unavailableQuantity',
+    'activationPrice',
+)
+
+# Fields tried (in order) when a single value per point is needed, e.g. for CSV
+PRIMARY_VALUE_FIELDS = (
+    'quantity',
+    'price',
+    'imbalancePrice',
+    'activationPrice',
+    'secondaryQuantity',
+    'unavailableQuantity',
+)
+
+MISSING = math.nan
+
+# Resolutions stepped in calendar months rather than a fixed number of seconds
+CALENDAR_RESOLUTION_MONTHS = {
+    'P1M': 1,
+    'P3M': 3,
+    'P1Y': 12,
+}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def epoch_from_datetime(dt: datetime) -> Tuple[int, Optional[int]]:
+    """Convert a datetime to (epoch seconds, UTC offset seconds or None if naive)."""
+    offset = dt.utcoffset()
+    naive = dt.replace(tzinfo=None)
+    if offset is not None:
+        naive -= offset
+    epoch = int((naive - _EPOCH).total_seconds())
+    return epoch, int(offset.total_seconds()) if offset is not None else None
+
+
+def calendar_epochs(start_epoch: int, months: int, positions: array) -> array:
+    """
+    Epoch seconds for positions stepped by whole calendar months.
+    
+    ENTSO-E expresses local midnights in UTC (e.g. a January starting at
+    2021-12-31T23:00Z), so the start is anchored on the nearest month
+    boundary and its distance to that boundary is kept for every step.
+    """
+    start = _EPOCH + timedelta(seconds=start_epoch)
+    anchor = datetime(start.year, start.month, 1)
+    following = datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+    if following - start < start - anchor:
+        anchor = following
+    delta = int((start - anchor).total_seconds())
+    base = anchor.year * 12 + anchor.month - 1
+    
+    if np is not None:
+        # datetime64[M] counts months since 1970-01
+        month_index = base - 1970 * 12 + months * (np.asarray(positions, dtype=np.int64) - 1)
+        boundaries = month_index.astype('datetime64[M]').astype('datetime64[s]').astype(np.int64)
+        return _int_array(boundaries + delta)
+    
+    epochs = array('q')
+    for position in positions:
+        year, month = divmod(base + months * (position - 1), 12)
+        boundary = datetime(year, month + 1, 1) - _EPOCH
+        epochs.append(boundary.days * 86400 + boundary.seconds + delta)
+    return epochs
+
+
+def _int_array(values: Any) -> array:
+    """Copy an int64 NumPy array into an array.array('q')."""
+    result = array('q')
+    result.frombytes(values.astype(np.int64).tobytes())
+    return result
+
+
+def format_interval_time(epoch: int) -> str:
+    """Format epoch seconds like ENTSO-E interval bounds (e.g. 2023-01-01T00:00Z)."""
+    return (_EPOCH + timedelta(seconds=epoch)).strftime('%Y-%m-%dT%H:%MZ')
+
+
+def parse_interval_time(value: str) -> Optional[int]:
+    """Epoch seconds of an ENTSO-E interval bound, or None if it cannot be parsed."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return epoch_from_datetime(dt)[0]
+
+
+def format_epoch(epoch: int, utc_offset: Optional[int]) -> str:
+    """Format epoch seconds as an ISO timestamp in the given UTC offset."""
+    if utc_offset is None:
+        return (_EPOCH + timedelta(seconds=epoch)).isoformat()
+    tz = timezone.utc if utc_offset == 0 else timezone(timedelta(seconds=utc_offset))
+    return datetime.fromtimestamp(epoch, tz).isoformat()
+
+
+@dataclass
+class ColumnarPeriod:
+    """A Period with its points stored column-wise."""
+
+    start: str
+    end: str
+    resolution: str
+    start_epoch: Optional[int]
+    utc_offset: Optional[int]
+    resolution_seconds: int
+    positions: array = field(default_factory=lambda: array('q'))
+    # field name -> float64 column, NaN where the point has no such value
+    values: Dict[str, array] = field(default_factory=dict)
+    # imbalance price category per point ('' where absent), None if never present
+    categories: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def epochs(self) -> Optional[array]:
+        """
+        Epoch seconds of every point, computed once for the whole period.
+        
+        Returns None when the period start is unknown.
+        """
+        if self.start_epoch is None:
+            return None
+        
+        positions = self.positions
+        months = CALENDAR_RESOLUTION_MONTHS.get(self.resolution)
+        if months:
+            return calendar_epochs(self.start_epoch, months, positions)
+        
+        step = self.resolution_seconds
+        count = len(positions)
+        first = self.start_epoch
+        if np is not None:
+            return _int_array(first + step * (np.frombuffer(positions, dtype=np.int64) - 1))
+        # Complete curves (positions 1..n) are a plain range
+        if count and positions[0] == 1 and positions[-1] == count \
+                and positions == array('q', range(1, count + 1)):
+            return array('q', range(first, first + step * count, step))
+        return array('q', [first + step * (position - 1) for position in positions])
+    
+    def epoch_of(self, position: int) -> int:
+        """Epoch seconds of a single position (the period start must be known)."""
+        months = CALENDAR_RESOLUTION_MONTHS.get(self.resolution)
+        if months:
+            return calendar_epochs(self.start_epoch, months, [position])[0]
+        return self.start_epoch + self.resolution_seconds * (position - 1)
+    
+    def timestamps(self) -> List[Optional[str]]:
+        """ISO timestamp for every point (None when the start is unknown)."""
+        epochs = self.epochs()
+        if epochs is None:
+            return [None] * len(self.positions)
+        offset = self.utc_offset
+        return [format_epoch(epoch, offset) for epoch in epochs]
+    
+    def primary_values(self) -> List[Optional[float]]:
+        """The first available value per point, following PRIMARY_VALUE_FIELDS."""
+        columns = [self.values[name] for name in PRIMARY_VALUE_FIELDS if name in self.values]
+        output: List[Optional[float]] = []
+        for i in range(len(self.positions)):
+            value = None
+            for column in columns:
+                if not math.isnan(column[i]):
+                    value = column[i]
+                    break
+            output.append(value)
+        return output
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rebuild the dict form of this period, including per-point dicts."""
+        columns = [(name, self.values[name]) for name in POINT_VALUE_FIELDS if name in self.values]
+        # The category key follows imbalancePrice in the dict output
+        split = sum(1 for name, _ in columns if name in POINT_VALUE_FIELDS[:3])
+        leading, trailing = columns[:split], columns[split:]
+        categories = self.categories
+        timestamps = self.timestamps()
+
+        points = []
+        for i, position in enumerate(self.positions):
+            point: Dict[str, Any] = {'position': position}
+            if timestamps[i] is not None:
+                point['timestamp'] = timestamps[i]
+            for name, column in leading:
+                value = column[i]
+                if not math.isnan(value):
+                    point[name] = value
+            if categories and categories[i]:
+                point['imbalancePriceCategory'] = categories[i]
+            for name, column in trailing:
+                value = column[i]
+                if not math.isnan(value):
+                    point[name] = value
+            points.append(point)
+
+        return {
+            'start': self.start,
+            'end': self.end,
+            'resolution': self.resolution,
+            'points': points,
+        }
+
+    def slice(self, start_epoch: int, end_epoch: int) -> Optional['ColumnarPeriod']:
+        """
+        The points with timestamps in [start_epoch, end_epoch), or None if none are.
+        
+        Positions are renumbered from the first kept point, which becomes the
+        new period start; periods with an unknown start are returned unchanged.
+        """
+        epochs = self.epochs()
+        if epochs is None:
+            return self
+        keep = [i for i, epoch in enumerate(epochs) if start_epoch <= epoch < end_epoch]
+        if not keep:
+            return None
+        if len(keep) == len(epochs):
+            return self
+        
+        first = keep[0]
+        shift = self.positions[first] - 1
+        period_end = parse_interval_time(self.end)
+        new_end = end_epoch if period_end is None else min(period_end, end_epoch)
+        return ColumnarPeriod(
+            start=format_interval_time(epochs[first]),
+            end=format_interval_time(new_end),
+            resolution=self.resolution,
+            start_epoch=epochs[first],
+            utc_offset=self.utc_offset,
+            resolution_seconds=self.resolution_seconds,
+            positions=array('q', [self.positions[i] - shift for i in keep]),
+            values={name: array('d', [column[i] for i in keep])
+                    for name, column in self.values.items()},
+            categories=[self.categories[i] for i in keep] if self.categories is not None else None,
+        )
+
+    def to_numpy(self) -> Tuple[Any, Dict[str, Any]]:
+        """Return (positions, {field: values}) as zero-copy NumPy arrays."""
+        import numpy as np
+
+        positions = np.frombuffer(self.positions, dtype=np.int64)
+        values = {name: np.frombuffer(column, dtype=np.float64)
+                  for name, column in self.values.items()}
+        return positions, values
+
+
+@dataclass
+class ColumnarSeries:
+    """A TimeSeries: its metadata fields plus columnar periods."""
+
+    meta: Dict[str, Any]
+    periods: List[ColumnarPeriod] = field(default_factory=list)
+
+    @property
+    def total_points(self) -> int:
+        return sum(len(period) for period in self.periods)
+
+    def slice(self, start_epoch: int, end_epoch: int) -> Optional['ColumnarSeries']:
+        """The series restricted to [start_epoch, end_epoch), or None if empty."""
+        periods = [sliced for period in self.periods
+                   if (sliced := period.slice(start_epoch, end_epoch)) is not None]
+        if not periods:
+            return None
+        return ColumnarSeries(meta=self.meta, periods=periods)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = dict(self.meta)
+        result['periods'] = [period.to_dict() for period in self.periods]
+        result['totalPoints'] = self.total_points
+        return result
+
+
+@dataclass
+class ColumnarDocument:
+    """A parsed document (or merged set of documents) in columnar form."""
+
+    document_info: Dict[str, Any]
+    time_interval: Dict[str, str]
+    series: List[ColumnarSeries] = field(default_factory=list)
+    # True for Acknowledgement (no data) documents
+    no_data: bool = False
+    error: Optional[Dict[str, str]] = None
+    # Additional top-level keys, e.g. chunksWithData / isMerged for merged results
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def total_points(self) -> int:
+        return sum(ts.total_points for ts in self.series)
+
+    def slice(self, start_epoch: int, end_epoch: int) -> 'ColumnarDocument':
+        """The document restricted to points in [start_epoch, end_epoch)."""
+        start = parse_interval_time(self.time_interval.get('start', ''))
+        end = parse_interval_time(self.time_interval.get('end', ''))
+        time_interval = {
+            'start': format_interval_time(start_epoch if start is None else max(start, start_epoch)),
+            'end': format_interval_time(end_epoch if end is None else min(end, end_epoch)),
+        }
+        series = [sliced for ts in self.series
+                  if (sliced := ts.slice(start_epoch, end_epoch)) is not None]
+        return ColumnarDocument(
+            document_info=self.document_info,
+            time_interval=time_interval,
+            series=series,
+            no_data=self.no_data,
+            error=self.error,
+            extra=dict(self.extra),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict structure returned by ENTSOEXMLParser.to_dict()."""
+        result: Dict[str, Any] = {
+            'documentInfo': self.document_info,
+            'timeInterval': self.time_interval,
+        }
+
+        if self.no_data:
+            result['error'] = self.error
+            result['timeseries'] = []
+            result['timeseriesCount'] = 0
+            result.update(self.extra)
+            return result
+
+        result['timeseries'] = [ts.to_dict() for ts in self.series]
+        result['timeseriesCount'] = len(self.series)
+        result['totalDataPoints'] = self.total_points
+        result.update(self.extra)
+        if self.error is not None:
+            result['error'] = self.error
+        return result
@@ -0,0 +1,160 @@
+"""
+Coverage index: which time intervals are already stored per query.
+
+A query signature is the base URL plus the normalized request parameters
+without the period. For each signature the index lists the stored segments
+(half-open epoch-second intervals, one raw response file each). Valid
+segments never overlap, so the stored data can be merged without
+duplicates; segments whose data may still change expire like response
+cache entries and are then fetched again. An acknowledgement ("no matching
+data") is stored as a segment too, so the interval is not asked for again
+until it expires.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from entsoe_core.parse_cache import atomic_write_bytes
+from entsoe_core.payload import Payload
+from entsoe_core.response_cache import DEFAULT_SETTLEMENT_HORIZON, freshness_ttl, normalize_params
+
+# Parameters describing the requested window rather than the data set
+PERIOD_PARAMS = {"periodStart", "periodEnd", "offset"}
+
+INDEX_FILE = "index.json"
+
+Interval = Tuple[int, int]
+
+# Shared by all instances: several configs may point at the same index file
+_index_lock = threading.Lock()
+
+
+def subtract_intervals(start: int, end: int, covered: List[Interval]) -> List[Interval]:
+    """Parts of [start, end) not covered by any interval in covered."""
+    gaps = []
+    cursor = start
+    for seg_start, seg_end in sorted(covered):
+        if seg_end <= cursor:
+            continue
+        if seg_start >= end:
+            break
+        if seg_start > cursor:
+            gaps.append((cursor, seg_start))
+        cursor = max(cursor, seg_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class CoverageIndex:
+    """Stored response segments per query signature, persisted as JSON."""
+
+    def __init__(
+        self,
+        directory: Path,
+        settlement_horizon: timedelta = DEFAULT_SETTLEMENT_HORIZON,
+    ) -> None:
+        self.directory = Path(directory)
+        self.settlement_horizon = settlement_horizon
+
+    def signature(self, base_url: str, params: Dict[str, Any]) -> str:
+        query = {k: v for k, v in normalize_params(params).items() if k not in PERIOD_PARAMS}
+        payload = json.dumps([base_url, query], separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            return json.loads((self.directory / INDEX_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, index: Dict[str, Any]) -> None:
+        atomic_write_bytes(self.directory / INDEX_FILE, json.dumps(index, indent=1).encode("utf-8"))
+
+    def segments(self, signature: str) -> List[Dict[str, Any]]:
+        """Unexpired segments of a signature whose files still exist, sorted by start."""
+        now = time.time()
+        with _index_lock:
+            entry = self._load().get(signature, {})
+        valid = []
+        for segment in entry.get("segments", []):
+            expires_at = segment.get("expires_at")
+            if expires_at is not None and expires_at <= now:
+                continue
+            if not (self.directory / segment["file"]).exists():
+                continue
+            valid.append(segment)
+        return sorted(valid, key=lambda s: s["start"])
+
+    def gaps(self, signature: str, start: int, end: int) -> List[Interval]:
+        """Sub-intervals of [start, end) that still have to be fetched."""
+        covered = [(s["start"], s["end"]) for s in self.segments(signature)]
+        return subtract_intervals(start, end, covered)
+
+    def add(
+        self,
+        signature: str,
+        params: Dict[str, Any],
+        start: int,
+        end: int,
+        payload: Payload,
+        complete: bool = True,
+        status_code: int = 200,
+        max_ttl: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Store the response for [start, end) and record it in the index.
+
+        Segments overlapping the new one (only expired ones can) are dropped,
+        so the valid segments stay disjoint. An incomplete response (truncated
+        paging) expires as soon as data for a recent period would; max_ttl
+        caps the lifetime further (e.g. for acknowledgements).
+        """
+        relative = f"{signature}/{start}_{end}.xml"
+        payload.save_to(self.directory / relative)
+
+        ttl = freshness_ttl(
+            datetime.fromtimestamp(end, timezone.utc) if complete else None,
+            self.settlement_horizon,
+        )
+        if max_ttl is not None:
+            ttl = max_ttl if ttl is None else min(ttl, max_ttl)
+        now = time.time()
+        segment = {
+            "start": start,
+            "end": end,
+            "file": relative,
+            "status_code": status_code,
+            "fetched_at": now,
+            "expires_at": None if ttl is None else now + ttl,
+        }
+
+        with _index_lock:
+            index = self._load()
+            entry = index.setdefault(
+                signature,
+                {"params": {k: v for k, v in normalize_params(params).items() if k not in PERIOD_PARAMS}},
+            )
+            kept = []
+            for existing in entry.get("segments", []):
+                if existing["start"] < end and start < existing["end"]:
+                    if existing["file"] != relative:
+                        (self.directory / existing["file"]).unlink(missing_ok=True)
+                    continue
+                kept.append(existing)
+            kept.append(segment)
+            entry["segments"] = sorted(kept, key=lambda s: s["start"])
+            self._save(index)
+        return segment
+
+    def path(self, segment: Dict[str, Any]) -> Path:
+        return self.directory / segment["file"]
@@ -0,0 +1,102 @@
+"""
+Negative cache of queries the API answered with "no matching data".
+
+ENTSO-E answers a query without data with an Acknowledgement_MarketDocument,
+e.g. for a production type a country does not have. Such answers are
+remembered by the normalized request parameters together with their reason
+code and text, so asking the same query again returns the reason without an
+API call. Entries expire after a fixed TTL, or sooner for periods whose data
+may still be published (the response cache's finality TTLs).
+
+Errors come as acknowledgements too (an invalid query, too much data
+requested); only the "no matching data" reason is cacheable, see
+is_no_data_reason.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from entsoe_core.parse_cache import LruBudget, atomic_write_bytes, shared_budget
+from entsoe_core.response_cache import (
+    DEFAULT_SETTLEMENT_HORIZON,
+    _period_end,
+    freshness_ttl,
+    normalize_params,
+)
+
+CACHE_SUFFIX = ".ack"
+DEFAULT_NEGATIVE_TTL = 24 * 60 * 60
+DEFAULT_MAX_NEGATIVE_BYTES = 16 * 1024 * 1024
+# Start of the acknowledgement reason text for a valid query without data
+NO_MATCHING_DATA = "No matching data found"
+
+
+def is_no_data_reason(reason: Optional[Dict[str, str]]) -> bool:
+    """Whether an acknowledgement reason says the query matched no data (rather than an error)."""
+    return bool(reason) and reason.get("text", "").lower().startswith(NO_MATCHING_DATA.lower())
+
+
+class NegativeCache:
+    """Size-bounded cache of acknowledgement reasons per query."""
+
+    def __init__(
+        self,
+        directory: Path,
+        ttl: float = DEFAULT_NEGATIVE_TTL,
+        settlement_horizon: timedelta = DEFAULT_SETTLEMENT_HORIZON,
+        max_bytes: Optional[int] = DEFAULT_MAX_NEGATIVE_BYTES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.settlement_horizon = settlement_horizon
+        self.max_bytes = max_bytes
+
+    @property
+    def _budget(self) -> LruBudget:
+        return shared_budget(self.directory, f"*/*{CACHE_SUFFIX}", self.max_bytes)
+
+    def _path(self, base_url: str, params: Dict[str, Any]) -> Path:
+        payload = json.dumps([base_url, normalize_params(params)], separators=(",", ":"))
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return self.directory / key[:2] / f"{key}{CACHE_SUFFIX}"
+
+    def entry_ttl(self, params: Dict[str, Any]) -> float:
+        """Seconds an acknowledgement for params is trusted."""
+        finality = freshness_ttl(_period_end(params), self.settlement_horizon)
+        return self.ttl if finality is None else min(self.ttl, finality)
+
+    def get(self, base_url: str, params: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """The cached reason ({"code", "text"}) for the query, or None."""
+        path = self._path(base_url, params)
+        try:
+            entry = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if entry.get("expires_at", 0) <= time.time():
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("reason")
+
+    def put(self, base_url: str, params: Dict[str, Any], reason: Optional[Dict[str, str]]) -> None:
+        """Remember that the query was answered with an acknowledgement."""
+        reason = reason or {}
+        now = time.time()
+        entry = {
+            "params": normalize_params(params),
+            "reason": {"code": reason.get("code", ""), "text": reason.get("text", "")},
+            "stored_at": now,
+            "expires_at": now + self.entry_ttl(params),
+        }
+        data = json.dumps(entry).encode("utf-8")
+        atomic_write_bytes(self._path(base_url, params), data)
+        self._budget.add(len(data))
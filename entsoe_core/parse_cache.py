@@ -0,0 +1,310 @@
+"""
+Content-addressed cache of parsed ENTSO-E documents.
+
+Entries are keyed by a hash of the raw XML/ZIP payload plus the parser
+version, so an unchanged response is never parsed twice. Documents are
+stored in a compact binary form: a JSON header describing the series and
+periods followed by the raw int64/float64 array buffers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from entsoe_core.columnar import ColumnarDocument, ColumnarPeriod, ColumnarSeries
+
+CACHE_MAGIC = b"ENTSOEPC"
+CACHE_FORMAT_VERSION = 1
+CACHE_SUFFIX = ".bin"
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024
+# Fraction of the budget an over-full cache is pruned down to, so the next
+# puts do not trigger another scan straight away
+PRUNE_LOW_WATER = 0.9
+
+
+def encode_document(doc: ColumnarDocument) -> bytes:
+    """Serialize a ColumnarDocument to bytes."""
+    buffers: List[bytes] = []
+    series_headers = []
+    for ts in doc.series:
+        period_headers = []
+        for period in ts.periods:
+            fields = list(period.values)
+            period_headers.append(
+                {
+                    "start": period.start,
+                    "end": period.end,
+                    "resolution": period.resolution,
+                    "start_epoch": period.start_epoch,
+                    "utc_offset": period.utc_offset,
+                    "resolution_seconds": period.resolution_seconds,
+                    "count": len(period.positions),
+                    "fields": fields,
+                    "categories": period.categories,
+                }
+            )
+            buffers.append(period.positions.tobytes())
+            buffers.extend(period.values[name].tobytes() for name in fields)
+        series_headers.append({"meta": ts.meta, "periods": period_headers})
+
+    header = json.dumps(
+        {
+            "byteorder": sys.byteorder,
+            "document_info": doc.document_info,
+            "time_interval": doc.time_interval,
+            "no_data": doc.no_data,
+            "error": doc.error,
+            "extra": doc.extra,
+            "series": series_headers,
+        },
+        default=str,
+    ).encode("utf-8")
+
+    return b"".join(
+        [CACHE_MAGIC, struct.pack("<HI", CACHE_FORMAT_VERSION, len(header)), header, *buffers]
+    )
+
+
+def decode_document(data: bytes) -> ColumnarDocument:
+    """Deserialize bytes produced by encode_document."""
+    if data[: len(CACHE_MAGIC)] != CACHE_MAGIC:
+        raise ValueError("Not a parse cache entry")
+    offset = len(CACHE_MAGIC)
+    version, header_len = struct.unpack_from("<HI", data, offset)
+    if version != CACHE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported parse cache format: {version}")
+    offset += struct.calcsize("<HI")
+    header = json.loads(data[offset : offset + header_len].decode("utf-8"))
+    offset += header_len
+    swap = header["byteorder"] != sys.byteorder
+
+    view = memoryview(data)
+
+    def take(typecode: str, count: int) -> array:
+        nonlocal offset
+        column = array(typecode)
+        size = column.itemsize * count
+        column.frombytes(view[offset : offset + size])
+        offset += size
+        if swap:
+            column.byteswap()
+        return column
+
+    series = []
+    for ts_header in header["series"]:
+        periods = []
+        for p in ts_header["periods"]:
+            period = ColumnarPeriod(
+                start=p["start"],
+                end=p["end"],
+                resolution=p["resolution"],
+                start_epoch=p["start_epoch"],
+                utc_offset=p["utc_offset"],
+                resolution_seconds=p["resolution_seconds"],
+                categories=p["categories"],
+            )
+            period.positions = take("q", p["count"])
+            for name in p["fields"]:
+                period.values[name] = take("d", p["count"])
+            periods.append(period)
+        series.append(ColumnarSeries(meta=ts_header["meta"], periods=periods))
+
+    return ColumnarDocument(
+        document_info=header["document_info"],
+        time_interval=header["time_interval"],
+        series=series,
+        no_data=header["no_data"],
+        error=header["error"],
+        extra=header["extra"],
+    )
+
+
+class ParseCache:
+    """On-disk cache of ColumnarDocuments keyed by payload hash; read_only skips puts."""
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: Optional[int] = DEFAULT_MAX_CACHE_BYTES,
+        read_only: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.read_only = read_only
+
+    @property
+    def _budget(self) -> LruBudget:
+        return shared_budget(self.directory, f"*/*{CACHE_SUFFIX}", self.max_bytes)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[ColumnarDocument]:
+        """Return the cached document for key, or None."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            doc = decode_document(data)
+        except (ValueError, KeyError, struct.error):
+            path.unlink(missing_ok=True)
+            return None
+        # Refresh the entry for LRU pruning
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return doc
+
+    def put(self, key: str, doc: ColumnarDocument) -> None:
+        """Store a document under key (atomically)."""
+        if self.read_only:
+            return
+        data = encode_document(doc)
+        atomic_write_bytes(self._path(key), data)
+        self._budget.add(len(data))
+
+    def prune(self, max_bytes: int) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        self._budget.prune(max_bytes)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path via a temporary file, so readers never see partial files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file_handle:
+            file_handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def prune_lru(
+    directory: Path, pattern: str, max_bytes: int, companions: Tuple[str, ...] = ()
+) -> int:
+    """
+    Delete the least recently used files matching pattern until they fit in max_bytes.
+
+    Sibling files with the same stem and one of the companions suffixes (e.g.
+    an entry's metadata) are deleted along with each file. Returns the bytes
+    left.
+    """
+    entries: List[Dict[str, Any]] = []
+    total = 0
+    for path in Path(directory).glob(pattern):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append({"path": path, "size": stat.st_size, "mtime": stat.st_mtime})
+        total += stat.st_size
+
+    if total <= max_bytes:
+        return total
+
+    for entry in sorted(entries, key=lambda e: e["mtime"]):
+        entry["path"].unlink(missing_ok=True)
+        for suffix in companions:
+            entry["path"].with_suffix(suffix).unlink(missing_ok=True)
+        total -= entry["size"]
+        if total <= max_bytes:
+            break
+    return total
+
+
+class LruBudget:
+    """
+    Running size total of a cache directory, pruned only when over budget.
+
+    The directory is measured once; after that each store just adds its size,
+    so a put costs no directory scan until max_bytes is exceeded. Pruning
+    rescans (other processes may write to the same directory) and evicts down
+    to PRUNE_LOW_WATER of the budget. Companion files (see prune_lru) are
+    evicted with their entries.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        pattern: str,
+        max_bytes: Optional[int],
+        companions: Tuple[str, ...] = (),
+    ) -> None:
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.max_bytes = max_bytes
+        self.companions = companions
+        self._total: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def add(self, size: int) -> None:
+        """Account for a file of size bytes just stored in the directory."""
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            if self._total is None:
+                # The first scan already sees the new file
+                self._total = _directory_size(self.directory, self.pattern)
+            else:
+                self._total += size
+            if self._total > self.max_bytes:
+                self._total = prune_lru(
+                    self.directory,
+                    self.pattern,
+                    int(self.max_bytes * PRUNE_LOW_WATER),
+                    self.companions,
+                )
+
+    def prune(self, max_bytes: int) -> None:
+        """Evict down to max_bytes now."""
+        with self._lock:
+            self._total = prune_lru(self.directory, self.pattern, max_bytes, self.companions)
+
+
+_budgets: Dict[Tuple[Path, str], LruBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def shared_budget(
+    directory: Path,
+    pattern: str,
+    max_bytes: Optional[int],
+    companions: Tuple[str, ...] = (),
+) -> LruBudget:
+    """
+    Process-wide budget for a cache directory.
+
+    Caches are constructed per config, so the running total lives here and is
+    measured once per process rather than once per cache object.
+    """
+    key = (Path(directory).resolve(), pattern)
+    with _budgets_lock:
+        budget = _budgets.get(key)
+        if budget is None:
+            budget = LruBudget(directory, pattern, max_bytes, companions)
+            _budgets[key] = budget
+        budget.max_bytes = max_bytes
+        return budget
+
+
+def _directory_size(directory: Path, pattern: str) -> int:
+    total = 0
+    for path in Path(directory).glob(pattern):
+        try:
+            total += path.stat().st_size
+        except OSError:
+            continue
+    return total
@@ -10,24 +10,218 @@ Supports both raw XML and ZIP-compressed responses (API returns ZIP for large re
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 import json
+import hashlib
 import csv
 import zipfile
+import heapq
 import io
-from typing import Dict, List, Any, Optional
+import itertools
+import multiprocessing
+import os
+import shutil
+import threading
+from array import array
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Dict, Iterator, List, Any, Optional, Union
 from pathlib import Path
 
+from entsoe_core.columnar import (
+    MISSING,
+    ColumnarDocument,
+    ColumnarPeriod,
+    ColumnarSeries,
+    epoch_from_datetime,
+    format_epoch,
+)
+from entsoe_core.parse_cache import ParseCache
+
+# Bump whenever the parsed output changes, so cached parses are invalidated
+PARSER_VERSION = '3'
+
+# Members per worker process below which a ZIP archive is parsed in-process
+ZIP_MEMBERS_PER_WORKER = 32
+
+# A response file path, or a seekable binary stream over a response held in memory
+XmlSource = Union[str, BinaryIO]
+
+# Size of the process pool shared by every parse in this process
+PARSE_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+# Responses smaller than this are parsed in the calling thread: sending the
+# parsed arrays back from a worker process costs more than parsing them
+PROCESS_PARSE_MIN_BYTES = 1024 * 1024
+
+
+# =============================================================================
+# PROCESS POOL
+# =============================================================================
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+# Set in pool workers, so parses running there never start a pool of their own
+_in_pool_worker = False
+
+
+def _mark_pool_worker() -> None:
+    global _in_pool_worker
+    _in_pool_worker = True
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    The parse process pool shared by all callers, created on first use.
+    
+    Workers are started with the "spawn" method: forking a process that
+    runs fetch and writer threads can copy locks in a held state. Returns
+    None inside a pool worker (parse there in-process instead of nesting
+    pools).
+    
+    Returns:
+        The shared ProcessPoolExecutor with PARSE_POOL_SIZE workers, or None
+    """
+    global _process_pool
+    if _in_pool_worker:
+        return None
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=PARSE_POOL_SIZE,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_mark_pool_worker,
+            )
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool, so the next get_process_pool() starts a new one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def submit_to_pool(func: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run func(*args) in the shared process pool.
+    
+    A pool broken by a dead worker (OOM kill, missing __main__ guard) is
+    discarded and the call submitted once more to a new pool; a task lost
+    with its pool is run in the calling process instead. Inside a pool
+    worker the call runs right away.
+    
+    Args:
+        func: Picklable module-level function
+        *args: Picklable arguments
+        
+    Returns:
+        Future resolving to the result
+    """
+    pool = get_process_pool()
+    if pool is None:
+        return _run_now(func, *args)
+    try:
+        future = pool.submit(func, *args)
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+        pool = get_process_pool()
+        future = pool.submit(func, *args)
+    
+    outcome: Future = Future()
+    
+    def settle(done: Future) -> None:
+        try:
+            outcome.set_result(done.result())
+        except BrokenProcessPool:
+            _discard_process_pool(pool)
+            try:
+                outcome.set_result(func(*args))
+            except Exception as exc:
+                outcome.set_exception(exc)
+        except BaseException as exc:
+            outcome.set_exception(exc)
+    
+    future.add_done_callback(settle)
+    return outcome
+
+
+def _run_now(func: Callable[..., Any], *args: Any) -> Future:
+    future: Future = Future()
+    try:
+        future.set_result(func(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+class SharedProcessPool(Executor):
+    """Executor view of the shared parse pool, e.g. to wrap in a BoundedExecutor."""
+    
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        return submit_to_pool(fn, *args)
+
+
+def parse_in_pool(file_path: XmlSource, size: int,
+                  cache: Optional[ParseCache] = None,
+                  content_sha256: Optional[str] = None,
+                  submit: Optional[Callable[..., Future]] = None) -> Future:
+    """
+    Parse a response file in the shared process pool, or right away if small.
+    
+    Args:
+        file_path: Path to the XML or ZIP file; in-memory streams are always
+            parsed in the calling thread
+        size: Size of the file in bytes; below PROCESS_PARSE_MIN_BYTES it is
+            parsed in the calling thread
+        cache: Optional ParseCache
+        content_sha256: SHA-256 of the file if already known
+        submit: Submit function to use instead of submit_to_pool (e.g. of a
+            BoundedExecutor wrapping SharedProcessPool())
+        
+    Returns:
+        Future resolving to the ColumnarDocument
+    """
+    if size >= PROCESS_PARSE_MIN_BYTES and not _in_pool_worker and isinstance(file_path, str):
+        return (submit or submit_to_pool)(
+            parse_entsoe_columnar, file_path, True, cache, 1, content_sha256
+        )
+    return _run_now(parse_entsoe_columnar, file_path, True, cache, 1, content_sha256)
+
 
 # =============================================================================
 # ZIP HANDLING
 # =============================================================================
 
+@contextmanager
+def open_source(source: XmlSource) -> Iterator[BinaryIO]:
+    """Open a response file, or rewind an in-memory stream (which stays open).
+    
+    Args:
+        source: Path to the XML or ZIP file, or a seekable binary stream
+        
+    Yields:
+        Binary file object positioned at the start of the response
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield f
+    else:
+        source.seek(0)
+        yield source
+
+
 def is_zip_content(content: bytes) -> bool:
     """Check if content is a ZIP file (starts with PK magic bytes)."""
     return content[:2] == b'PK'
 
 
 def extract_xml_from_zip(zip_content: bytes) -> str:
-    """Extract XML content from a ZIP file.
+    """Extract the first XML document from a ZIP file.
+    
+    Archives with several documents are parsed completely by
+    parse_entsoe_columnar; this helper only returns the first one.
     
     Args:
         zip_content: Raw bytes of the ZIP file
@@ -50,16 +244,65 @@ def extract_xml_from_zip(zip_content: bytes) -> str:
             return xml_file.read().decode('utf-8')
 
 
-def read_xml_or_zip(file_path: str) -> str:
+def count_documents(file_path: XmlSource) -> int:
+    """Count the market documents in an API response file.
+
+    A ZIP archive holds one document per XML member; a plain XML response is a
+    single document, or none if it is an acknowledgement (no matching data).
+
+    Args:
+        file_path: Path to the XML or ZIP file, or an in-memory stream
+
+    Returns:
+        Number of documents in the response
+    """
+    with open_source(file_path) as f:
+        head = f.read(4096)
+        if not is_zip_content(head):
+            return 0 if b'Acknowledgement_MarketDocument' in head else 1
+        f.seek(0)
+        with zipfile.ZipFile(f) as zf:
+            return sum(1 for name in zf.namelist() if name.endswith('.xml'))
+
+
+def merge_zip_files(file_paths: List[XmlSource], output: BinaryIO) -> None:
+    """Merge several responses (pages of one query) into a single ZIP archive.
+
+    Members are streamed from each input to the output one at a time and
+    prefixed with their page number so names never collide; plain XML
+    responses become one member each.
+
+    Args:
+        file_paths: Response files (or in-memory streams), ZIP or XML, in page order
+        output: Writable binary stream receiving the archive (need not be seekable)
+    """
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as merged:
+        for page, file_path in enumerate(file_paths):
+            with open_source(file_path) as f:
+                if not is_zip_content(f.read(2)):
+                    f.seek(0)
+                    with merged.open(f'page{page:03d}.xml', 'w') as member:
+                        shutil.copyfileobj(f, member)
+                    continue
+                f.seek(0)
+                with zipfile.ZipFile(f) as zf:
+                    for name in zf.namelist():
+                        if name.endswith('.xml'):
+                            with zf.open(name) as source, \
+                                    merged.open(f'page{page:03d}_{name}', 'w') as member:
+                                shutil.copyfileobj(source, member)
+
+
+def read_xml_or_zip(file_path: XmlSource) -> str:
     """Read XML content from a file, handling both raw XML and ZIP files.
     
     Args:
-        file_path: Path to the XML or ZIP file
+        file_path: Path to the XML or ZIP file, or an in-memory stream
         
     Returns:
         XML content as string
     """
-    with open(file_path, 'rb') as f:
+    with open_source(file_path) as f:
         content = f.read()
     
     if is_zip_content(content):
@@ -68,6 +311,36 @@ def read_xml_or_zip(file_path: str) -> str:
         return content.decode('utf-8')
 
 
+@contextmanager
+def open_xml_or_zip(file_path: XmlSource) -> Iterator[BinaryIO]:
+    """Open an XML or ZIP file as a binary stream of XML bytes.
+    
+    Unlike read_xml_or_zip, nothing is read or decoded up front: raw XML files
+    are returned as-is and ZIP archives yield a decompressing stream over the
+    first XML member.
+    
+    Args:
+        file_path: Path to the XML or ZIP file, or an in-memory stream
+        
+    Yields:
+        Binary file object positioned at the start of the XML document
+    """
+    with open_source(file_path) as f:
+        is_zip = is_zip_content(f.read(2))
+        f.seek(0)
+        
+        if not is_zip:
+            yield f
+            return
+        
+        with zipfile.ZipFile(f) as zf:
+            xml_files = [name for name in zf.namelist() if name.endswith('.xml')]
+            if not xml_files:
+                raise ValueError("No XML file found in ZIP archive")
+            with zf.open(xml_files[0]) as xml_file:
+                yield xml_file
+
+
 # =============================================================================
 # PSR TYPE NAMES (for CSV column naming)
 # =============================================================================
@@ -119,8 +392,22 @@ class ENTSOEXMLParser:
         'PT60M': timedelta(hours=1),
         'P1D': timedelta(days=1),
         'P7D': timedelta(days=7),
-        'P1M': timedelta(days=30),  # Approximate
-        'P1Y': timedelta(days=365),  # Approximate
+        # Nominal only: timestamps for calendar resolutions are stepped in
+        # months (see columnar.CALENDAR_RESOLUTION_MONTHS)
+        'P1M': timedelta(days=30),
+        'P1Y': timedelta(days=365),
+    }
+    
+    # Point child element -> output field name
+    POINT_FIELDS = {
+        'position': 'position',
+        'quantity': 'quantity',
+        'price.amount': 'price',
+        'imbalance_Price.amount': 'imbalancePrice',
+        'imbalance_Price.category': 'imbalancePriceCategory',
+        'secondaryQuantity': 'secondaryQuantity',
+        'unavailable_Quantity.quantity': 'unavailableQuantity',
+        'activation_Price.amount': 'activationPrice',
     }
     
     def __init__(self, xml_content: str):
@@ -208,7 +495,7 @@ class ENTSOEXMLParser:
         """Convert resolution string to timedelta."""
         return self.RESOLUTION_MAP.get(resolution, timedelta(hours=1))
     
-    def _parse_timeseries(self, ts: ET.Element) -> Dict[str, Any]:
+    def _parse_timeseries(self, ts: ET.Element) -> ColumnarSeries:
         """Parse a single TimeSeries element."""
         timeseries = {
             'mRID': self._get_text(ts, 'mRID'),
@@ -250,92 +537,86 @@ class ENTSOEXMLParser:
             timeseries['currency'] = currency
         
         # Parse periods and points
-        timeseries['periods'] = []
-        for period in self._findall(ts, 'Period'):
-            period_data = self._parse_period(period)
-            timeseries['periods'].append(period_data)
-        
-        # Calculate total points
-        total_points = sum(len(p['points']) for p in timeseries['periods'])
-        timeseries['totalPoints'] = total_points
+        periods = [self._parse_period(period) for period in self._findall(ts, 'Period')]
         
-        return timeseries
+        return ColumnarSeries(meta=timeseries, periods=periods)
     
-    def _parse_period(self, period: ET.Element) -> Dict[str, Any]:
-        """Parse a Period element."""
+    def _parse_period(self, period: ET.Element) -> ColumnarPeriod:
+        """Parse a Period element into columnar arrays."""
         interval = self._find(period, 'timeInterval')
         
-        period_data = {
-            'start': self._get_text(interval, 'start') if interval else '',
-            'end': self._get_text(interval, 'end') if interval else '',
-            'resolution': self._get_text(period, 'resolution'),
-            'points': []
-        }
+        start = self._get_text(interval, 'start') if interval else ''
+        resolution = self._get_text(period, 'resolution')
         
-        # Parse resolution for timestamp calculation
-        resolution = self._parse_resolution(period_data['resolution'])
-        start_time = None
-        if period_data['start']:
+        # Parse start for timestamp calculation
+        start_epoch = None
+        utc_offset = None
+        if start:
             try:
-                start_str = period_data['start'].replace('Z', '+00:00')
-                start_time = datetime.fromisoformat(start_str)
+                start_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
+                start_epoch, utc_offset = epoch_from_datetime(start_time)
             except ValueError:
                 pass
         
-        # Parse points
-        for point in self._findall(period, 'Point'):
-            point_data = self._parse_point(point, start_time, resolution)
-            period_data['points'].append(point_data)
-        
-        return period_data
-    
-    def _parse_point(self, point: ET.Element, start_time: Optional[datetime], 
-                     resolution: timedelta) -> Dict[str, Any]:
-        """Parse a Point element."""
-        position = int(self._get_text(point, 'position', '0'))
-        
-        point_data = {'position': position}
-        
-        # Calculate timestamp if possible
-        if start_time:
-            timestamp = start_time + resolution * (position - 1)
-            point_data['timestamp'] = timestamp.isoformat()
-        
-        # Value fields (different for different data types)
-        quantity = self._get_text(point, 'quantity')
-        if quantity:
-            point_data['quantity'] = float(quantity)
-        
-        price = self._get_text(point, 'price.amount')
-        if price:
-            point_data['price'] = float(price)
+        columnar = ColumnarPeriod(
+            start=start,
+            end=self._get_text(interval, 'end') if interval else '',
+            resolution=resolution,
+            start_epoch=start_epoch,
+            utc_offset=utc_offset,
+            resolution_seconds=int(self._parse_resolution(resolution).total_seconds()),
+        )
         
-        # Imbalance price (for balancing documents)
-        imbalance_price = self._get_text(point, 'imbalance_Price.amount')
-        if imbalance_price:
-            point_data['imbalancePrice'] = float(imbalance_price)
+        positions = columnar.positions
+        values = columnar.values
+        categories = None
+        field_tags = self._point_field_tags()
         
-        # Imbalance price category
-        imbalance_category = self._get_text(point, 'imbalance_Price.category')
-        if imbalance_category:
-            point_data['imbalancePriceCategory'] = imbalance_category
-        
-        # Secondary quantity (for bids)
-        secondary = self._get_text(point, 'secondaryQuantity')
-        if secondary:
-            point_data['secondaryQuantity'] = float(secondary)
-        
-        # Unavailable quantity
-        unavailable = self._get_text(point, 'unavailable_Quantity.quantity')
-        if unavailable:
-            point_data['unavailableQuantity'] = float(unavailable)
+        for index, point in enumerate(self._findall(period, 'Point')):
+            # Single pass over the Point's children; first occurrence wins
+            found = {}
+            for child in point:
+                name = field_tags.get(child.tag)
+                if name is not None and name not in found:
+                    found[name] = child.text
+            
+            position = found.pop('position', None)
+            positions.append(int(position) if position else 0)
+            
+            category = found.pop('imbalancePriceCategory', None)
+            if category:
+                if categories is None:
+                    categories = [''] * index
+                categories.append(category)
+            elif categories is not None:
+                categories.append('')
+            
+            for name, text in found.items():
+                if not text:
+                    continue
+                column = values.get(name)
+                if column is None:
+                    column = values[name] = array('d', [MISSING]) * index
+                column.append(float(text))
+            
+            # Pad the columns this point has no value for
+            for column in values.values():
+                if len(column) == index:
+                    column.append(MISSING)
         
-        # Activation price (for activated balancing energy)
-        activation_price = self._get_text(point, 'activation_Price.amount')
-        if activation_price:
-            point_data['activationPrice'] = float(activation_price)
+        columnar.categories = categories
+        return columnar
+    
+    def _point_field_tags(self) -> Dict[str, str]:
+        """Map Point child tags (with and without namespace) to output field names."""
+        cache = getattr(self, '_field_tags_cache', None)
+        if cache is not None and cache[0] == self.ns:
+            return cache[1]
         
-        return point_data
+        tags = dict(self.POINT_FIELDS)
+        tags.update({f'{self.ns}{path}': name for path, name in self.POINT_FIELDS.items()})
+        self._field_tags_cache = (self.ns, tags)
+        return tags
     
     def _get_timeseries_signature(self, ts: Dict[str, Any]) -> str:
         """
@@ -354,7 +635,7 @@ class ENTSOEXMLParser:
                 parts.append(f"{field}={ts[field]}")
         return "|".join(sorted(parts))
     
-    def _merge_consecutive_timeseries(self, timeseries_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _merge_consecutive_timeseries(self, timeseries_list: List[ColumnarSeries]) -> List[ColumnarSeries]:
         """
         Merge timeseries that have the same metadata but consecutive time periods.
         This handles the common case where API returns one timeseries per day.
@@ -365,7 +646,7 @@ class ENTSOEXMLParser:
         # Group by signature
         groups = {}
         for ts in timeseries_list:
-            sig = self._get_timeseries_signature(ts)
+            sig = self._get_timeseries_signature(ts.meta)
             if sig not in groups:
                 groups[sig] = []
             groups[sig].append(ts)
@@ -380,8 +661,8 @@ class ENTSOEXMLParser:
             
             # Sort by the start time of their first period
             def get_start_time(ts):
-                if ts.get('periods') and len(ts['periods']) > 0:
-                    start_str = ts['periods'][0].get('start', '')
+                if ts.periods:
+                    start_str = ts.periods[0].start
                     if start_str:
                         try:
                             return datetime.fromisoformat(start_str.replace('Z', '+00:00'))
@@ -392,67 +673,213 @@ class ENTSOEXMLParser:
             ts_group_sorted = sorted(ts_group, key=get_start_time)
             
             # Merge all into the first one
-            merged_ts = ts_group_sorted[0].copy()
-            merged_ts['periods'] = list(ts_group_sorted[0].get('periods', []))
+            merged_ts = ColumnarSeries(
+                meta=dict(ts_group_sorted[0].meta),
+                periods=list(ts_group_sorted[0].periods),
+            )
             
             for ts in ts_group_sorted[1:]:
                 # Add periods from this timeseries
-                merged_ts['periods'].extend(ts.get('periods', []))
-            
-            # Recalculate total points
-            merged_ts['totalPoints'] = sum(len(p.get('points', [])) for p in merged_ts['periods'])
+                merged_ts.periods.extend(ts.periods)
             
             # Update mRID to indicate merged
-            merged_ts['mRID'] = f"merged_{len(ts_group)}_series"
+            merged_ts.meta['mRID'] = f"merged_{len(ts_group)}_series"
             
             merged_list.append(merged_ts)
         
         return merged_list
     
-    def extract_all_timeseries(self) -> List[Dict[str, Any]]:
-        """Extract all TimeSeries from the document, merging consecutive ones."""
+    def _extract_series(self) -> List[ColumnarSeries]:
+        """Extract all TimeSeries in columnar form, merging consecutive ones."""
         if self.is_no_data_response():
             return []
         
         timeseries_list = []
         for ts in self._findall(self.root, 'TimeSeries'):
-            ts_data = self._parse_timeseries(ts)
-            timeseries_list.append(ts_data)
+            timeseries_list.append(self._parse_timeseries(ts))
         
         # Merge consecutive timeseries with same metadata
-        merged_list = self._merge_consecutive_timeseries(timeseries_list)
-        
-        return merged_list
+        return self._merge_consecutive_timeseries(timeseries_list)
+    
+    def extract_all_timeseries(self) -> List[Dict[str, Any]]:
+        """Extract all TimeSeries from the document, merging consecutive ones."""
+        return [ts.to_dict() for ts in self._extract_series()]
+    
+    def to_columnar(self) -> ColumnarDocument:
+        """Convert parsed data to a ColumnarDocument."""
+        no_data = self.is_no_data_response()
+        return ColumnarDocument(
+            document_info=self.get_document_info(),
+            time_interval=self.get_time_interval(),
+            series=self._extract_series(),
+            no_data=no_data,
+            error=self.get_error_reason() if no_data else None,
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert parsed data to dictionary."""
-        result = {
-            'documentInfo': self.get_document_info(),
-            'timeInterval': self.get_time_interval(),
-        }
-        
-        if self.is_no_data_response():
-            result['error'] = self.get_error_reason()
-            result['timeseries'] = []
-            result['timeseriesCount'] = 0
-        else:
-            result['timeseries'] = self.extract_all_timeseries()
-            result['timeseriesCount'] = len(result['timeseries'])
-            
-            # Calculate total data points
-            total_points = sum(
-                ts.get('totalPoints', 0) for ts in result['timeseries']
-            )
-            result['totalDataPoints'] = total_points
-        
-        return result
+        return self.to_columnar().to_dict()
     
     def to_json(self, indent: int = 2) -> str:
         """Convert parsed data to JSON string."""
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
 
-def parse_entsoe_xml(xml_file_path: str, json_output_path: str = None) -> Dict[str, Any]:
+class ENTSOEStreamingParser(ENTSOEXMLParser):
+    """
+    Incremental parser for large ENTSO-E documents.
+    
+    Walks the document with iterparse and converts each TimeSeries as soon as
+    its closing tag is read, then clears the element. Peak memory for the XML
+    tree is therefore about one TimeSeries instead of the whole document.
+    The to_dict() output is identical to ENTSOEXMLParser.
+    """
+    
+    def __init__(self, source: Union[str, BinaryIO]):
+        """Initialize parser from a file path or binary file object."""
+        self.xml_content = None
+        self.ns = ''
+        self._timeseries = []
+        
+        context = ET.iterparse(source, events=('end',))
+        for _, elem in context:
+            tag = elem.tag
+            if tag != 'TimeSeries' and not tag.endswith('}TimeSeries'):
+                continue
+            if '{' in tag:
+                self.ns = tag.split('}')[0] + '}'
+            self._timeseries.append(self._parse_timeseries(elem))
+            # Drop the consumed subtree; only an empty shell stays on the root
+            elem.clear()
+        
+        self.root = context.root
+        self.ns = self._detect_namespace()
+    
+    def _extract_series(self) -> List[ColumnarSeries]:
+        """Return the TimeSeries collected during parsing, merging consecutive ones."""
+        if self.is_no_data_response():
+            return []
+        return self._merge_consecutive_timeseries(self._timeseries)
+
+
+def parse_cache_key(file_path: XmlSource, content_sha256: Optional[str] = None) -> str:
+    """
+    Content-addressed cache key for a raw XML or ZIP payload.
+    
+    Args:
+        file_path: Path to the XML file (or ZIP file containing XML)
+        content_sha256: SHA-256 hex digest of the file if already known
+            (e.g. computed while downloading), so the file is not read again
+        
+    Returns:
+        Hex digest of the file's SHA-256 combined with PARSER_VERSION
+    """
+    if content_sha256 is None:
+        digest = hashlib.sha256()
+        with open_source(file_path) as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        content_sha256 = digest.hexdigest()
+    return hashlib.sha256(f'{content_sha256}:parser:{PARSER_VERSION}'.encode()).hexdigest()
+
+
+def _zip_xml_members(file_path: XmlSource) -> Optional[List[str]]:
+    """Names of the XML members if the file is a ZIP archive, else None."""
+    with open_source(file_path) as f:
+        if not is_zip_content(f.read(2)):
+            return None
+        f.seek(0)
+        with zipfile.ZipFile(f) as zf:
+            return [name for name in zf.namelist() if name.endswith('.xml')]
+
+
+def _parse_zip_members(file_path: XmlSource, members: List[str],
+                       streaming: bool) -> List[ColumnarDocument]:
+    """Parse the given XML members of a ZIP file straight from the archive."""
+    results = []
+    with open_source(file_path) as f, zipfile.ZipFile(f) as zf:
+        for name in members:
+            if streaming:
+                with zf.open(name) as source:
+                    results.append(ENTSOEStreamingParser(source).to_columnar())
+            else:
+                results.append(ENTSOEXMLParser(zf.read(name).decode('utf-8')).to_columnar())
+    return results
+
+
+def _parse_zip(file_path: XmlSource, members: List[str], streaming: bool,
+               workers: int) -> ColumnarDocument:
+    """
+    Parse every XML member of a ZIP file and merge them into one document.
+    
+    Large archives are split into contiguous groups of members parsed in
+    the shared process pool; each worker opens the archive itself, so nothing
+    is extracted to disk or copied between processes. Archives held in
+    memory are parsed in-process.
+    """
+    workers = max(1, min(workers, len(members) // ZIP_MEMBERS_PER_WORKER))
+    if workers == 1 or _in_pool_worker or not isinstance(file_path, str):
+        parsed_members = _parse_zip_members(file_path, members, streaming)
+    else:
+        group_size = -(-len(members) // workers)
+        groups = [members[i:i + group_size] for i in range(0, len(members), group_size)]
+        futures = [
+            submit_to_pool(_parse_zip_members, file_path, group, streaming) for group in groups
+        ]
+        parsed_members = [doc for future in futures for doc in future.result()]
+    
+    return merge_parsed_results(parsed_members)
+
+
+def parse_entsoe_columnar(xml_file_path: XmlSource, streaming: bool = False,
+                          cache: Optional[ParseCache] = None,
+                          workers: int = 1,
+                          content_sha256: Optional[str] = None) -> ColumnarDocument:
+    """
+    Parse an ENTSO-E XML (or ZIP) file into a ColumnarDocument.
+    
+    A ZIP archive holding several XML documents (outages, unit data, merged
+    pages) is parsed member by member and merged with merge_parsed_results.
+    
+    Args:
+        xml_file_path: Path to the XML file (or ZIP file containing XML), or
+            a seekable binary stream over a response held in memory
+        streaming: Parse incrementally with ENTSOEStreamingParser
+        cache: Optional ParseCache; unchanged payloads are loaded from it
+            instead of being parsed again
+        workers: Number of processes parsing the members of a large ZIP
+            archive (1 parses in the calling process)
+        content_sha256: SHA-256 of the file if already known; saves hashing
+            it again for the cache key
+        
+    Returns:
+        Parsed data in columnar form
+    """
+    if cache is not None:
+        key = parse_cache_key(xml_file_path, content_sha256)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    
+    members = _zip_xml_members(xml_file_path)
+    if members is not None and len(members) > 1:
+        result = _parse_zip(xml_file_path, members, streaming, workers)
+    elif streaming:
+        with open_xml_or_zip(xml_file_path) as source:
+            result = ENTSOEStreamingParser(source).to_columnar()
+    else:
+        # Read file, handling both XML and ZIP formats
+        xml_content = read_xml_or_zip(xml_file_path)
+        result = ENTSOEXMLParser(xml_content).to_columnar()
+    
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+def parse_entsoe_xml(xml_file_path: str, json_output_path: str = None,
+                     streaming: bool = False,
+                     cache: Optional[ParseCache] = None) -> Dict[str, Any]:
     """
     Parse an ENTSO-E XML file and optionally save as JSON.
     
@@ -461,15 +888,13 @@ def parse_entsoe_xml(xml_file_path: str, json_output_path: str = None) -> Dict[s
     Args:
         xml_file_path: Path to the XML file (or ZIP file containing XML)
         json_output_path: Optional path to save JSON output
+        streaming: Parse incrementally with ENTSOEStreamingParser
+        cache: Optional ParseCache for repeat parses of unchanged files
         
     Returns:
         Parsed data as dictionary
     """
-    # Read file, handling both XML and ZIP formats
-    xml_content = read_xml_or_zip(xml_file_path)
-    
-    parser = ENTSOEXMLParser(xml_content)
-    result = parser.to_dict()
+    result = parse_entsoe_columnar(xml_file_path, streaming, cache).to_dict()
     
     if json_output_path:
         json_path = Path(json_output_path)
@@ -581,15 +1006,174 @@ def _get_value_from_point(point: Dict[str, Any]) -> Optional[float]:
     return None
 
 
-def parsed_to_csv(parsed_dict: Dict[str, Any], csv_output_path: str) -> Dict[str, Any]:
+def _csv_period_run(period: Union[Dict[str, Any], ColumnarPeriod], ts_idx: int) -> List[tuple]:
+    """
+    Return the (timestamp key, stream_id, value) rows of one period, in timestamp order.
+    
+    Keys are (epoch, utc_offset) tuples for columnar periods and the ISO
+    timestamp string for dict periods (see _format_csv_timestamp). A stream
+    id is (ts_idx,) or (ts_idx, imbalance category).
+    """
+    if isinstance(period, ColumnarPeriod):
+        epochs = period.epochs()
+        if epochs is None:
+            return []
+        offset = period.utc_offset
+        categories = period.categories or [''] * len(epochs)
+        rows = [
+            ((epoch, offset), (ts_idx, category) if category else (ts_idx,), value)
+            for epoch, category, value in zip(epochs, categories, period.primary_values())
+        ]
+    else:
+        rows = []
+        for point in period.get('points', []):
+            timestamp = point.get('timestamp')
+            if not timestamp:
+                continue
+            stream_id = (ts_idx,)
+            if 'imbalancePriceCategory' in point:
+                stream_id = (ts_idx, point['imbalancePriceCategory'])
+            rows.append((timestamp, stream_id, _get_value_from_point(point)))
+    
+    # Points normally arrive by position; sort (stably) only when they don't
+    if any(rows[i][0] > rows[i + 1][0] for i in range(len(rows) - 1)):
+        rows.sort(key=lambda row: row[0])
+    return rows
+
+
+def _csv_period_bounds(period: Union[Dict[str, Any], ColumnarPeriod]) -> Optional[tuple]:
+    """Return (first key, last key) of a period whose points are in order, else None."""
+    if isinstance(period, ColumnarPeriod):
+        positions = period.positions
+        if period.start_epoch is None or not positions:
+            return None
+        if any(positions[i] > positions[i + 1] for i in range(len(positions) - 1)):
+            return None
+        offset = period.utc_offset
+        return ((period.epoch_of(positions[0]), offset),
+                (period.epoch_of(positions[-1]), offset))
+    
+    timestamps = [p['timestamp'] for p in period.get('points', []) if p.get('timestamp')]
+    if not timestamps:
+        return None
+    if any(timestamps[i] > timestamps[i + 1] for i in range(len(timestamps) - 1)):
+        return None
+    return timestamps[0], timestamps[-1]
+
+
+def _csv_stream_runs(ts: Union[Dict[str, Any], ColumnarSeries], ts_idx: int) -> List[Iterator[tuple]]:
+    """
+    Split a timeseries into lazily evaluated runs that are each sorted by timestamp.
+    
+    Periods that follow each other in time are chained into a single run, so
+    a typical timeseries is one run however many periods it has.
+    """
+    periods = ts.periods if isinstance(ts, ColumnarSeries) else ts.get('periods', [])
+    
+    chains = []
+    current = []
+    last_key = None
+    for period in periods:
+        bounds = _csv_period_bounds(period)
+        if bounds is None or (last_key is not None and bounds[0] < last_key):
+            if current:
+                chains.append(current)
+            current = []
+            last_key = None
+        current.append(period)
+        if bounds is None:
+            # Unordered or empty period: keep it as a run on its own
+            chains.append(current)
+            current = []
+        else:
+            last_key = bounds[1]
+    if current:
+        chains.append(current)
+    
+    return [
+        itertools.chain.from_iterable(_csv_period_run(period, ts_idx) for period in chain)
+        for chain in chains
+    ]
+
+
+def _csv_stream_ids(ts: Union[Dict[str, Any], ColumnarSeries], ts_idx: int) -> set:
+    """Collect the stream ids of a timeseries (one per imbalance category)."""
+    stream_ids = set()
+    if isinstance(ts, ColumnarSeries):
+        for period in ts.periods:
+            if period.start_epoch is None or not period.positions:
+                continue
+            for category in set(period.categories or ['']):
+                stream_ids.add((ts_idx, category) if category else (ts_idx,))
+        return stream_ids
+    
+    for period in ts.get('periods', []):
+        for point in period.get('points', []):
+            if not point.get('timestamp'):
+                continue
+            if 'imbalancePriceCategory' in point:
+                stream_ids.add((ts_idx, point['imbalancePriceCategory']))
+            else:
+                stream_ids.add((ts_idx,))
+    return stream_ids
+
+
+def _name_streams(stream_metadata: Dict[tuple, Dict[str, Any]],
+                  doc_metadata: Dict[str, Any]) -> tuple:
+    """
+    Order streams and give each a unique column name.
+    
+    Returns:
+        (sorted stream ids, column names in the same order)
+    """
+    # Sort streams consistently (numerically by TS index, then by diff)
+    sorted_stream_ids = sorted(stream_metadata.keys())
+    
+    column_names = []
+    for stream_id in sorted_stream_ids:
+        meta = stream_metadata[stream_id]
+        col_name = _generate_column_name(meta, stream_id[0], doc_metadata)
+        
+        # Deduplicate column names
+        original_name = col_name
+        counter = 1
+        while col_name in column_names or col_name == 'timestamp':
+            col_name = f"{original_name}_{counter}"
+            counter += 1
+            
+        column_names.append(col_name)
+    
+    return sorted_stream_ids, column_names
+
+
+def _format_csv_timestamp(key: Union[str, tuple]) -> str:
+    """Format a timestamp key from _csv_period_run for output."""
+    if isinstance(key, tuple):
+        return format_epoch(*key)
+    return key
+
+
+def parsed_to_csv(parsed_dict: Union[Dict[str, Any], ColumnarDocument],
+                  csv_output_path: str) -> Dict[str, Any]:
     """
     Convert parsed ENTSO-E data to CSV format.
     
     Creates a tabular format where columns correspond to unique data streams.
     A stream is defined by its TimeSeries metadata plus any point-level 
     differentiators (like imbalance price categories).
+    
+    Rows are produced by a heap-based k-way merge of the already sorted
+    periods of every stream and written as they are completed, so memory
+    grows with the number of columns rather than the number of rows.
+    
+    Accepts either the parsed dictionary or a ColumnarDocument.
     """
-    timeseries_list = parsed_dict.get('timeseries', [])
+    if isinstance(parsed_dict, ColumnarDocument):
+        timeseries_list = parsed_dict.series
+        doc_metadata = parsed_dict.document_info
+    else:
+        timeseries_list = parsed_dict.get('timeseries', [])
+        doc_metadata = parsed_dict.get('documentInfo', {})
     
     # Handle no data case
     if not timeseries_list:
@@ -600,103 +1184,190 @@ def parsed_to_csv(parsed_dict: Dict[str, Any], csv_output_path: str) -> Dict[str
             writer.writerow(['timestamp'])
         return {'columns': ['timestamp'], 'rows': 0, 'path': str(csv_path)}
     
-    # Pass 1: Discover all unique data streams and collect data
-    doc_metadata = parsed_dict.get('documentInfo', {})
-    data_by_timestamp = {} # timestamp -> {stream_id: value}
+    # Pass 1: Discover all unique data streams
     stream_metadata = {}   # stream_id -> combined_metadata_dict
+    runs = []              # timestamp-sorted iterators of (key, stream_id, value)
     
     for ts_idx, ts in enumerate(timeseries_list):
         # Base metadata for this TimeSeries (no periods)
-        base_meta = {k: v for k, v in ts.items() if k != 'periods'}
+        if isinstance(ts, ColumnarSeries):
+            base_meta = ts.meta
+        else:
+            base_meta = {k: v for k, v in ts.items() if k != 'periods'}
         
-        for period in ts.get('periods', []):
-            for point in period.get('points', []):
-                timestamp = point.get('timestamp')
-                if not timestamp:
-                    continue
-                
-                # Determine stream identity
-                # Start with TS index to separate multiple TS objects
-                id_parts = [str(ts_idx)]
-                
-                # Check for point-level differentiators (e.g. imbalance category)
-                point_diff = None
-                if 'imbalancePriceCategory' in point:
-                    point_diff = point['imbalancePriceCategory']
-                    id_parts.append(point_diff)
-                
-                stream_id = "_".join(id_parts)
-                
-                # Initialize stream metadata for naming
-                if stream_id not in stream_metadata:
-                    meta = base_meta.copy()
-                    if point_diff:
-                        meta['imbalancePriceCategory'] = point_diff
-                    stream_metadata[stream_id] = meta
-                
-                # Collect value
-                value = _get_value_from_point(point)
-                if timestamp not in data_by_timestamp:
-                    data_by_timestamp[timestamp] = {}
-                
-                data_by_timestamp[timestamp][stream_id] = value
-
-    # Pass 2: Generate column names from discovered streams
-    # Sort streams consistently (numerically by TS index, then by diff)
-    def stream_sort_key(s):
-        parts = s.split('_')
-        try:
-            return [int(parts[0])] + parts[1:]
-        except ValueError:
-            return [parts[0]] + parts[1:]
-    
-    sorted_stream_ids = sorted(stream_metadata.keys(), key=stream_sort_key)
-    
-    column_names = ['timestamp']
-    stream_to_col = {}
-    
-    for stream_id in sorted_stream_ids:
-        meta = stream_metadata[stream_id]
-        ts_idx = int(stream_id.split('_')[0])
-        col_name = _generate_column_name(meta, ts_idx, doc_metadata)
+        for stream_id in _csv_stream_ids(ts, ts_idx):
+            meta = dict(base_meta)
+            # Point-level differentiator (e.g. imbalance category)
+            if len(stream_id) > 1 and stream_id[1]:
+                meta['imbalancePriceCategory'] = stream_id[1]
+            stream_metadata[stream_id] = meta
         
-        # Deduplicate column names
-        original_name = col_name
-        counter = 1
-        while col_name in column_names:
-            col_name = f"{original_name}_{counter}"
-            counter += 1
-            
-        column_names.append(col_name)
-        stream_to_col[stream_id] = col_name
+        runs.extend(_csv_stream_runs(ts, ts_idx))
     
-    # Pass 3: Sort timestamps and write CSV
-    sorted_timestamps = sorted(data_by_timestamp.keys())
+    # Pass 2: Generate column names from discovered streams
+    sorted_stream_ids, column_names = _name_streams(stream_metadata, doc_metadata)
+    column_names = ['timestamp'] + column_names
     
+    # Pass 3: Merge the sorted runs by timestamp and write rows as they complete
     csv_path = Path(csv_output_path)
     csv_path.parent.mkdir(parents=True, exist_ok=True)
+    row_count = 0
     
     with open(csv_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(column_names)
         
-        for timestamp in sorted_timestamps:
-            row = [timestamp]
-            ts_data = data_by_timestamp[timestamp]
+        # heapq.merge is stable, so for a repeated timestamp the value from the
+        # later period wins, as it did when rows were collected in a dict
+        merged = heapq.merge(*runs, key=lambda row: row[0])
+        for timestamp, group in itertools.groupby(merged, key=lambda row: row[0]):
+            ts_data = {stream_id: value for _, stream_id, value in group}
+            row = [_format_csv_timestamp(timestamp)]
             for stream_id in sorted_stream_ids:
                 value = ts_data.get(stream_id, '')
                 row.append(value if value is not None else '')
             writer.writerow(row)
+            row_count += 1
     
     return {
         'columns': column_names,
-        'rows': len(sorted_timestamps),
+        'rows': row_count,
         'path': str(csv_path)
     }
 
 
+# =============================================================================
+# COLUMNAR FILE EXPORT (Parquet / Arrow IPC)
+# =============================================================================
+
+# Supported columnar formats and their file extensions
+COLUMNAR_FILE_FORMATS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+}
+
+# Series metadata copied to every row of the columnar export
+COLUMNAR_METADATA_FIELDS = [
+    'businessType', 'psrType', 'inBiddingZone', 'outBiddingZone', 'in', 'out',
+    'controlArea', 'area', 'flowDirection', 'contractType', 'unit', 'currency',
+]
+
+
+def parsed_to_arrow_table(parsed: ColumnarDocument):
+    """
+    Build a long-format pyarrow Table from a ColumnarDocument.
+    
+    One row per point with a `series` column (named like the CSV columns),
+    a UTC `timestamp`, the `position`, the primary `value` and the series
+    metadata fields that occur in the document. Document info and time
+    interval are kept in the schema metadata.
+    
+    Requires pyarrow.
+    """
+    import pyarrow as pa
+    
+    stream_metadata = {}
+    for ts_idx, ts in enumerate(parsed.series):
+        for stream_id in _csv_stream_ids(ts, ts_idx):
+            meta = dict(ts.meta)
+            if len(stream_id) > 1 and stream_id[1]:
+                meta['imbalancePriceCategory'] = stream_id[1]
+            stream_metadata[stream_id] = meta
+    stream_ids, names = _name_streams(stream_metadata, parsed.document_info)
+    stream_names = dict(zip(stream_ids, names))
+    
+    meta_fields = [name for name in COLUMNAR_METADATA_FIELDS
+                   if any(ts.meta.get(name) for ts in parsed.series)]
+    has_categories = any(period.categories for ts in parsed.series for period in ts.periods)
+    if has_categories:
+        meta_fields.append('imbalancePriceCategory')
+    
+    schema = pa.schema(
+        [
+            ('series', pa.string()),
+            ('timestamp', pa.timestamp('s', tz='UTC')),
+            ('position', pa.int64()),
+            ('value', pa.float64()),
+        ] + [(name, pa.string()) for name in meta_fields],
+        metadata={
+            'entsoe.documentInfo': json.dumps(parsed.document_info, default=str),
+            'entsoe.timeInterval': json.dumps(parsed.time_interval, default=str),
+        },
+    )
+    
+    batches = []
+    for ts_idx, ts in enumerate(parsed.series):
+        for period in ts.periods:
+            epochs = period.epochs()
+            if epochs is None or not len(epochs):
+                continue
+            count = len(epochs)
+            categories = period.categories or [''] * count
+            series = [stream_names[(ts_idx, c) if c else (ts_idx,)] for c in categories]
+            # Zero-copy views over the period's int64 buffers
+            timestamps = pa.Array.from_buffers(pa.int64(), count, [None, pa.py_buffer(epochs)])
+            positions = pa.Array.from_buffers(pa.int64(), count, [None, pa.py_buffer(period.positions)])
+            columns = [
+                pa.array(series, pa.string()),
+                timestamps.cast(pa.timestamp('s', tz='UTC')),
+                positions,
+                pa.array(period.primary_values(), pa.float64()),
+            ]
+            for name in meta_fields:
+                if name == 'imbalancePriceCategory':
+                    columns.append(pa.array([c or None for c in categories], pa.string()))
+                else:
+                    columns.append(pa.array([ts.meta.get(name) or None] * count, pa.string()))
+            batches.append(pa.RecordBatch.from_arrays(columns, schema=schema))
+    
+    return pa.Table.from_batches(batches, schema=schema)
+
+
+def parsed_to_columnar_file(parsed: ColumnarDocument, output_path: str,
+                            file_format: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Write parsed ENTSO-E data as a Parquet or Arrow IPC file.
+    
+    Args:
+        parsed: Parsed document in columnar form
+        output_path: Path of the file to write
+        file_format: 'parquet' or 'arrow'; inferred from the extension if omitted
+        
+    Returns:
+        Info dict with format, columns, row count and path
+    """
+    path = Path(output_path)
+    if file_format is None:
+        file_format = next((fmt for fmt, ext in COLUMNAR_FILE_FORMATS.items()
+                            if path.suffix == ext), None)
+    if file_format not in COLUMNAR_FILE_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {file_format or path.suffix}")
+    
+    import pyarrow as pa
+    
+    table = parsed_to_arrow_table(parsed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, str(path), compression='zstd')
+    else:
+        options = pa.ipc.IpcWriteOptions(compression='zstd')
+        with pa.OSFile(str(path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+    
+    return {
+        'format': file_format,
+        'columns': table.column_names,
+        'rows': table.num_rows,
+        'path': str(path)
+    }
+
+
 def parse_entsoe_xml_full(xml_file_path: str, json_output_path: str = None, 
-                          csv_output_path: str = None) -> Dict[str, Any]:
+                          csv_output_path: str = None, streaming: bool = False,
+                          cache: Optional[ParseCache] = None) -> Dict[str, Any]:
     """
     Parse an ENTSO-E XML file and optionally save as JSON and/or CSV.
     
@@ -706,15 +1377,13 @@ def parse_entsoe_xml_full(xml_file_path: str, json_output_path: str = None,
         xml_file_path: Path to the XML file (or ZIP file containing XML)
         json_output_path: Optional path to save JSON output
         csv_output_path: Optional path to save CSV output
+        streaming: Parse incrementally with ENTSOEStreamingParser
+        cache: Optional ParseCache for repeat parses of unchanged files
         
     Returns:
         Parsed data as dictionary (with csv_info if CSV was exported)
     """
-    # Read file, handling both XML and ZIP formats
-    xml_content = read_xml_or_zip(xml_file_path)
-    
-    parser = ENTSOEXMLParser(xml_content)
-    result = parser.to_dict()
+    result = parse_entsoe_columnar(xml_file_path, streaming, cache).to_dict()
     
     # Save JSON if path provided
     if json_output_path:
@@ -939,11 +1608,15 @@ def merge_parsed_results(parsed_list: List[Dict[str, Any]]) -> Dict[str, Any]:
     are fetched separately and need to be combined.
     
     Args:
-        parsed_list: List of parsed result dictionaries
+        parsed_list: List of parsed result dictionaries (or ColumnarDocuments,
+            in which case a merged ColumnarDocument is returned)
         
     Returns:
         Merged result dictionary with combined timeseries
     """
+    if parsed_list and isinstance(parsed_list[0], ColumnarDocument):
+        return _merge_columnar_results(parsed_list)
+    
     if not parsed_list:
         return {
             'documentInfo': {},
@@ -997,6 +1670,36 @@ def merge_parsed_results(parsed_list: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def _merge_columnar_results(parsed_list: List[ColumnarDocument]) -> ColumnarDocument:
+    """Columnar counterpart of merge_parsed_results."""
+    valid_results = [r for r in parsed_list if not r.error and r.series]
+    
+    if not valid_results:
+        # Every chunk acknowledged "no matching data": keep the API's reason
+        acknowledged = all(r.no_data and r.error for r in parsed_list)
+        return ColumnarDocument(
+            document_info=parsed_list[0].document_info,
+            time_interval=_get_merged_time_interval(parsed_list),
+            extra={'chunksWithData': 0, 'isMerged': True},
+            no_data=acknowledged,
+            error=(
+                parsed_list[0].error if acknowledged
+                else {'code': 'NO_DATA', 'text': 'No data available for any chunk in the requested period'}
+            ),
+        )
+    
+    all_timeseries = []
+    for result in valid_results:
+        all_timeseries.extend(result.series)
+    
+    return ColumnarDocument(
+        document_info=valid_results[0].document_info,
+        time_interval=_get_merged_time_interval(parsed_list),
+        series=_merge_timeseries_by_type(all_timeseries),
+        extra={'chunksWithData': len(valid_results), 'isMerged': True},
+    )
+
+
 def _get_merged_time_interval(parsed_list: List[Dict[str, Any]]) -> Dict[str, str]:
     """
     Calculate the overall time interval spanning all parsed results.
@@ -1011,7 +1714,10 @@ def _get_merged_time_interval(parsed_list: List[Dict[str, Any]]) -> Dict[str, st
     ends = []
     
     for result in parsed_list:
-        interval = result.get('timeInterval', {})
+        if isinstance(result, ColumnarDocument):
+            interval = result.time_interval
+        else:
+            interval = result.get('timeInterval', {})
         if interval.get('start'):
             starts.append(interval['start'])
         if interval.get('end'):
@@ -1040,18 +1746,19 @@ def _merge_timeseries_by_type(timeseries_list: List[Dict[str, Any]]) -> List[Dic
     groups = {}
     
     for ts in timeseries_list:
+        fields = ts.meta if isinstance(ts, ColumnarSeries) else ts
         # Create a key from identifying fields
         key_parts = [
-            ts.get('businessType', ''),
-            ts.get('psrType', ''),
-            ts.get('outBiddingZone', ''),
-            ts.get('inBiddingZone', ''),
-            ts.get('in', ''),
-            ts.get('out', ''),
-            ts.get('controlArea', ''),
-            ts.get('area', ''),
-            ts.get('flowDirection', ''),
-            ts.get('contractType', ''),
+            fields.get('businessType', ''),
+            fields.get('psrType', ''),
+            fields.get('outBiddingZone', ''),
+            fields.get('inBiddingZone', ''),
+            fields.get('in', ''),
+            fields.get('out', ''),
+            fields.get('controlArea', ''),
+            fields.get('area', ''),
+            fields.get('flowDirection', ''),
+            fields.get('contractType', ''),
         ]
         key = tuple(k for k in key_parts if k)  # Only non-empty values
         
@@ -1081,6 +1788,11 @@ def _merge_single_timeseries_group(ts_group: List[Dict[str, Any]]) -> Dict[str,
     if len(ts_group) == 1:
         return ts_group[0]
     
+    if isinstance(ts_group[0], ColumnarSeries):
+        periods = [period for ts in ts_group for period in ts.periods]
+        periods.sort(key=lambda p: p.start)
+        return ColumnarSeries(meta=dict(ts_group[0].meta), periods=periods)
+    
     # Use first as base
     base = ts_group[0].copy()
     
@@ -1099,8 +1811,49 @@ def _merge_single_timeseries_group(ts_group: List[Dict[str, Any]]) -> Dict[str,
     return base
 
 
+def _parse_files(xml_files: List[Path], streaming: bool,
+                 cache: Optional[ParseCache], workers: int) -> List[ColumnarDocument]:
+    """
+    Parse files, in the shared process pool when workers > 1.
+    
+    Files that fail to parse are reported and skipped. Results are returned
+    in the order of xml_files regardless of completion order.
+    """
+    workers = max(1, min(workers, len(xml_files)))
+    if workers == 1 or _in_pool_worker:
+        parsed_results = []
+        for xml_file in xml_files:
+            try:
+                parsed_results.append(
+                    parse_entsoe_columnar(str(xml_file), streaming=streaming, cache=cache)
+                )
+            except Exception as e:
+                # Log but continue with other files
+                print(f"  ⚠️ Error parsing {xml_file.name}: {e}")
+        return parsed_results
+    
+    parsed_by_index: Dict[int, ColumnarDocument] = {}
+    futures = {
+        submit_to_pool(parse_entsoe_columnar, str(xml_file), streaming, cache): index
+        for index, xml_file in enumerate(xml_files)
+    }
+    for future in as_completed(futures):
+        index = futures[future]
+        try:
+            parsed_by_index[index] = future.result()
+        except Exception as e:
+            # Log but continue with other files
+            print(f"  ⚠️ Error parsing {xml_files[index].name}: {e}")
+    
+    return [parsed_by_index[index] for index in sorted(parsed_by_index)]
+
+
 def parse_and_merge_xml_folder(folder_path: str, json_output_path: str = None,
-                                csv_output_path: str = None) -> Dict[str, Any]:
+                                csv_output_path: str = None,
+                                streaming: bool = False,
+                                columnar_output_path: str = None,
+                                cache: Optional[ParseCache] = None,
+                                workers: int = 1) -> Dict[str, Any]:
     """
     Parse all XML files in a folder and merge into a single result.
     
@@ -1111,6 +1864,12 @@ def parse_and_merge_xml_folder(folder_path: str, json_output_path: str = None,
         folder_path: Path to folder containing XML files
         json_output_path: Optional path to save merged JSON output
         csv_output_path: Optional path to save merged CSV output
+        streaming: Parse each file incrementally with ENTSOEStreamingParser
+        columnar_output_path: Optional path to save a merged Parquet/Arrow file
+            (format taken from the extension)
+        cache: Optional ParseCache; files parsed before are not parsed again
+        workers: Number of processes parsing files in parallel (1 parses
+            in the calling process)
         
     Returns:
         Merged result dictionary
@@ -1126,21 +1885,14 @@ def parse_and_merge_xml_folder(folder_path: str, json_output_path: str = None,
     if not xml_files:
         raise ValueError(f"No XML files found in: {folder_path}")
     
-    # Parse each file
-    parsed_results = []
-    for xml_file in xml_files:
-        try:
-            result = parse_entsoe_xml(str(xml_file))
-            parsed_results.append(result)
-        except Exception as e:
-            # Log but continue with other files
-            print(f"  ⚠️ Error parsing {xml_file.name}: {e}")
+    parsed_results = _parse_files(xml_files, streaming, cache, workers)
     
     if not parsed_results:
         raise ValueError(f"Could not parse any XML files in: {folder_path}")
     
     # Merge all results
-    merged = merge_parsed_results(parsed_results)
+    merged_columnar = merge_parsed_results(parsed_results)
+    merged = merged_columnar.to_dict()
     
     # Save JSON if output path provided
     if json_output_path:
@@ -1151,9 +1903,13 @@ def parse_and_merge_xml_folder(folder_path: str, json_output_path: str = None,
     
     # Save CSV if output path provided
     if csv_output_path:
-        csv_info = parsed_to_csv(merged, csv_output_path)
+        csv_info = parsed_to_csv(merged_columnar, csv_output_path)
         merged['csvInfo'] = csv_info
     
+    # Save Parquet/Arrow if output path provided
+    if columnar_output_path:
+        merged['columnarInfo'] = parsed_to_columnar_file(merged_columnar, columnar_output_path)
+    
     return merged
 
 
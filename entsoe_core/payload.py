@@ -0,0 +1,161 @@
+"""
+Response bodies spooled to disk.
+
+HTTP responses are streamed in chunks into a content-addressed store instead
+of being held in memory, hashing the bytes on the way. A Payload names the
+stored file and its SHA-256, so callers can hard-link it to its destination
+(one copy on disk, never read into Python) and the parser can derive its
+cache key without reading the file again. MemoryPayloadWriter keeps a body in
+memory instead, for callers that must not write anything to disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from entsoe_core.parse_cache import LruBudget, atomic_write_bytes, shared_budget
+
+PAYLOAD_SUFFIX = ".body"
+DEFAULT_MAX_PAYLOAD_BYTES = 512 * 1024 * 1024
+# Bytes read from the network per write
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class Payload:
+    """An immutable response body, on disk (path) or in memory (data)."""
+
+    path: Optional[Path]
+    sha256: str
+    size: int
+    data: Optional[bytes] = None
+
+    def open(self) -> BinaryIO:
+        if self.data is not None:
+            return io.BytesIO(self.data)
+        return open(self.path, "rb")
+
+    def source(self) -> Union[str, BinaryIO]:
+        """What the parser reads: the file path, or a stream over the in-memory body."""
+        if self.data is not None:
+            return io.BytesIO(self.data)
+        return str(self.path)
+
+    def head(self, size: int = 1024) -> bytes:
+        """First bytes of the body, e.g. to sniff ZIP or HTML content."""
+        with self.open() as file_handle:
+            return file_handle.read(size)
+
+    def save_to(self, destination: Path) -> None:
+        """
+        Place the body at destination atomically.
+
+        The file is hard-linked, so the spool, the output file and the
+        response cache share one copy on disk; across file systems it falls
+        back to a copy. Stored files are only ever replaced, never written in
+        place, so the links stay consistent.
+        """
+        if self.data is not None:
+            atomic_write_bytes(destination, self.data)
+            return
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            try:
+                os.link(self.path, tmp_path)
+            except OSError:
+                shutil.copyfile(self.path, tmp_path)
+            os.replace(tmp_path, destination)
+        finally:
+            # Also left behind when destination already was this very file
+            tmp_path.unlink(missing_ok=True)
+
+
+class PayloadWriter:
+    """Streams chunks to a temporary file and hashes them; commit() stores the result."""
+
+    def __init__(self, store: "PayloadStore") -> None:
+        self._store = store
+        store.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=store.directory, suffix=".tmp")
+        self._tmp_path = Path(tmp_name)
+        self._file = os.fdopen(fd, "wb")
+        self._hash = hashlib.sha256()
+        self._size = 0
+
+    def write(self, chunk: bytes) -> int:
+        self._file.write(chunk)
+        self._hash.update(chunk)
+        self._size += len(chunk)
+        return len(chunk)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def commit(self) -> Payload:
+        self._file.close()
+        return self._store._adopt(self._tmp_path, self._hash.hexdigest(), self._size)
+
+    def discard(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class MemoryPayloadWriter:
+    """PayloadWriter counterpart that keeps the body in memory; commit() never touches disk."""
+
+    def __init__(self) -> None:
+        self._buffer = io.BytesIO()
+        self._hash = hashlib.sha256()
+
+    def write(self, chunk: bytes) -> int:
+        self._hash.update(chunk)
+        return self._buffer.write(chunk)
+
+    def flush(self) -> None:
+        pass
+
+    def commit(self) -> Payload:
+        data = self._buffer.getvalue()
+        return Payload(None, self._hash.hexdigest(), len(data), data)
+
+    def discard(self) -> None:
+        self._buffer = io.BytesIO()
+
+
+class PayloadStore:
+    """Size-bounded, content-addressed store of response bodies."""
+
+    def __init__(self, directory: Path, max_bytes: Optional[int] = DEFAULT_MAX_PAYLOAD_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @property
+    def _budget(self) -> LruBudget:
+        return shared_budget(self.directory, f"*/*{PAYLOAD_SUFFIX}", self.max_bytes)
+
+    def _path(self, sha256: str) -> Path:
+        return self.directory / sha256[:2] / f"{sha256}{PAYLOAD_SUFFIX}"
+
+    def writer(self) -> PayloadWriter:
+        return PayloadWriter(self)
+
+    def _adopt(self, tmp_path: Path, sha256: str, size: int) -> Payload:
+        path = self._path(sha256)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            # Same bytes already stored; refresh it for LRU eviction instead
+            tmp_path.unlink(missing_ok=True)
+            os.utime(path)
+        else:
+            os.replace(tmp_path, path)
+            self._budget.add(size)
+        return Payload(path, sha256, size)
@@ -0,0 +1,33 @@
+"""Building blocks for the fetch -> parse -> write pipeline."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable
+
+# Pending items per parse worker before producers are blocked
+PIPELINE_DEPTH = 2
+
+
+class BoundedExecutor:
+    """
+    Wraps an executor so that at most `limit` submitted tasks are unfinished.
+
+    submit() blocks while the limit is reached, which pushes back on the
+    producing stage instead of letting work (and payloads) pile up.
+    """
+
+    def __init__(self, executor: Executor, limit: int) -> None:
+        self._executor = executor
+        self._slots = threading.BoundedSemaphore(limit)
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
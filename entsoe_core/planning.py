@@ -0,0 +1,89 @@
+"""
+Batch planning: fetch each distinct query once.
+
+Requests for the same data set (equal parameters apart from the period and the
+name) whose periods overlap or touch are merged into one query over the union
+of their periods, e.g. "last week" and "last month" for the same area. The
+batch runner executes every planned query once and cuts each request's own
+period back out of the parsed result.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from entsoe_core.coverage import PERIOD_PARAMS
+from entsoe_core.response_cache import normalize_params
+
+
+@dataclass
+class PlannedQuery:
+    """One query to execute and the indices of the batch requests it answers."""
+
+    params: Dict[str, str]
+    members: List[int] = field(default_factory=list)
+
+    @property
+    def shared(self) -> bool:
+        return len(self.members) > 1
+
+
+def query_key(params: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """The data set a request asks for: its normalized params without period and name."""
+    return tuple(
+        (key, value)
+        for key, value in normalize_params(params).items()
+        if key not in PERIOD_PARAMS and key != "name"
+    )
+
+
+def _window(params: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    try:
+        start, end = (
+            int(datetime.strptime(params[key], "%Y%m%d%H%M").replace(tzinfo=timezone.utc).timestamp())
+            for key in ("periodStart", "periodEnd")
+        )
+    except (KeyError, ValueError, TypeError):
+        return None
+    return (start, end) if start < end else None
+
+
+def plan_batch(requests_list: List[Dict[str, Any]]) -> List[PlannedQuery]:
+    """
+    Group a batch into the queries to execute, ordered by their first request.
+
+    Requests with an explicit offset or without a valid period are never merged.
+    """
+    planned: List[PlannedQuery] = []
+    groups: Dict[Tuple[Tuple[str, str], ...], List[Tuple[int, int, int]]] = {}
+    for index, req in enumerate(requests_list):
+        params = req["params"]
+        window = _window(params)
+        if window is None or "offset" in params:
+            planned.append(PlannedQuery(dict(params), [index]))
+        else:
+            groups.setdefault(query_key(params), []).append((*window, index))
+
+    for windows in groups.values():
+        windows.sort()
+        clusters: List[List[Tuple[int, int, int]]] = []
+        cluster_end = None
+        for window in windows:
+            if cluster_end is not None and window[0] <= cluster_end:
+                clusters[-1].append(window)
+                cluster_end = max(cluster_end, window[1])
+            else:
+                clusters.append([window])
+                cluster_end = window[1]
+
+        for cluster in clusters:
+            first = requests_list[cluster[0][2]]["params"]
+            last = requests_list[max(cluster, key=lambda window: window[1])[2]]["params"]
+            params = dict(first)
+            params["periodEnd"] = last["periodEnd"]
+            planned.append(PlannedQuery(params, sorted(window[2] for window in cluster)))
+
+    planned.sort(key=lambda query: query.members[0])
+    return planned
@@ -0,0 +1,169 @@
+"""
+Token-bucket rate limiting for ENTSO-E API calls.
+
+The quota belongs to the security token, not to a process: the backend, the
+CLI and batch workers on one host may all call the API with the same token.
+SQLiteTokenBucket keeps the bucket in a small SQLite ledger so that all of
+them draw from one quota.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+# ENTSO-E allows 400 requests per minute per security token; exceeding it
+# bans the token for 10 minutes. A 360/min refill plus a burst of 40 keeps
+# any 60 second window at or below 400 requests.
+ENTSOE_REQUESTS_PER_MINUTE = 400
+DEFAULT_RATE_PER_MINUTE = 360
+DEFAULT_BURST = 40
+# Host-wide, so processes with different output directories share it
+DEFAULT_QUOTA_LEDGER = Path(tempfile.gettempdir()) / "entsoe-quota.sqlite"
+# Seconds a process waits for another one holding the ledger lock
+LEDGER_TIMEOUT = 10.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """Take tokens if available; otherwise return the seconds to wait (0 on success)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until tokens are available, then take them."""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+_shared_buckets: Dict[Tuple[str, float, float], TokenBucket] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_bucket(
+    key: str,
+    per_minute: float = DEFAULT_RATE_PER_MINUTE,
+    burst: float = DEFAULT_BURST,
+) -> TokenBucket:
+    """Process-wide bucket for a key (the API token), so every caller shares the quota."""
+    bucket_key = (key, per_minute, burst)
+    with _shared_lock:
+        bucket = _shared_buckets.get(bucket_key)
+        if bucket is None:
+            bucket = TokenBucket(per_minute / 60.0, burst)
+            _shared_buckets[bucket_key] = bucket
+        return bucket
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """
+    Token bucket shared by all processes on a host through a SQLite ledger.
+
+    Each try_acquire refills and takes tokens in one write transaction, so
+    concurrent processes never spend the same tokens. Time is wall-clock,
+    as monotonic clocks are not comparable between processes. Buckets are
+    keyed by a hash of key, so the ledger never holds the API token.
+    """
+
+    def __init__(self, path: Path, key: str, rate: float, capacity: float) -> None:
+        super().__init__(rate, capacity)
+        self.path = Path(path)
+        self.key = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # autocommit mode, so transactions are only the explicit BEGIN IMMEDIATE ones
+        return sqlite3.connect(self.path, timeout=LEDGER_TIMEOUT, isolation_level=None)
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """Take tokens if available; otherwise return the seconds to wait (0 on success)."""
+        try:
+            with self._lock:
+                return self._take(tokens)
+        except sqlite3.Error:
+            # Ledger locked for too long or broken: pace this process on its own
+            return super().try_acquire(tokens)
+
+    def _take(self, tokens: float) -> float:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT tokens, updated FROM buckets WHERE key = ?", (self.key,)
+            ).fetchone()
+            now = time.time()
+            available = float(self.capacity)
+            if row is not None:
+                # max(): a clock set backwards must not drain the bucket
+                available = min(self.capacity, row[0] + max(0.0, now - row[1]) * self.rate)
+
+            wait = 0.0
+            if available >= tokens:
+                available -= tokens
+            else:
+                wait = (tokens - available) / self.rate
+            connection.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (self.key, available, now),
+            )
+            connection.execute("COMMIT")
+            return wait
+        finally:
+            connection.close()
+
+
+_ledger_buckets: Dict[Tuple[str, str, float, float], TokenBucket] = {}
+
+
+def host_bucket(
+    key: str,
+    per_minute: float = DEFAULT_RATE_PER_MINUTE,
+    burst: float = DEFAULT_BURST,
+    ledger: Path = DEFAULT_QUOTA_LEDGER,
+) -> TokenBucket:
+    """
+    Bucket for a key shared by every process on the host through ledger.
+
+    Falls back to the process-wide shared_bucket if the ledger cannot be opened.
+    """
+    bucket_key = (str(ledger), key, per_minute, burst)
+    with _shared_lock:
+        bucket = _ledger_buckets.get(bucket_key)
+        if bucket is None:
+            try:
+                bucket = SQLiteTokenBucket(ledger, key, per_minute / 60.0, burst)
+                _ledger_buckets[bucket_key] = bucket
+            except (OSError, sqlite3.Error) as exc:
+                print(f"⚠️ Quota ledger {ledger} unavailable ({exc}); limiting this process only")
+    return bucket if bucket is not None else shared_bucket(key, per_minute, burst)
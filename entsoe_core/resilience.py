@@ -0,0 +1,166 @@
+"""Retry policy and circuit breaker for ENTSO-E API failures."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+# Status codes worth another attempt: throttling and gateway/server hiccups
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN = 30.0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter, honouring Retry-After."""
+
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    retry_on_timeout: bool = True
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to wait before the attempt following `attempt` (1-based).
+
+        Returns None when no further attempt should be made, including when
+        the server asks for a longer pause than max_delay.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+
+    Closed: calls pass, consecutive failures are counted. After
+    failure_threshold failures it opens and rejects calls for `cooldown`
+    seconds, then lets a single half-open probe through: success closes the
+    circuit, failure reopens it for another cool-down. A probe that reports
+    no outcome within `cooldown` seconds is presumed lost and another one is
+    let through.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may be made now (claims the probe when half-open)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if (self._state == self.OPEN and now - self._opened_at >= self.cooldown) or (
+                self._state == self.HALF_OPEN and now - self._probe_at >= self.cooldown
+            ):
+                self._state = self.HALF_OPEN
+                self._probe_at = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_abort(self) -> None:
+        """An allowed call ended without an outcome (e.g. cancelled); a lost probe counts as a failure."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def retry_in(self) -> float:
+        """Seconds until the next half-open probe (0 unless open)."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State summary, e.g. for a health endpoint."""
+        retry_in = self.retry_in()
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "retry_in": round(retry_in, 1),
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def shared_circuit_breaker(
+    key: str,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    cooldown: float = DEFAULT_COOLDOWN,
+) -> CircuitBreaker:
+    """Process-wide circuit breaker for a key (the API base URL)."""
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(failure_threshold, cooldown)
+            _breakers[key] = breaker
+        return breaker
+
+
+def circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every shared circuit breaker, keyed by base URL."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {key: breaker.snapshot() for key, breaker in breakers.items()}
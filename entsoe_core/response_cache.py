@@ -0,0 +1,173 @@
+"""
+On-disk cache of raw ENTSO-E API responses.
+
+Entries are keyed by the normalized request parameters (without the
+securityToken). How long an entry stays fresh depends on how final the data
+is: a period that ended before the settlement horizon will not be revised
+any more and never expires, a period still in the settlement window is
+refreshed every few hours, and a window touching "now" gets a short TTL.
+
+Each entry is a small JSON metadata file plus the response body in a sibling
+file, so a hit hands out the body as a Payload without reading it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from entsoe_core.parse_cache import LruBudget, atomic_write_bytes, shared_budget
+from entsoe_core.payload import PAYLOAD_SUFFIX, Payload
+
+CACHE_SUFFIX = ".resp"
+DEFAULT_SETTLEMENT_HORIZON = timedelta(days=30)
+DEFAULT_RECENT_TTL = 5 * 60
+DEFAULT_UNSETTLED_TTL = 6 * 60 * 60
+DEFAULT_MAX_CACHE_BYTES = 1024 * 1024 * 1024
+
+# Parameters that identify the caller rather than the data
+_IGNORED_PARAMS = {"securityToken"}
+
+
+def normalize_params(params: Dict[str, Any]) -> Dict[str, str]:
+    """Request parameters as sorted strings, without credentials."""
+    return {
+        key: str(value)
+        for key, value in sorted(params.items())
+        if key not in _IGNORED_PARAMS and value is not None
+    }
+
+
+def _period_end(params: Dict[str, str]) -> Optional[datetime]:
+    value = params.get("periodEnd")
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def freshness_ttl(
+    period_end: Optional[datetime],
+    settlement_horizon: timedelta = DEFAULT_SETTLEMENT_HORIZON,
+    recent_ttl: float = DEFAULT_RECENT_TTL,
+    unsettled_ttl: float = DEFAULT_UNSETTLED_TTL,
+) -> Optional[float]:
+    """
+    Seconds data for a period ending at period_end stays fresh.
+
+    None means the period is past the settlement horizon and never expires.
+    """
+    if period_end is None:
+        return recent_ttl
+    now = datetime.now(timezone.utc)
+    if period_end <= now - settlement_horizon:
+        return None
+    if period_end >= now:
+        return recent_ttl
+    return unsettled_ttl
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of API responses with finality-aware TTLs."""
+
+    def __init__(
+        self,
+        directory: Path,
+        settlement_horizon: timedelta = DEFAULT_SETTLEMENT_HORIZON,
+        recent_ttl: float = DEFAULT_RECENT_TTL,
+        unsettled_ttl: float = DEFAULT_UNSETTLED_TTL,
+        max_bytes: Optional[int] = DEFAULT_MAX_CACHE_BYTES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.settlement_horizon = settlement_horizon
+        self.recent_ttl = recent_ttl
+        self.unsettled_ttl = unsettled_ttl
+        self.max_bytes = max_bytes
+
+    @property
+    def _budget(self) -> LruBudget:
+        # Bodies hold the bulk; the metadata is evicted with its body
+        return shared_budget(
+            self.directory, f"*/*{PAYLOAD_SUFFIX}", self.max_bytes, companions=(CACHE_SUFFIX,)
+        )
+
+    def key(self, base_url: str, params: Dict[str, Any]) -> str:
+        payload = json.dumps([base_url, normalize_params(params)], separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ttl(self, params: Dict[str, Any]) -> Optional[float]:
+        """Seconds an entry for params stays fresh; None means it never expires."""
+        return freshness_ttl(
+            _period_end(params), self.settlement_horizon, self.recent_ttl, self.unsettled_ttl
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{CACHE_SUFFIX}"
+
+    def get(
+        self,
+        base_url: str,
+        params: Dict[str, Any],
+        allow_stale: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cached response for the request, or None.
+
+        Returns a dict with status_code and payload. allow_stale also returns
+        expired entries (e.g. while the API is unreachable).
+        """
+        path = self._path(self.key(base_url, params))
+        body_path = path.with_suffix(PAYLOAD_SUFFIX)
+        try:
+            meta = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        try:
+            size: Optional[int] = body_path.stat().st_size
+        except OSError:
+            size = None
+        if size is None or "sha256" not in meta:
+            # Body evicted (e.g. by another process) or stale format: drop the entry
+            path.unlink(missing_ok=True)
+            return None
+
+        expires_at = meta.get("expires_at")
+        stale = expires_at is not None and expires_at <= time.time()
+        if stale and not allow_stale:
+            return None
+
+        # Refresh the entry for LRU eviction
+        try:
+            os.utime(path)
+            os.utime(body_path)
+        except OSError:
+            pass
+        return {
+            "status_code": meta.get("status_code"),
+            "payload": Payload(body_path, meta["sha256"], size),
+            "stale": stale,
+        }
+
+    def put(self, base_url: str, params: Dict[str, Any], status_code: int, payload: Payload) -> None:
+        """Store a response."""
+        ttl = self.ttl(params)
+        now = time.time()
+        meta = {
+            "status_code": status_code,
+            "params": normalize_params(params),
+            "sha256": payload.sha256,
+            "stored_at": now,
+            "expires_at": None if ttl is None else now + ttl,
+        }
+        path = self._path(self.key(base_url, params))
+        # Body first, so metadata never points at a missing body
+        payload.save_to(path.with_suffix(PAYLOAD_SUFFIX))
+        atomic_write_bytes(path, json.dumps(meta, separators=(",", ":")).encode("utf-8"))
+        self._budget.add(payload.size)
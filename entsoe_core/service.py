@@ -2,23 +2,90 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import copy
+import json
+import os
+import threading
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from entsoe_core.parser import (
-    parse_and_merge_xml_folder,
-    parse_entsoe_xml,
+    COLUMNAR_FILE_FORMATS,
+    count_documents,
+    SharedProcessPool,
+    merge_zip_files,
+    parse_entsoe_columnar,
+    parse_in_pool,
+    parsed_to_columnar_file,
     parsed_to_csv,
+    merge_parsed_results,
+)
+from entsoe_core.chunking import (
+    canonical_params,
+    max_query_span,
+    page_offsets,
+    page_size,
+    plan_windows,
+)
+from entsoe_core.columnar import ColumnarDocument
+from entsoe_core.coverage import CoverageIndex, subtract_intervals
+from entsoe_core.negative_cache import DEFAULT_NEGATIVE_TTL, NegativeCache, is_no_data_reason
+from entsoe_core.parse_cache import ParseCache
+from entsoe_core.payload import CHUNK_SIZE, MemoryPayloadWriter, Payload, PayloadStore, PayloadWriter
+from entsoe_core.pipeline import PIPELINE_DEPTH, BoundedExecutor
+from entsoe_core.planning import PlannedQuery, plan_batch
+from entsoe_core.resilience import (
+    RETRYABLE_STATUS_CODES,
+    CircuitBreaker,
+    RetryPolicy,
+    parse_retry_after,
+    shared_circuit_breaker,
+)
+from entsoe_core.response_cache import DEFAULT_SETTLEMENT_HORIZON, ResponseCache, normalize_params
+from entsoe_core.singleflight import AsyncSingleflight, Singleflight
+from entsoe_core.ratelimit import (
+    DEFAULT_BURST,
+    DEFAULT_QUOTA_LEDGER,
+    DEFAULT_RATE_PER_MINUTE,
+    TokenBucket,
+    host_bucket,
+    shared_bucket,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
 BASE_URL = "https://web-api.tp.entsoe.eu/api"
 DEFAULT_REQUEST_TIMEOUT = 60
 DEFAULT_REQUEST_DELAY = 0.5
+DEFAULT_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_MAX_WORKERS = 4
+# Batch workers times chunk workers can be in flight at once
+DEFAULT_POOL_SIZE = 16
+CIRCUIT_OPEN_ERROR = "circuit_open"
+# What a request leaves on disk: everything, only the raw XML, or nothing
+# (the parsed document is then returned in result["document"])
+OUTPUT_FULL = "full"
+OUTPUT_RAW = "raw"
+OUTPUT_MEMORY = "memory"
+OUTPUT_MODES = (OUTPUT_FULL, OUTPUT_RAW, OUTPUT_MEMORY)
+SERVICE_UNAVAILABLE_MESSAGE = (
+    "ENTSO-E APIs returns: 503 Service Temporarily Unavailable. Please, try again later"
+)
+
+# Concurrent identical API calls / requests share one execution
+_fetch_flights = Singleflight()
+_request_flights = Singleflight()
+_async_fetch_flights = AsyncSingleflight()
+_async_request_flights = AsyncSingleflight()
 
 
 @dataclass(frozen=True)
@@ -34,6 +101,32 @@ class EntsoeConfig:
     csv_dir: Path
     request_timeout: int
     request_delay: float
+    # Optional typed output next to JSON/CSV: "parquet" or "arrow" (needs pyarrow)
+    columnar_format: Optional[str] = None
+    columnar_dir: Optional[Path] = None
+    # Content-addressed cache of parsed responses (None disables it)
+    parse_cache_dir: Optional[Path] = None
+    # Processes used to parse the chunk files of a historical request
+    parse_workers: int = 1
+    # Requests run concurrently by run_batch
+    max_workers: int = 1
+    # Shared quota for API calls; None falls back to request_delay sleeps
+    rate_limiter: Optional[TokenBucket] = field(default=None, repr=False, compare=False)
+    # Keep-alive connection pool shared by all calls made with this config
+    session: Optional[requests.Session] = field(default=None, repr=False, compare=False)
+    pool_size: int = DEFAULT_POOL_SIZE
+    # Retries for 429/5xx responses and timeouts (None disables)
+    retry_policy: Optional[RetryPolicy] = RetryPolicy()
+    # Process-wide breaker for base_url: fails fast while the API is down
+    circuit_breaker: Optional[CircuitBreaker] = field(default=None, repr=False, compare=False)
+    # Raw API responses, reused until their finality-aware TTL expires
+    response_cache: Optional[ResponseCache] = field(default=None, repr=False, compare=False)
+    # Stored intervals per query; when set, only missing sub-intervals are fetched
+    coverage_index: Optional[CoverageIndex] = field(default=None, repr=False, compare=False)
+    # One of OUTPUT_MODES
+    output_mode: str = OUTPUT_FULL
+    # Queries answered with "no matching data"; repeats return the cached reason
+    negative_cache: Optional[NegativeCache] = field(default=None, repr=False, compare=False)
 
 
 def build_config(
@@ -43,13 +136,45 @@ def build_config(
     base_url: str = BASE_URL,
     request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
     request_delay: float = DEFAULT_REQUEST_DELAY,
+    columnar_format: Optional[str] = None,
+    parse_cache: bool = True,
+    parse_workers: int = DEFAULT_PARSE_WORKERS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limit_per_minute: Optional[float] = DEFAULT_RATE_PER_MINUTE,
+    rate_limit_burst: float = DEFAULT_BURST,
+    quota_ledger: Optional[Path] = DEFAULT_QUOTA_LEDGER,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    session: Optional[requests.Session] = None,
+    retry_policy: Optional[RetryPolicy] = RetryPolicy(),
+    circuit_breaker: bool = True,
+    response_cache: bool = True,
+    settlement_horizon: timedelta = DEFAULT_SETTLEMENT_HORIZON,
+    incremental: bool = False,
+    output_mode: str = OUTPUT_FULL,
+    negative_cache: bool = True,
 ) -> EntsoeConfig:
-    """Build a configuration object for ENTSO-E requests."""
+    """Build a configuration object for ENTSO-E requests.
+
+    Calls share a token bucket per API key (rate_limit_per_minute=None
+    disables it and restores the fixed request_delay between calls). The
+    bucket lives in the SQLite quota_ledger, so every process on the host
+    using the key shares it; quota_ledger=None limits this process only.
+    """
+    _check_output_mode(output_mode)
+    if columnar_format is not None and columnar_format not in COLUMNAR_FILE_FORMATS:
+        raise ValueError(
+            f"columnar_format must be one of {sorted(COLUMNAR_FILE_FORMATS)}, got {columnar_format!r}"
+        )
     root = project_root or Path(__file__).resolve().parents[2]
     resolved_output = output_dir or root / "results"
     xml_dir = resolved_output / "xml"
     json_dir = resolved_output / "json"
     csv_dir = resolved_output / "csv"
+    columnar_dir = resolved_output / columnar_format if columnar_format else None
+    parse_cache_dir = resolved_output / "cache" / "parsed" if parse_cache else None
+    response_cache_dir = resolved_output / "cache" / "responses"
+    coverage_dir = resolved_output / "cache" / "coverage"
+    negative_cache_dir = resolved_output / "cache" / "negative"
     return EntsoeConfig(
         api_key=api_key,
         base_url=base_url,
@@ -60,19 +185,120 @@ def build_config(
         csv_dir=csv_dir,
         request_timeout=request_timeout,
         request_delay=request_delay,
+        columnar_format=columnar_format,
+        columnar_dir=columnar_dir,
+        parse_cache_dir=parse_cache_dir,
+        parse_workers=max(1, parse_workers),
+        max_workers=max(1, max_workers),
+        rate_limiter=_rate_limiter(api_key, rate_limit_per_minute, rate_limit_burst, quota_ledger),
+        session=session or shared_session(base_url, pool_size),
+        pool_size=pool_size,
+        retry_policy=retry_policy,
+        circuit_breaker=shared_circuit_breaker(base_url) if circuit_breaker else None,
+        response_cache=(
+            ResponseCache(response_cache_dir, settlement_horizon) if response_cache else None
+        ),
+        coverage_index=CoverageIndex(coverage_dir, settlement_horizon) if incremental else None,
+        output_mode=output_mode,
+        negative_cache=(
+            NegativeCache(negative_cache_dir, settlement_horizon=settlement_horizon)
+            if negative_cache
+            else None
+        ),
     )
 
 
+def _rate_limiter(
+    api_key: str,
+    per_minute: Optional[float],
+    burst: float,
+    quota_ledger: Optional[Path],
+) -> Optional[TokenBucket]:
+    if not per_minute:
+        return None
+    if quota_ledger is None:
+        return shared_bucket(api_key, per_minute, burst)
+    return host_bucket(api_key, per_minute, burst, Path(quota_ledger))
+
+
+def _check_output_mode(output_mode: str) -> None:
+    if output_mode not in OUTPUT_MODES:
+        raise ValueError(f"output_mode must be one of {list(OUTPUT_MODES)}, got {output_mode!r}")
+
+
+def _with_output_mode(config: EntsoeConfig, output_mode: Optional[str]) -> EntsoeConfig:
+    """config, with output_mode overridden for a single call when given."""
+    if output_mode is None or output_mode == config.output_mode:
+        return config
+    _check_output_mode(output_mode)
+    return replace(config, output_mode=output_mode)
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """HTTP session with a keep-alive pool of pool_size connections per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+_sessions: Dict[Tuple[str, int], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def shared_session(base_url: str, pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Process-wide session for a base URL, so configs built per call reuse one pool."""
+    key = (base_url, pool_size)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = create_session(pool_size)
+            _sessions[key] = session
+        return session
+
+
 def setup_directories(config: EntsoeConfig) -> Dict[str, str]:
     """Create output directories if they don't exist."""
     config.xml_dir.mkdir(parents=True, exist_ok=True)
     config.json_dir.mkdir(parents=True, exist_ok=True)
     config.csv_dir.mkdir(parents=True, exist_ok=True)
-    return {
+    dirs = {
         "xml": str(config.xml_dir),
         "json": str(config.json_dir),
         "csv": str(config.csv_dir),
     }
+    if config.columnar_dir is not None:
+        config.columnar_dir.mkdir(parents=True, exist_ok=True)
+        dirs[config.columnar_format] = str(config.columnar_dir)
+    return dirs
+
+
+def columnar_output_path(name: str, config: EntsoeConfig) -> Optional[Path]:
+    """Path of the Parquet/Arrow output for a request, or None if disabled."""
+    if not config.columnar_format or config.columnar_dir is None:
+        return None
+    return config.columnar_dir / f"{name}{COLUMNAR_FILE_FORMATS[config.columnar_format]}"
+
+
+def get_parse_cache(config: EntsoeConfig) -> Optional[ParseCache]:
+    """Parse cache for this configuration, or None if disabled (read-only in OUTPUT_MEMORY)."""
+    if config.parse_cache_dir is None:
+        return None
+    return ParseCache(config.parse_cache_dir, read_only=config.output_mode == OUTPUT_MEMORY)
+
+
+def get_payload_store(config: EntsoeConfig) -> PayloadStore:
+    """Store that response bodies are streamed into before being saved."""
+    return PayloadStore(config.output_dir / "cache" / "payloads")
+
+
+def _payload_writer(config: EntsoeConfig) -> Union[PayloadWriter, MemoryPayloadWriter]:
+    """Where a response body is streamed to: the payload store, or memory in OUTPUT_MEMORY."""
+    if config.output_mode == OUTPUT_MEMORY:
+        return MemoryPayloadWriter()
+    return get_payload_store(config).writer()
 
 
 def format_datetime(dt: datetime) -> str:
@@ -102,28 +328,26 @@ def calculate_years_in_range(start_str: str, end_str: str) -> float:
     return delta.days / 365.25
 
 
-def split_into_yearly_chunks(start_str: str, end_str: str) -> List[tuple[str, str, str]]:
-    """Split a time range into yearly chunks."""
-    start = parse_api_datetime(start_str)
-    end = parse_api_datetime(end_str)
+def split_into_chunks(start_str: str, end_str: str, params: Dict[str, str]) -> List[tuple[str, str, str]]:
+    """
+    Split a time range into the fewest query windows allowed for the request's
+    documentType/processType (see entsoe_core.chunking).
 
+    Each chunk is (start, end, label); the label (the start time) names the
+    chunk's XML file and sorts chronologically.
+    """
+    windows = plan_windows(
+        parse_api_datetime(start_str), parse_api_datetime(end_str), max_query_span(params)
+    )
     chunks = []
-    current = start
-
-    while current < end:
-        year_end = datetime(current.year + 1, 1, 1, 0, 0, tzinfo=timezone.utc)
-        chunk_end = min(year_end, end)
-        chunk_start_str = format_datetime(current)
-        chunk_end_str = format_datetime(chunk_end)
-        year_label = str(current.year)
-        chunks.append((chunk_start_str, chunk_end_str, year_label))
-        current = year_end
-
+    for window_start, window_end in windows:
+        chunk_start_str = format_datetime(window_start)
+        chunks.append((chunk_start_str, format_datetime(window_end), chunk_start_str))
     return chunks
 
 
 def is_historical_request(params: Dict[str, str]) -> bool:
-    """Check if a request spans more than 1 year (requires splitting)."""
+    """Check if a request spans more than one query window (requires splitting)."""
     start = params.get("periodStart", "")
     end = params.get("periodEnd", "")
 
@@ -131,25 +355,364 @@ def is_historical_request(params: Dict[str, str]) -> bool:
         return False
 
     try:
-        years = calculate_years_in_range(start, end)
+        return len(split_into_chunks(start, end, params)) > 1
     except (ValueError, TypeError):
         return False
 
-    return years > 1.0
-
 
 def make_request(params: Dict[str, str], config: EntsoeConfig) -> Dict[str, Any]:
-    """Make a single API request."""
+    """
+    Make an API request, retrying transient failures per config.retry_policy.
+
+    Fresh cached responses are returned without calling the API; an expired
+    one is still served when the API cannot be reached.
+    """
+    cached = _cached_response(params, config)
+    if cached is not None:
+        return cached
+
+    response_data, shared = _fetch_flights.do(
+        _fetch_key(params, config), lambda: _fetch_with_retries(params, config)
+    )
+    return dict(response_data, shared=True) if shared else response_data
+
+
+def _fetch_key(params: Dict[str, str], config: EntsoeConfig) -> tuple:
+    """Identity of an upstream call: base URL plus normalized params."""
+    return (config.base_url, tuple(normalize_params(params).items()))
+
+
+def _request_key(params: Dict[str, str], name: str, config: EntsoeConfig) -> tuple:
+    """Identity of a whole request, including where and which files are written."""
+    return (str(config.output_dir), config.output_mode, name, *_fetch_key(params, config))
+
+
+def make_paged_request(params: Dict[str, str], config: EntsoeConfig) -> Dict[str, Any]:
+    """
+    make_request that also fetches the remaining `offset` pages when the first
+    response holds a full page of documents.
+
+    Pages are requested through a _PageWindow of up to max_workers concurrent
+    calls (one at a time without a rate limiter) until a short page arrives,
+    and merged into a single ZIP. The response then carries pages and
+    truncated (documents may be missing).
+    """
+    params = canonical_params(params)
+    first = make_request(params, config)
+    size = _capped_page_size(params, first)
+    if size is None:
+        return first
+
+    window = _PageWindow(size, config.max_workers if config.rate_limiter is not None else 1)
+    with ThreadPoolExecutor(max_workers=window.limit) as executor:
+        pending: Dict[Future, int] = {}
+        while True:
+            for offset in window.next_offsets():
+                if config.rate_limiter is None:
+                    time.sleep(config.request_delay)
+                pending[executor.submit(make_request, _page_params(params, offset), config)] = offset
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                response_data = future.result()
+                last = _is_last_page(response_data, size)
+                window.complete(pending.pop(future), response_data, last)
+    return _merge_pages([first, *window.pages()], size, config)
+
+
+class _PageWindow:
+    """
+    Which page offsets to request next.
+
+    Starts with one page in flight and allows one more per full page, up to
+    limit, so a result ending after a few pages wastes few calls on offsets
+    past its end. No offsets are handed out once a short page has arrived.
+    """
+
+    def __init__(self, size: int, limit: int) -> None:
+        self.size = size
+        self.limit = limit
+        self._offsets = iter(page_offsets(size))
+        self._width = 1
+        self._in_flight = 0
+        self._done = False
+        self._responses: Dict[int, Dict[str, Any]] = {}
+
+    def next_offsets(self) -> List[int]:
+        offsets = []
+        while not self._done and self._in_flight < self._width:
+            offset = next(self._offsets, None)
+            if offset is None:
+                self._done = True
+                break
+            self._in_flight += 1
+            offsets.append(offset)
+        return offsets
+
+    def complete(self, offset: int, response_data: Dict[str, Any], last: bool) -> None:
+        """Record a page; last is _is_last_page(response_data, size), computed by the caller."""
+        self._in_flight -= 1
+        self._responses[offset] = response_data
+        if last:
+            self._done = True
+        else:
+            self._width = min(self._width + 1, self.limit)
+
+    def pages(self) -> List[Dict[str, Any]]:
+        """Responses in offset order."""
+        return [self._responses[offset] for offset in sorted(self._responses)]
+
+
+def _capped_page_size(params: Dict[str, str], response_data: Dict[str, Any]) -> Optional[int]:
+    """Page size if the response is a full first page of a paged endpoint, else None."""
+    size = page_size(params)
+    payload = response_data.get("payload")
+    if size is None or payload is None or response_data.get("status_code") != 200:
+        return None
+    return size if count_documents(payload.source()) >= size else None
+
+
+def _page_params(params: Dict[str, str], offset: int) -> Dict[str, str]:
+    page_params = params.copy()
+    page_params["offset"] = str(offset)
+    return page_params
+
+
+def _is_last_page(response_data: Dict[str, Any], size: int) -> bool:
+    payload = response_data.get("payload")
+    if payload is None or _is_html_error(response_data.get("status_code"), payload):
+        return True
+    return count_documents(payload.source()) < size
+
+
+def _merge_pages(pages: List[Dict[str, Any]], size: int, config: EntsoeConfig) -> Dict[str, Any]:
+    """
+    Combine the responses of consecutive pages into one response.
+
+    Pages after a failed one are dropped. The result is truncated unless a
+    short (last) page was reached.
+    """
+    payloads = []
+    truncated = True
+    for response_data in pages:
+        payload = response_data.get("payload")
+        if payload is None or _is_html_error(response_data.get("status_code"), payload):
+            break
+        count = count_documents(payload.source())
+        if count:
+            payloads.append(payload)
+        if count < size:
+            truncated = False
+            break
+
+    if len(payloads) > 1:
+        writer = _payload_writer(config)
+        try:
+            merge_zip_files([payload.source() for payload in payloads], writer)
+        except BaseException:
+            writer.discard()
+            raise
+        payload = writer.commit()
+    else:
+        payload = payloads[0]
+
+    merged = dict(pages[0])
+    merged.update(
+        {
+            "payload": payload,
+            "pages": len(payloads),
+            "truncated": truncated,
+            "attempts": 1 + sum(page.get("attempts", 1) - 1 for page in pages),
+            "retry_wait": sum(page.get("retry_wait", 0.0) for page in pages),
+            "cache_hit": all(page.get("cache_hit") for page in pages),
+        }
+    )
+    return merged
+
+
+def _fetch_with_retries(params: Dict[str, str], config: EntsoeConfig) -> Dict[str, Any]:
+    attempt = 1
+    waited = 0.0
+    while True:
+        response_data = _send_request(params, config)
+        delay = _retry_delay(response_data, config, attempt)
+        if delay is None:
+            break
+        time.sleep(delay)
+        waited += delay
+        attempt += 1
+
+    response_data = _finish_response(params, config, response_data)
+    _remember_acknowledgement(params, config, response_data)
+    response_data["attempts"] = attempt
+    response_data["retry_wait"] = waited
+    return response_data
+
+
+def _cached_response(
+    params: Dict[str, str],
+    config: EntsoeConfig,
+    allow_stale: bool = False,
+) -> Optional[Dict[str, Any]]:
+    if config.response_cache is None:
+        return None
+    cached = config.response_cache.get(config.base_url, params, allow_stale=allow_stale)
+    if cached is None:
+        return None
+    return {
+        "status_code": cached["status_code"],
+        "payload": cached["payload"],
+        "cache_hit": True,
+        "cache_stale": cached["stale"],
+    }
+
+
+def _finish_response(
+    params: Dict[str, str],
+    config: EntsoeConfig,
+    response_data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Cache a successful response, or fall back to a stale cached one on failure.
+
+    OUTPUT_MEMORY responses are not cached, so that mode writes nothing to disk.
+    """
+    if config.response_cache is None:
+        return response_data
+
+    status_code = response_data.get("status_code")
+    payload = response_data.get("payload")
+    if payload is None or (status_code or 0) >= 500 or _is_html_error(status_code, payload):
+        return _cached_response(params, config, allow_stale=True) or response_data
+    if status_code == 200 and config.output_mode != OUTPUT_MEMORY:
+        config.response_cache.put(config.base_url, params, status_code, payload)
+    return response_data
+
+
+def _remember_acknowledgement(
+    params: Dict[str, str],
+    config: EntsoeConfig,
+    response_data: Dict[str, Any],
+) -> None:
+    """
+    Record a fetched "no matching data" acknowledgement in the negative cache under its own params.
+
+    Called per API call, so chunks and pages of larger requests are
+    remembered too, not only single-document requests.
+    """
+    if config.negative_cache is None or response_data.get("cache_hit"):
+        return
+    reason = _no_data_reason(response_data)
+    if reason is not None:
+        config.negative_cache.put(config.base_url, params, reason)
+
+
+def _send_request(params: Dict[str, str], config: EntsoeConfig) -> Dict[str, Any]:
+    """Make a single API call through the circuit breaker."""
+    rejected = _circuit_rejection(config)
+    if rejected is not None:
+        return rejected
+
     full_params = {"securityToken": config.api_key, **params}
+    writer = _payload_writer(config)
     try:
-        response = requests.get(
-            config.base_url, params=full_params, timeout=config.request_timeout
-        )
-        return {"status_code": response.status_code, "content": response.content}
+        if config.rate_limiter is not None:
+            config.rate_limiter.acquire()
+        client = config.session or requests
+        # Stream the body to disk instead of holding it in memory
+        with client.get(
+            config.base_url, params=full_params, timeout=config.request_timeout, stream=True
+        ) as response:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                writer.write(chunk)
+        response_data = {
+            "status_code": response.status_code,
+            "payload": writer.commit(),
+            "retry_after": response.headers.get("Retry-After"),
+        }
     except requests.exceptions.Timeout:
-        return {"status_code": None, "content": None, "error": "timeout"}
+        writer.discard()
+        response_data = {"status_code": None, "payload": None, "error": "timeout"}
     except requests.exceptions.RequestException as exc:
-        return {"status_code": None, "content": None, "error": str(exc)}
+        writer.discard()
+        response_data = {"status_code": None, "payload": None, "error": str(exc)}
+    except BaseException:
+        writer.discard()
+        _record_abort(config)
+        raise
+
+    _record_outcome(response_data, config)
+    return response_data
+
+
+def _record_abort(config: EntsoeConfig) -> None:
+    """Release a claimed half-open probe when the call is cancelled or crashes."""
+    if config.circuit_breaker is not None:
+        config.circuit_breaker.record_abort()
+
+
+def _circuit_rejection(config: EntsoeConfig) -> Optional[Dict[str, Any]]:
+    """Fail-fast response when the circuit is open, else None."""
+    breaker = config.circuit_breaker
+    if breaker is None or breaker.allow():
+        return None
+    return {
+        "status_code": None,
+        "payload": None,
+        "error": f"{CIRCUIT_OPEN_ERROR}: ENTSO-E API unavailable, next attempt in {breaker.retry_in():.0f}s",
+    }
+
+
+def _is_circuit_open(response_data: Dict[str, Any]) -> bool:
+    return (response_data.get("error") or "").startswith(CIRCUIT_OPEN_ERROR)
+
+
+def _record_outcome(response_data: Dict[str, Any], config: EntsoeConfig) -> None:
+    """Count timeouts, connection errors and 5xx responses against the breaker."""
+    breaker = config.circuit_breaker
+    if breaker is None:
+        return
+    status_code = response_data.get("status_code")
+    payload = response_data.get("payload")
+    if payload is None or (status_code or 0) >= 500 or _is_html_error(status_code, payload):
+        breaker.record_failure()
+    elif status_code == 429:
+        # Throttling says nothing about availability: keep the failure count,
+        # and a throttled probe waits for another cool-down
+        breaker.record_abort()
+    else:
+        breaker.record_success()
+
+
+def _retry_delay(response_data: Dict[str, Any], config: EntsoeConfig, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying this response, or None to stop."""
+    policy = config.retry_policy
+    if policy is None:
+        return None
+
+    payload = response_data.get("payload")
+    if payload is None:
+        if _is_circuit_open(response_data):
+            return None
+        if response_data.get("error") == "timeout" and not policy.retry_on_timeout:
+            return None
+    elif not (
+        response_data.get("status_code") in RETRYABLE_STATUS_CODES
+        or _is_html_error(response_data.get("status_code"), payload)
+    ):
+        return None
+
+    return policy.backoff(attempt, parse_retry_after(response_data.get("retry_after")))
+
+
+def _record_response_stats(result: Dict[str, Any], response_data: Dict[str, Any]) -> None:
+    result["retry_attempts"] += response_data.get("attempts", 1) - 1
+    result["retry_wait"] = round(result["retry_wait"] + response_data.get("retry_wait", 0.0), 3)
+    if response_data.get("cache_hit") and "chunks_cached" in result:
+        result["chunks_cached"] += 1
+    if response_data.get("truncated"):
+        result["truncated"] = True
 
 
 def _base_result(name: str, params: Dict[str, str]) -> Dict[str, Any]:
@@ -165,77 +728,286 @@ def _base_result(name: str, params: Dict[str, str]) -> Dict[str, Any]:
         "error": None,
         "api_message": None,
         "status_code": None,
+        "retry_attempts": 0,
+        "retry_wait": 0.0,
+        "cache_hit": False,
+        "truncated": False,
     }
 
 
-def _is_html_error(status_code: int | None, content: bytes) -> bool:
+def _is_html_error(status_code: int | None, payload: Payload) -> bool:
     if status_code == 503:
         return True
-    snippet = content[:1024].lower()
+    snippet = payload.head(1024).lower()
     return b"<html" in snippet and b"service temporarily unavailable" in snippet
 
 
 def process_request(params: Dict[str, str], name: str, config: EntsoeConfig) -> Dict[str, Any]:
     """Process a single request: fetch XML, save it, parse to JSON and CSV."""
     result = _base_result(name, params)
+    return _handle_response(result, make_paged_request(params, config), name, config)
+
+
+def _handle_response(
+    result: Dict[str, Any],
+    response_data: Dict[str, Any],
+    name: str,
+    config: EntsoeConfig,
+) -> Dict[str, Any]:
+    """Save a fetched response and parse it to JSON and CSV."""
+    payload = _save_response(result, response_data, name, config)
+    if payload is None:
+        return result
+
+    try:
+        columnar = parse_entsoe_columnar(
+            _parse_source(payload, name, config),
+            streaming=True,
+            cache=get_parse_cache(config),
+            workers=config.parse_workers,
+            content_sha256=payload.sha256,
+        )
+    except Exception as exc:  # pragma: no cover - bubbled to caller
+        result["error"] = f"parse_error: {exc}"
+        return result
+    return _write_outputs(result, columnar, name, config)
+
 
-    response_data = make_request(params, config)
+def _xml_path(name: str, config: EntsoeConfig) -> Path:
+    return config.xml_dir / f"{name}.xml"
+
+
+def _parse_source(payload: Payload, name: str, config: EntsoeConfig) -> Union[str, BinaryIO]:
+    """What a saved response is parsed from (the in-memory body when nothing is written)."""
+    if config.output_mode == OUTPUT_MEMORY:
+        return payload.source()
+    return str(_xml_path(name, config))
+
+
+def _save_response(
+    result: Dict[str, Any],
+    response_data: Dict[str, Any],
+    name: str,
+    config: EntsoeConfig,
+) -> Optional[Payload]:
+    """
+    Record a fetched response in result and save it as XML (unless the output
+    mode is OUTPUT_MEMORY); returns the payload if it should be parsed.
+    """
+    _record_response_stats(result, response_data)
+    result["cache_hit"] = bool(response_data.get("cache_hit"))
     result["status_code"] = response_data.get("status_code")
+    if "pages" in response_data:
+        result["pages"] = response_data["pages"]
 
-    response_content = response_data.get("content")
-    if response_content is None:
+    payload = response_data.get("payload")
+    if payload is None:
         result["error"] = response_data.get("error") or "request_failed"
-        return result
+        return None
 
-    if _is_html_error(result.get("status_code"), response_content):
-        message = "ENTSO-E APIs returns: 503 Service Temporarily Unavailable. Please, try again later"
-        xml_filename = f"{name}.xml"
-        xml_path = config.xml_dir / xml_filename
-        with open(xml_path, "wb") as file_handle:
-            file_handle.write(response_content)
+    if config.output_mode != OUTPUT_MEMORY:
+        xml_path = _xml_path(name, config)
+        payload.save_to(xml_path)
         result["files"].append({"type": "xml", "path": str(xml_path)})
+
+    if _is_html_error(result.get("status_code"), payload):
+        message = SERVICE_UNAVAILABLE_MESSAGE
         result["error"] = message
         result["api_message"] = message
-        return result
-
-    xml_filename = f"{name}.xml"
-    xml_path = config.xml_dir / xml_filename
+        return None
+    return payload
 
-    with open(xml_path, "wb") as file_handle:
-        file_handle.write(response_content)
 
-    result["files"].append({"type": "xml", "path": str(xml_path)})
+def _write_outputs(
+    result: Dict[str, Any],
+    columnar: ColumnarDocument,
+    name: str,
+    config: EntsoeConfig,
+) -> Dict[str, Any]:
+    """
+    Write a parsed document to JSON, CSV and the optional columnar format.
+
+    Other output modes skip these files and return the document in
+    result["document"] instead.
+    """
+    if columnar.no_data and is_no_data_reason(columnar.error) and config.negative_cache is not None:
+        config.negative_cache.put(config.base_url, result["params"], columnar.error)
+
+    if config.output_mode != OUTPUT_FULL:
+        _record_document(result, columnar)
+        result["document"] = columnar
+        return result
 
     try:
-        json_filename = f"{name}.json"
-        json_path = config.json_dir / json_filename
-        parsed = parse_entsoe_xml(str(xml_path), str(json_path))
+        json_path = config.json_dir / f"{name}.json"
+        with open(json_path, "w", encoding="utf-8") as file_handle:
+            json.dump(columnar.to_dict(), file_handle, indent=2, default=str)
 
         result["files"].append({"type": "json", "path": str(json_path)})
-        result["summary"]["timeseries_count"] = parsed.get("timeseriesCount", 0)
-        result["summary"]["data_points"] = parsed.get("totalDataPoints", 0)
-        result["success"] = True
-
-        if parsed.get("error"):
-            result["api_message"] = parsed.get("error", {}).get("text", "")
+        _record_document(result, columnar)
 
-        csv_filename = f"{name}.csv"
-        csv_path = config.csv_dir / csv_filename
-        csv_info = parsed_to_csv(parsed, str(csv_path))
+        csv_path = config.csv_dir / f"{name}.csv"
+        result["csv_info"] = parsed_to_csv(columnar, str(csv_path))
         result["files"].append({"type": "csv", "path": str(csv_path)})
-        result["csv_info"] = csv_info
+
+        columnar_path = columnar_output_path(name, config)
+        if columnar_path is not None:
+            parsed_to_columnar_file(columnar, str(columnar_path), config.columnar_format)
+            result["files"].append({"type": config.columnar_format, "path": str(columnar_path)})
     except Exception as exc:  # pragma: no cover - bubbled to caller
         result["error"] = f"parse_error: {exc}"
 
     return result
 
 
+def _record_document(result: Dict[str, Any], columnar: ColumnarDocument) -> None:
+    result["summary"]["timeseries_count"] = len(columnar.series)
+    result["summary"]["data_points"] = columnar.total_points
+    result["success"] = True
+
+    if columnar.error:
+        result["api_message"] = columnar.error.get("text", "")
+    if columnar.no_data:
+        result["no_data_reason"] = columnar.error
+
+
+def _negative_result(params: Dict[str, str], name: str, config: EntsoeConfig) -> Optional[Dict[str, Any]]:
+    """Result for a query recently answered with "no matching data", without calling the API."""
+    if config.negative_cache is None:
+        return None
+    reason = config.negative_cache.get(config.base_url, params)
+    if reason is None:
+        return None
+    result = _base_result(name, params)
+    result.update(
+        {
+            "success": True,
+            "cache_hit": True,
+            "api_message": reason.get("text", ""),
+            "no_data_reason": reason,
+        }
+    )
+    return result
+
+
 def process_historical_request(
     params: Dict[str, str],
     name: str,
     config: EntsoeConfig,
 ) -> Dict[str, Any]:
-    """Process a historical request (>1 year) by splitting into yearly chunks."""
+    """
+    Process a historical request by splitting it into the largest valid query windows.
+
+    Each chunk is parsed as soon as it is stored (large ones in the shared
+    parse process pool), so parsing overlaps the remaining downloads; fetch
+    workers wait when parsing falls PIPELINE_DEPTH chunks per parse worker
+    behind.
+    """
+    result, chunks, xml_subfolder = _start_historical(params, name, config)
+    cache = get_parse_cache(config)
+    parser = _bounded_parser(config)
+    parsed: Dict[str, Future] = {}
+
+    def store(chunk: tuple[str, str, str], response_data: Dict[str, Any]) -> None:
+        payload = response_data["payload"]
+        parsed[chunk[2]] = parse_in_pool(
+            _store_chunk(xml_subfolder, chunk, payload, config),
+            payload.size,
+            cache,
+            payload.sha256,
+            submit=parser.submit,
+        )
+
+    unavailable = _fetch_chunks(params, chunks, config, result, store)
+    documents = []
+    for chunk in chunks:
+        if chunk[2] not in parsed:
+            continue
+        try:
+            documents.append(parsed[chunk[2]].result())
+        except Exception as exc:
+            # Log but continue with other chunks
+            print(f"  ⚠️ Error parsing {chunk[2]}.xml: {exc}")
+
+    return _finish_historical(result, documents, name, config, unavailable)
+
+
+def _bounded_parser(config: EntsoeConfig) -> BoundedExecutor:
+    """The shared parse process pool, limited to PIPELINE_DEPTH pending parses per parse worker."""
+    return BoundedExecutor(SharedProcessPool(), PIPELINE_DEPTH * max(1, config.parse_workers))
+
+
+def _fetch_chunks(
+    params: Dict[str, str],
+    chunks: List[tuple[str, str, str]],
+    config: EntsoeConfig,
+    result: Dict[str, Any],
+    store: Callable[[tuple[str, str, str], Dict[str, Any]], None],
+    accept: Callable[[Dict[str, Any]], bool] = lambda response_data: True,
+) -> bool:
+    """
+    Fetch chunks (concurrently when a rate limiter is configured) and hand
+    each accepted response to store as it arrives.
+
+    Updates chunks_success and the retry/cache counters in result. Returns
+    True if the API was unavailable, in which case remaining chunks are skipped.
+    """
+    unavailable = threading.Event()
+    result_lock = threading.Lock()
+
+    def fetch_chunk(chunk: tuple[str, str, str]) -> bool:
+        if unavailable.is_set():
+            return False
+
+        response_data = make_paged_request(_chunk_params(params, chunk), config)
+        with result_lock:
+            _record_response_stats(result, response_data)
+        payload = response_data.get("payload")
+
+        if payload is None:
+            if _is_circuit_open(response_data):
+                unavailable.set()
+            return False
+
+        if _is_html_error(response_data.get("status_code"), payload):
+            unavailable.set()
+            return False
+
+        if not accept(response_data):
+            return False
+
+        store(chunk, response_data)
+        return True
+
+    if config.rate_limiter is not None and config.max_workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(config.max_workers, len(chunks))) as executor:
+            futures = [executor.submit(fetch_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                if future.result():
+                    result["chunks_success"] += 1
+                elif unavailable.is_set():
+                    # Stop early: drop chunks that have not started yet
+                    for pending in futures:
+                        pending.cancel()
+    else:
+        for i, chunk in enumerate(chunks, 1):
+            if fetch_chunk(chunk):
+                result["chunks_success"] += 1
+            if unavailable.is_set():
+                break
+
+            if i < len(chunks) and config.rate_limiter is None:
+                time.sleep(config.request_delay)
+
+    return unavailable.is_set()
+
+
+def _start_historical(
+    params: Dict[str, str],
+    name: str,
+    config: EntsoeConfig,
+) -> tuple[Dict[str, Any], List[tuple[str, str, str]], Path]:
+    """Build the result, chunk list and XML folder for a historical request."""
     result = _base_result(name, params)
     result.update(
         {
@@ -243,43 +1015,61 @@ def process_historical_request(
             "chunks_total": 0,
             "chunks_success": 0,
             "chunks_with_data": 0,
+            "chunks_cached": 0,
         }
     )
 
     start_str = params.get("periodStart", "")
     end_str = params.get("periodEnd", "")
-    chunks = split_into_yearly_chunks(start_str, end_str)
+    chunks = split_into_chunks(start_str, end_str, params)
     result["chunks_total"] = len(chunks)
 
     xml_subfolder = config.xml_dir / name
-    xml_subfolder.mkdir(parents=True, exist_ok=True)
-    result["files"].append({"type": "xml_folder", "path": str(xml_subfolder)})
+    if config.output_mode != OUTPUT_MEMORY:
+        xml_subfolder.mkdir(parents=True, exist_ok=True)
+        result["files"].append({"type": "xml_folder", "path": str(xml_subfolder)})
+    return result, chunks, xml_subfolder
 
-    for i, (chunk_start, chunk_end, year_label) in enumerate(chunks, 1):
-        chunk_params = params.copy()
-        chunk_params["periodStart"] = chunk_start
-        chunk_params["periodEnd"] = chunk_end
 
-        response_data = make_request(chunk_params, config)
-        response_content = response_data.get("content")
+def _chunk_params(params: Dict[str, str], chunk: tuple[str, str, str]) -> Dict[str, str]:
+    chunk_params = params.copy()
+    chunk_params["periodStart"] = chunk[0]
+    chunk_params["periodEnd"] = chunk[1]
+    return chunk_params
 
-        if response_content is None:
-            continue
 
-        if _is_html_error(response_data.get("status_code"), response_content):
-            message = "ENTSO-E APIs returns: 503 Service Temporarily Unavailable. Please, try again later"
-            result["error"] = message
-            result["api_message"] = message
-            break
+def _chunk_path(xml_subfolder: Path, chunk: tuple[str, str, str]) -> Path:
+    return xml_subfolder / f"{chunk[2]}.xml"
 
-        xml_path = xml_subfolder / f"{year_label}.xml"
-        with open(xml_path, "wb") as file_handle:
-            file_handle.write(response_content)
 
-        result["chunks_success"] += 1
+def _store_chunk(
+    xml_subfolder: Path,
+    chunk: tuple[str, str, str],
+    payload: Payload,
+    config: EntsoeConfig,
+) -> Union[str, BinaryIO]:
+    """Save a chunk's payload to the XML folder; returns what to parse."""
+    if config.output_mode == OUTPUT_MEMORY:
+        return payload.source()
+    path = _chunk_path(xml_subfolder, chunk)
+    payload.save_to(path)
+    return str(path)
+
+
+def _finish_historical(
+    result: Dict[str, Any],
+    documents: List[ColumnarDocument],
+    name: str,
+    config: EntsoeConfig,
+    unavailable: bool,
+) -> Dict[str, Any]:
+    """Merge the parsed chunks of a historical request into JSON and CSV."""
+    if unavailable:
+        message = SERVICE_UNAVAILABLE_MESSAGE
+        result["error"] = message
+        result["api_message"] = message
 
-        if i < len(chunks):
-            time.sleep(config.request_delay)
+    result["cache_hit"] = 0 < result["chunks_success"] == result["chunks_cached"]
 
     if result.get("error"):
         return result
@@ -288,61 +1078,504 @@ def process_historical_request(
         result["error"] = "all_chunks_failed"
         return result
 
+    if not documents:
+        result["error"] = "merge_error: could not parse any chunk"
+        return result
+
+    merged = merge_parsed_results(documents)
+    result["chunks_with_data"] = merged.extra.get("chunksWithData", 0)
+    return _write_outputs(result, merged, name, config)
+
+
+def _api_epoch(value: str) -> int:
+    return int(parse_api_datetime(value).timestamp())
+
+
+def _period_epochs(params: Dict[str, str]) -> tuple[int, int]:
+    return _api_epoch(params["periodStart"]), _api_epoch(params["periodEnd"])
+
+
+def _api_datetime_str(epoch: int) -> str:
+    return format_datetime(datetime.fromtimestamp(epoch, timezone.utc))
+
+
+def _is_incremental(params: Dict[str, str], config: EntsoeConfig) -> bool:
+    if config.coverage_index is None:
+        return False
     try:
-        json_path = config.json_dir / f"{name}.json"
-        csv_path = config.csv_dir / f"{name}.csv"
+        return _api_epoch(params["periodStart"]) < _api_epoch(params["periodEnd"])
+    except (KeyError, ValueError, TypeError):
+        return False
+
+
+def _load_incremental(
+    params: Dict[str, str],
+    config: EntsoeConfig,
+    unsaved: Optional[List[Dict[str, Any]]] = None,
+) -> tuple[Optional[ColumnarDocument], List[Dict[str, Any]]]:
+    """
+    Merge the segments covering the requested period; returns (document, segments).
+
+    unsaved are segments fetched but not stored (OUTPUT_MEMORY, see _store_segment).
+    """
+    index = config.coverage_index
+    start = _api_epoch(params["periodStart"])
+    end = _api_epoch(params["periodEnd"])
+    segments = [
+        segment for segment in index.segments(index.signature(config.base_url, params))
+        if segment["start"] < end and start < segment["end"]
+    ]
+    segments = sorted(segments + list(unsaved or []), key=lambda segment: segment["start"])
+    if not segments:
+        return None, []
+
+    cache = get_parse_cache(config)
+    parsed = [
+        parse_entsoe_columnar(
+            segment["payload"].source() if "payload" in segment else str(index.path(segment)),
+            streaming=True,
+            cache=cache,
+            workers=config.parse_workers,
+        ).slice(max(segment["start"], start), min(segment["end"], end))
+        for segment in segments
+    ]
+    return merge_parsed_results(parsed), segments
+
+
+def load_result_document(result: Dict[str, Any], config: EntsoeConfig) -> Optional[ColumnarDocument]:
+    """Parsed data behind a successful run_request result, or None if it has no single document."""
+    if result.get("document") is not None:
+        return result["document"]
+    if result.get("incremental"):
+        return _load_incremental(result["params"], config)[0]
+    if result.get("shared_fetch"):
+        if result.get("is_historical"):
+            document = _load_xml_folder(config.xml_dir / result["shared_fetch"], config)
+        else:
+            document = parse_entsoe_columnar(
+                str(_xml_path(result["shared_fetch"], config)),
+                streaming=True,
+                cache=get_parse_cache(config),
+                workers=config.parse_workers,
+            )
+        return None if document is None else document.slice(*_period_epochs(result["params"]))
+    files = result.get("files", [])
+    folder = next((f["path"] for f in files if f["type"] == "xml_folder"), None)
+    if folder is not None:
+        return _load_xml_folder(Path(folder), config)
+    xml_path = next((f["path"] for f in files if f["type"] == "xml"), None)
+    if xml_path is None:
+        return None
+    return parse_entsoe_columnar(
+        xml_path, streaming=True, cache=get_parse_cache(config), workers=config.parse_workers
+    )
+
+
+def _load_xml_folder(folder: Path, config: EntsoeConfig) -> Optional[ColumnarDocument]:
+    """Merged chunk files of a historical request, parsed as process_historical_request parses them."""
+    cache = get_parse_cache(config)
+    parsed = [
+        parse_in_pool(str(path), path.stat().st_size, cache) for path in sorted(folder.glob("*.xml"))
+    ]
+    documents = [future.result() for future in parsed]
+    return merge_parsed_results(documents) if documents else None
+
+
+def load_batch_documents(results: List[Dict[str, Any]], config: EntsoeConfig) -> List[ColumnarDocument]:
+    """
+    Parsed data of a batch's successful results, for combining them.
+
+    Requests answered by one shared fetch may overlap; each of their points is
+    included once.
+    """
+    documents = []
+    covered: Dict[str, List[tuple[int, int]]] = {}
+    for result in results:
+        if not result.get("success"):
+            continue
+        document = load_result_document(result, config)
+        if document is None:
+            continue
+        shared = result.get("shared_fetch")
+        if not shared:
+            documents.append(document)
+            continue
+        start, end = _period_epochs(result["params"])
+        for gap_start, gap_end in subtract_intervals(start, end, covered.get(shared, [])):
+            documents.append(document.slice(gap_start, gap_end))
+        covered.setdefault(shared, []).append((start, end))
+    return documents
 
-        parsed = parse_and_merge_xml_folder(
-            str(xml_subfolder), str(json_path), str(csv_path)
+
+def _is_acknowledgement(response_data: Dict[str, Any]) -> bool:
+    """Whether a response is an Acknowledgement_MarketDocument ("no matching data" or an error)."""
+    payload = response_data.get("payload")
+    if payload is None or response_data.get("status_code") not in (200, 400):
+        return False
+    return count_documents(payload.source()) == 0
+
+
+def _no_data_reason(response_data: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """The reason of a "no matching data" acknowledgement, or None for data and errors."""
+    if not _is_acknowledgement(response_data):
+        return None
+    reason = parse_entsoe_columnar(response_data["payload"].source()).error
+    return reason if is_no_data_reason(reason) else None
+
+
+def _is_coverable(response_data: Dict[str, Any]) -> bool:
+    """Whether a response answers its interval for the coverage index: data or "no matching data"."""
+    if _is_acknowledgement(response_data):
+        return _no_data_reason(response_data) is not None
+    return response_data.get("status_code") == 200
+
+
+def _start_incremental(
+    params: Dict[str, str],
+    name: str,
+    config: EntsoeConfig,
+) -> tuple[Dict[str, Any], List[tuple[str, str, str]]]:
+    """Build the result and the chunks covering the gaps of an incremental request."""
+    index = config.coverage_index
+    start = _api_epoch(params["periodStart"])
+    end = _api_epoch(params["periodEnd"])
+    signature = index.signature(config.base_url, params)
+
+    result = _base_result(name, params)
+    result.update(
+        {
+            "incremental": True,
+            "is_historical": is_historical_request(params),
+            "chunks_total": 0,
+            "chunks_success": 0,
+            "chunks_with_data": 0,
+            "chunks_cached": 0,
+            "fetched_intervals": [],
+        }
+    )
+    if config.output_mode != OUTPUT_MEMORY:
+        result["files"].append({"type": "xml_folder", "path": str(index.directory / signature)})
+
+    chunks: List[tuple[str, str, str]] = []
+    for gap_start, gap_end in index.gaps(signature, start, end):
+        chunks.extend(
+            split_into_chunks(_api_datetime_str(gap_start), _api_datetime_str(gap_end), params)
+        )
+    result["chunks_total"] = len(chunks)
+    result["fetched_intervals"] = [[chunk[0], chunk[1]] for chunk in chunks]
+    return result, chunks
+
+
+def _store_segment(
+    params: Dict[str, str],
+    chunk: tuple[str, str, str],
+    response_data: Dict[str, Any],
+    config: EntsoeConfig,
+    unsaved: List[Dict[str, Any]],
+) -> None:
+    """
+    Record a fetched chunk in the coverage index; acknowledgements expire like negative cache entries.
+
+    OUTPUT_MEMORY writes no segment files: the chunk is appended to unsaved
+    instead, and merged from memory (the index is only read in that mode).
+    """
+    index = config.coverage_index
+    if config.output_mode == OUTPUT_MEMORY:
+        unsaved.append(
+            {
+                "start": _api_epoch(chunk[0]),
+                "end": _api_epoch(chunk[1]),
+                "status_code": response_data.get("status_code") or 200,
+                "payload": response_data["payload"],
+            }
         )
+        return
+    acknowledged = _is_acknowledgement(response_data)
+    max_ttl = None
+    if acknowledged:
+        max_ttl = config.negative_cache.ttl if config.negative_cache is not None else DEFAULT_NEGATIVE_TTL
+    index.add(
+        index.signature(config.base_url, params),
+        params,
+        _api_epoch(chunk[0]),
+        _api_epoch(chunk[1]),
+        response_data["payload"],
+        complete=not response_data.get("truncated"),
+        status_code=response_data.get("status_code") or 200,
+        max_ttl=max_ttl,
+    )
 
-        result["files"].append({"type": "json", "path": str(json_path)})
-        result["files"].append({"type": "csv", "path": str(csv_path)})
-        result["summary"]["timeseries_count"] = parsed.get("timeseriesCount", 0)
-        result["summary"]["data_points"] = parsed.get("totalDataPoints", 0)
-        result["chunks_with_data"] = parsed.get("chunksWithData", 0)
-        result["csv_info"] = parsed.get("csvInfo", {})
-        result["success"] = True
+
+def _finish_incremental(
+    result: Dict[str, Any],
+    params: Dict[str, str],
+    name: str,
+    config: EntsoeConfig,
+    unavailable: bool,
+    unsaved: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Merge the stored (and unsaved) segments of an incremental request into JSON and CSV."""
+    if unavailable:
+        result["error"] = SERVICE_UNAVAILABLE_MESSAGE
+        result["api_message"] = SERVICE_UNAVAILABLE_MESSAGE
+        return result
+
+    chunks_total = result["chunks_total"]
+    result["cache_hit"] = 0 < result["chunks_success"] == result["chunks_cached"] or not chunks_total
+
+    try:
+        merged, segments = _load_incremental(params, config, unsaved)
     except Exception as exc:  # pragma: no cover - bubbled to caller
         result["error"] = f"merge_error: {exc}"
+        return result
+    result["segments"] = len(segments)
+    if merged is None:
+        result["error"] = "all_chunks_failed"
+        return result
 
-    return result
+    # 200 if any segment holds data, else the status the acknowledgements came with
+    status_codes = {segment.get("status_code", 200) for segment in segments}
+    result["status_code"] = 200 if 200 in status_codes else min(status_codes)
+    result["chunks_with_data"] = merged.extra.get("chunksWithData", 0)
+    return _write_outputs(result, merged, name, config)
+
+
+def process_incremental_request(
+    params: Dict[str, str],
+    name: str,
+    config: EntsoeConfig,
+) -> Dict[str, Any]:
+    """
+    Fetch only the parts of the period not yet in the coverage index, then
+    merge them with the stored segments into JSON and CSV for the full period.
+    """
+    result, chunks = _start_incremental(params, name, config)
+    unsaved: List[Dict[str, Any]] = []
+    unavailable = _fetch_chunks(
+        params,
+        chunks,
+        config,
+        result,
+        lambda chunk, response_data: _store_segment(params, chunk, response_data, config, unsaved),
+        accept=_is_coverable,
+    )
+    return _finish_incremental(result, params, name, config, unavailable, unsaved)
 
 
 def run_request(
     params: Dict[str, str],
     name: Optional[str] = None,
     config: Optional[EntsoeConfig] = None,
+    output_mode: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Run a single request and return a structured result."""
+    """
+    Run a single request and return a structured result.
+
+    output_mode overrides config.output_mode for this request. Identical
+    requests running concurrently are executed once and share the result.
+    """
     if config is None:
         raise ValueError("config is required for run_request")
+    config = _with_output_mode(config, output_mode)
+    params = canonical_params(params)
     request_name = name or params.get("name", "request")
-    if is_historical_request(params):
-        return process_historical_request(params, request_name, config)
-    return process_request(params, request_name, config)
+    negative = _negative_result(params, request_name, config)
+    if negative is not None:
+        return negative
+
+    def execute() -> Dict[str, Any]:
+        if _is_incremental(params, config):
+            return process_incremental_request(params, request_name, config)
+        if is_historical_request(params):
+            return process_historical_request(params, request_name, config)
+        return process_request(params, request_name, config)
+
+    result, shared = _request_flights.do(_request_key(params, request_name, config), execute)
+    return copy.deepcopy(result) if shared else result
 
 
 def run_batch(
     requests_list: List[Dict[str, Any]],
     config: Optional[EntsoeConfig] = None,
 ) -> Dict[str, Any]:
-    """Run all requests in the list and return structured results."""
+    """Run all requests in the list and return structured results.
+
+    Identical or overlapping requests for the same data are fetched once over
+    the union of their periods (see entsoe_core.planning); each result then
+    covers its own period and names the shared query in "shared_fetch".
+    Fetching, parsing and writing overlap (see _run_pipeline). With a rate
+    limiter, up to config.max_workers requests are fetched concurrently;
+    results are always returned in input order.
+    """
     if config is None:
         raise ValueError("config is required for run_batch")
+    requests_list = _canonical_requests(requests_list)
+
+    plan = plan_batch(requests_list)
+    queries = [_planned_request(query, requests_list, config) for query in plan]
+    if len(queries) > 1:
+        executed = _run_pipeline(queries, config)
+    else:
+        executed = [
+            run_request(req["params"], req.get("name"), config, req.get("output_mode"))
+            for req in queries
+        ]
+
+    results = _answer_requests(plan, executed, requests_list, config)
+    summary_payload = parse_results(results)
+    return {"results": results, **summary_payload}
 
-    results = []
-    total = len(requests_list)
 
-    for i, req in enumerate(requests_list, 1):
-        result = run_request(req["params"], req.get("name"), config)
-        results.append(result)
+def _canonical_requests(requests_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{**req, "params": canonical_params(req["params"])} for req in requests_list]
 
-        if i < total:
-            time.sleep(config.request_delay)
 
-    summary_payload = parse_results(results)
-    return {"results": results, **summary_payload}
+def _request_name(req: Dict[str, Any]) -> str:
+    return req.get("name") or req["params"].get("name", "request")
+
+
+def _planned_request(
+    query: PlannedQuery,
+    requests_list: List[Dict[str, Any]],
+    config: EntsoeConfig,
+) -> Dict[str, Any]:
+    """The request to execute for a planned query."""
+    if not query.shared:
+        return requests_list[query.members[0]]
+    # The union's raw XML is kept once; JSON/CSV are written per request
+    return {
+        "name": f"{_request_name(requests_list[query.members[0]])}_shared",
+        "params": query.params,
+        "output_mode": OUTPUT_MEMORY if config.output_mode == OUTPUT_MEMORY else OUTPUT_RAW,
+    }
+
+
+def _answer_requests(
+    plan: List[PlannedQuery],
+    executed: List[Dict[str, Any]],
+    requests_list: List[Dict[str, Any]],
+    config: EntsoeConfig,
+) -> List[Dict[str, Any]]:
+    """Map the results of the planned queries back to the batch, in input order."""
+    by_index: Dict[int, Dict[str, Any]] = {}
+    for query, query_result in zip(plan, executed):
+        if not query.shared:
+            by_index[query.members[0]] = query_result
+            continue
+        for position, index in enumerate(query.members):
+            by_index[index] = _slice_shared(
+                query_result, requests_list[index], config, keep_files=position == 0
+            )
+    return [by_index[index] for index in range(len(requests_list))]
+
+
+def _slice_shared(
+    shared_result: Dict[str, Any],
+    req: Dict[str, Any],
+    config: EntsoeConfig,
+    keep_files: bool,
+) -> Dict[str, Any]:
+    """Result of one request answered by a shared query: its own period of the shared data."""
+    name = _request_name(req)
+    params = req["params"]
+    result = {
+        key: copy.deepcopy(value)
+        for key, value in shared_result.items()
+        if key not in ("document", "files", "csv_info")
+    }
+    result.update(
+        {
+            "name": name,
+            "params": params,
+            "success": False,
+            # The shared raw files are listed once, on the first request
+            "files": list(shared_result["files"]) if keep_files else [],
+            "summary": {"timeseries_count": 0, "data_points": 0},
+            "shared_fetch": shared_result["name"],
+        }
+    )
+    document = shared_result.get("document")
+    if not shared_result.get("success") or document is None:
+        return result
+    return _write_outputs(result, document.slice(*_period_epochs(params)), name, config)
+
+
+def _run_pipeline(requests_list: List[Dict[str, Any]], config: EntsoeConfig) -> List[Dict[str, Any]]:
+    """
+    Run a batch as three overlapping stages: fetch, parse and write.
+
+    Fetch threads save each response and hand it to the shared parse process
+    pool (small ones are parsed in the fetch thread) while they move on to the
+    next request; a single writer thread produces the JSON and CSV files. At
+    most PIPELINE_DEPTH responses per parse worker are waiting to be parsed or
+    written, beyond that the fetch threads block. Historical
+    and incremental requests run whole in the fetch stage, they pipeline their
+    own chunks.
+    """
+    parse_workers = max(1, config.parse_workers)
+    # Without a rate limiter requests stay sequential with request_delay pauses
+    fetch_workers = config.max_workers if config.rate_limiter is not None else 1
+    cache = get_parse_cache(config)
+    parser = _bounded_parser(config)
+
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="entsoe-write"
+    ) as write_pool, ThreadPoolExecutor(
+        max_workers=min(fetch_workers, len(requests_list)), thread_name_prefix="entsoe-fetch"
+    ) as fetch_pool:
+        writer = BoundedExecutor(write_pool, PIPELINE_DEPTH * parse_workers)
+
+        def fetch(index: int, req: Dict[str, Any]) -> Dict[str, Any] | Future:
+            params = req["params"]
+            name = _request_name(req)
+            request_config = _with_output_mode(config, req.get("output_mode"))
+            negative = _negative_result(params, name, request_config)
+            if negative is not None:
+                return negative
+
+            if index and config.rate_limiter is None:
+                time.sleep(config.request_delay)
+
+            if _is_incremental(params, request_config) or is_historical_request(params):
+                return run_request(params, req.get("name"), request_config)
+
+            result = _base_result(name, params)
+            response_data = make_paged_request(params, request_config)
+            payload = _save_response(result, response_data, name, request_config)
+            if payload is None:
+                return result
+
+            parsed = parse_in_pool(
+                _parse_source(payload, name, request_config),
+                payload.size,
+                cache,
+                payload.sha256,
+                submit=parser.submit,
+            )
+            return writer.submit(_write_parsed, result, parsed, name, request_config)
+
+        fetched = [fetch_pool.submit(fetch, index, req) for index, req in enumerate(requests_list)]
+        results = []
+        for future in fetched:
+            outcome = future.result()
+            results.append(outcome.result() if isinstance(outcome, Future) else outcome)
+
+    return results
+
+
+def _write_parsed(
+    result: Dict[str, Any],
+    parsed: Future,
+    name: str,
+    config: EntsoeConfig,
+) -> Dict[str, Any]:
+    """Write stage of the batch pipeline: wait for the parse and write the outputs."""
+    try:
+        columnar = parsed.result()
+    except Exception as exc:  # pragma: no cover - bubbled to caller
+        result["error"] = f"parse_error: {exc}"
+        return result
+    return _write_outputs(result, columnar, name, config)
 
 
 def parse_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -374,3 +1607,340 @@ def parse_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         files.extend(result.get("files", []))
 
     return {"summary": summary, "files": files}
+
+
+_parse_executor: Optional[ThreadPoolExecutor] = None
+_parse_executor_lock = threading.Lock()
+
+
+def _get_parse_executor() -> ThreadPoolExecutor:
+    """Bounded executor for the blocking save/parse work of the async path."""
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            _parse_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_PARSE_WORKERS, thread_name_prefix="entsoe-parse"
+            )
+        return _parse_executor
+
+
+def _async_workers(config: EntsoeConfig) -> int:
+    # Without a rate limiter requests stay sequential with request_delay pauses
+    return config.max_workers if config.rate_limiter is not None else 1
+
+
+async def _pause(config: EntsoeConfig) -> None:
+    if config.rate_limiter is None:
+        await asyncio.sleep(config.request_delay)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_parse_executor(), func, *args)
+
+
+def create_async_client(config: EntsoeConfig) -> "httpx.AsyncClient":
+    """httpx.AsyncClient with a keep-alive pool sized like the sync session."""
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError("The async ENTSO-E client requires httpx (pip install httpx)") from exc
+
+    return httpx.AsyncClient(
+        timeout=config.request_timeout,
+        limits=httpx.Limits(
+            max_connections=config.pool_size,
+            max_keepalive_connections=config.pool_size,
+        ),
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
+
+
+async def make_request_async(
+    params: Dict[str, str],
+    config: EntsoeConfig,
+    client: "httpx.AsyncClient",
+) -> Dict[str, Any]:
+    """Async version of make_request."""
+    cached = await _run_blocking(_cached_response, params, config)
+    if cached is not None:
+        return cached
+
+    response_data, shared = await _async_fetch_flights.do(
+        _fetch_key(params, config), lambda: _fetch_with_retries_async(params, config, client)
+    )
+    return dict(response_data, shared=True) if shared else response_data
+
+
+async def make_paged_request_async(
+    params: Dict[str, str],
+    config: EntsoeConfig,
+    client: "httpx.AsyncClient",
+) -> Dict[str, Any]:
+    """Async version of make_paged_request."""
+    params = canonical_params(params)
+    first = await make_request_async(params, config, client)
+    # Counting documents reads the body; keep it off the event loop
+    size = await _run_blocking(_capped_page_size, params, first)
+    if size is None:
+        return first
+
+    window = _PageWindow(size, _async_workers(config))
+    pending: Dict["asyncio.Task[Dict[str, Any]]", int] = {}
+    try:
+        while True:
+            for offset in window.next_offsets():
+                await _pause(config)
+                task = asyncio.ensure_future(
+                    make_request_async(_page_params(params, offset), config, client)
+                )
+                pending[task] = offset
+            if not pending:
+                break
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                response_data = task.result()
+                last = await _run_blocking(_is_last_page, response_data, size)
+                window.complete(pending.pop(task), response_data, last)
+    finally:
+        for task in pending:
+            task.cancel()
+    return await _run_blocking(_merge_pages, [first, *window.pages()], size, config)
+
+
+async def _fetch_with_retries_async(
+    params: Dict[str, str],
+    config: EntsoeConfig,
+    client: "httpx.AsyncClient",
+) -> Dict[str, Any]:
+    attempt = 1
+    waited = 0.0
+    while True:
+        response_data = await _send_request_async(params, config, client)
+        delay = _retry_delay(response_data, config, attempt)
+        if delay is None:
+            break
+        await asyncio.sleep(delay)
+        waited += delay
+        attempt += 1
+
+    response_data = await _run_blocking(_finish_response, params, config, response_data)
+    await _run_blocking(_remember_acknowledgement, params, config, response_data)
+    response_data["attempts"] = attempt
+    response_data["retry_wait"] = waited
+    return response_data
+
+
+async def _send_request_async(
+    params: Dict[str, str],
+    config: EntsoeConfig,
+    client: "httpx.AsyncClient",
+) -> Dict[str, Any]:
+    import httpx
+
+    rejected = _circuit_rejection(config)
+    if rejected is not None:
+        return rejected
+
+    full_params = {"securityToken": config.api_key, **params}
+    # Creating the spool file and writing to it are disk I/O; keep them off the loop
+    writer = await _run_blocking(_payload_writer, config)
+    try:
+        if config.rate_limiter is not None:
+            # try_acquire may block on the SQLite-backed limiter
+            while (wait := await asyncio.to_thread(config.rate_limiter.try_acquire)) > 0:
+                await asyncio.sleep(wait)
+        async with client.stream("GET", config.base_url, params=full_params) as response:
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                await _run_blocking(writer.write, chunk)
+        response_data = {
+            "status_code": response.status_code,
+            "payload": await _run_blocking(writer.commit),
+            "retry_after": response.headers.get("Retry-After"),
+        }
+    except httpx.TimeoutException:
+        writer.discard()
+        response_data = {"status_code": None, "payload": None, "error": "timeout"}
+    except httpx.HTTPError as exc:
+        writer.discard()
+        response_data = {"status_code": None, "payload": None, "error": str(exc)}
+    except BaseException:
+        writer.discard()
+        _record_abort(config)
+        raise
+
+    _record_outcome(response_data, config)
+    return response_data
+
+
+async def process_request_async(
+    params: Dict[str, str],
+    name: str,
+    config: EntsoeConfig,
+    client: "httpx.AsyncClient",
+) -> Dict[str, Any]:
+    """Async version of process_request; saving and parsing run in the parse executor."""
+    result = _base_result(name, params)
+    response_data = await make_paged_request_async(params, config, client)
+    return await _run_blocking(_handle_response, result, response_data, name, config)
+
+
+async def process_historical_request_async(
+    params: Dict[str, str],
+    name: str,
+    config: EntsoeConfig,
+    client: "httpx.AsyncClient",
+) -> Dict[str, Any]:
+    """
+    Async version of process_historical_request.
+
+    Chunks are parsed as they arrive, large ones in the shared parse process pool.
+    """
+    result, chunks, xml_subfolder = await _run_blocking(_start_historical, params, name, config)
+    cache = get_parse_cache(config)
+    semaphore = asyncio.Semaphore(_async_workers(config))
+    unavailable = asyncio.Event()
+    documents: Dict[str, ColumnarDocument] = {}
+
+    async def fetch_chunk(chunk: tuple[str, str, str]) -> None:
+        async with semaphore:
+            if unavailable.is_set():
+                return
+            response_data = await make_paged_request_async(_chunk_params(params, chunk), config, client)
+            await _pause(config)
+        _record_response_stats(result, response_data)
+        payload = response_data.get("payload")
+
+        if payload is None:
+            if _is_circuit_open(response_data):
+                unavailable.set()
+            return
+
+        if _is_html_error(response_data.get("status_code"), payload):
+            unavailable.set()
+            return
+
+        path = await _run_blocking(_store_chunk, xml_subfolder, chunk, payload, config)
+        result["chunks_success"] += 1
+        try:
+            # Large chunks go to the shared parse process pool, as in the sync path
+            parsed = await _run_blocking(parse_in_pool, path, payload.size, cache, payload.sha256)
+            documents[chunk[2]] = await asyncio.wrap_future(parsed)
+        except Exception as exc:
+            # Log but continue with other chunks
+            print(f"  ⚠️ Error parsing {chunk[2]}.xml: {exc}")
+
+    await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+    parsed = [documents[chunk[2]] for chunk in chunks if chunk[2] in documents]
+    return await _run_blocking(
+        _finish_historical, result, parsed, name, config, unavailable.is_set()
+    )
+
+
+async def process_incremental_request_async(
+    params: Dict[str, str],
+    name: str,
+    config: EntsoeConfig,
+    client: "httpx.AsyncClient",
+) -> Dict[str, Any]:
+    """Async version of process_incremental_request; index updates run in the parse executor."""
+    result, chunks = await _run_blocking(_start_incremental, params, name, config)
+    semaphore = asyncio.Semaphore(_async_workers(config))
+    unavailable = asyncio.Event()
+    unsaved: List[Dict[str, Any]] = []
+
+    async def fetch_chunk(chunk: tuple[str, str, str]) -> None:
+        async with semaphore:
+            if unavailable.is_set():
+                return
+            response_data = await make_paged_request_async(_chunk_params(params, chunk), config, client)
+            await _pause(config)
+        _record_response_stats(result, response_data)
+        payload = response_data.get("payload")
+
+        if payload is None:
+            if _is_circuit_open(response_data):
+                unavailable.set()
+            return
+
+        if _is_html_error(response_data.get("status_code"), payload):
+            unavailable.set()
+            return
+
+        if not await _run_blocking(_is_coverable, response_data):
+            return
+        await _run_blocking(_store_segment, params, chunk, response_data, config, unsaved)
+        result["chunks_success"] += 1
+
+    await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    return await _run_blocking(
+        _finish_incremental, result, params, name, config, unavailable.is_set(), unsaved
+    )
+
+
+async def run_request_async(
+    params: Dict[str, str],
+    name: Optional[str] = None,
+    config: Optional[EntsoeConfig] = None,
+    client: Optional["httpx.AsyncClient"] = None,
+    output_mode: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Async version of run_request; a client is created when none is given."""
+    if config is None:
+        raise ValueError("config is required for run_request_async")
+    config = _with_output_mode(config, output_mode)
+    params = canonical_params(params)
+    if client is None:
+        async with create_async_client(config) as own_client:
+            return await run_request_async(params, name, config, own_client)
+
+    request_name = name or params.get("name", "request")
+    negative = await _run_blocking(_negative_result, params, request_name, config)
+    if negative is not None:
+        return negative
+
+    async def execute() -> Dict[str, Any]:
+        if _is_incremental(params, config):
+            return await process_incremental_request_async(params, request_name, config, client)
+        if is_historical_request(params):
+            return await process_historical_request_async(params, request_name, config, client)
+        return await process_request_async(params, request_name, config, client)
+
+    result, shared = await _async_request_flights.do(
+        _request_key(params, request_name, config), execute
+    )
+    return copy.deepcopy(result) if shared else result
+
+
+async def run_batch_async(
+    requests_list: List[Dict[str, Any]],
+    config: Optional[EntsoeConfig] = None,
+) -> Dict[str, Any]:
+    """
+    Async version of run_batch: up to config.max_workers requests at once,
+    with the same batch planning; input order kept.
+    """
+    if config is None:
+        raise ValueError("config is required for run_batch_async")
+    requests_list = _canonical_requests(requests_list)
+
+    plan = plan_batch(requests_list)
+    queries = [_planned_request(query, requests_list, config) for query in plan]
+    semaphore = asyncio.Semaphore(_async_workers(config))
+
+    async with create_async_client(config) as client:
+
+        async def run_one(req: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                result = await run_request_async(
+                    req["params"], req.get("name"), config, client, req.get("output_mode")
+                )
+                await _pause(config)
+                return result
+
+        executed = list(await asyncio.gather(*(run_one(req) for req in queries)))
+
+    results = await _run_blocking(_answer_requests, plan, executed, requests_list, config)
+    summary_payload = parse_results(results)
+    return {"results": results, **summary_payload}
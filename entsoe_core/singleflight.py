@@ -0,0 +1,99 @@
+"""Coalescing of concurrent identical calls (singleflight)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class Singleflight:
+    """
+    Thread-safe call group: while a call for a key is in flight, other
+    callers with the same key wait for it and receive its result.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run func once per in-flight key; returns (result, shared)."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class _LeaderCancelled(Exception):
+    """The leading call was cancelled; its followers make the call themselves."""
+
+
+class AsyncSingleflight:
+    """
+    Singleflight for coroutines running on one event loop.
+
+    Cancelling the leading caller (e.g. a client disconnecting) does not
+    cancel its followers: one of them takes over and makes the call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Await func once per in-flight key; returns (result, shared)."""
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        while loop_key in self._calls:
+            try:
+                # shield: a cancelled follower must not cancel the leader's call
+                return await asyncio.shield(self._calls[loop_key]), True
+            except _LeaderCancelled:
+                # The key is free again; retry, possibly as the new leader
+                continue
+
+        future = loop.create_future()
+        self._calls[loop_key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._calls[loop_key]
@@ -15,7 +15,6 @@ Structure:
 
 import json
 import os
-import time
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -128,13 +127,22 @@ def print_summary(results: List[Dict[str, Any]], output_dirs: Dict[str, str]):
             name = result.get("name")
             timeseries = result.get("summary", {}).get("timeseries_count", 0)
             points = result.get("summary", {}).get("data_points", 0)
-            if result.get("is_historical"):
+            if result.get("incremental"):
+                fetched = len(result.get("fetched_intervals", []))
+                segments_info = (
+                    f" ({result.get('chunks_with_data', 0)}/{result.get('segments', 0)} segments,"
+                    f" {fetched} fetched)"
+                )
+                print(f"   ✅ {name}: {timeseries} series, {points} points{segments_info}")
+            elif result.get("is_historical"):
                 chunks_info = (
                     f" ({result.get('chunks_with_data', 0)}/{result.get('chunks_total', 0)} chunks)"
                 )
                 print(f"   📅 {name}: {timeseries} series, {points} points{chunks_info}")
             else:
                 print(f"   ✅ {name}: {timeseries} series, {points} points")
+            if result.get("truncated"):
+                print(f"      ⚠️  {name}: document limit reached, some documents are missing")
 
     if no_data:
         print("\n⚠️  Files without data:")
@@ -161,7 +169,8 @@ def main():
 
     print(f"\n🔑 API Key: {API_KEY[:8]}...{API_KEY[-4:]}")
 
-    config = build_config(API_KEY, project_root=PROJECT_ROOT)
+    # Re-runs only fetch the parts of each period that are not stored yet
+    config = build_config(API_KEY, project_root=PROJECT_ROOT, incremental=True)
     output_dirs = setup_directories(config)
 
     print(f"📁 XML output: {output_dirs['xml']}")
@@ -188,9 +197,6 @@ def main():
         result = run_request(req["params"], req.get("name"), config)
         results.append(result)
 
-        if i < total:
-            time.sleep(config.request_delay)
-
     print_summary(results, output_dirs)
 
     print("\n✅ Done!")
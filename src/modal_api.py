@@ -13,7 +13,7 @@ from typing import Any, Dict, List
 
 import modal
 
-from entsoe_core import build_config, parse_results, run_request, setup_directories
+from entsoe_core import build_config, run_batch, setup_directories
 
 # =============================================================================
 # MODAL APP CONFIGURATION
@@ -94,13 +94,12 @@ def run_entsoe_requests(payload: Dict[str, Any]) -> Dict[str, Any]:
     )
     setup_directories(config)
 
-    results = [run_request(req["params"], req.get("name"), config) for req in requests_list]
-    summary_payload = parse_results(results)
+    # Paced by the shared API quota, with overlapping requests fetched once
+    batch = run_batch(requests_list, config)
 
     volume.commit()
 
     return {
-        "results": results,
+        **batch,
         "output_root": str(VOLUME_PATH),
-        **summary_payload,
     }
@@ -0,0 +1,121 @@
+"""Fake ENTSO-E sessions answering with generated documents."""
+
+import io
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+PRICE_DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">'
+    "<mRID>doc</mRID><type>A44</type>"
+    "<period.timeInterval><start>{start}</start><end>{end}</end></period.timeInterval>"
+    "<TimeSeries><mRID>1</mRID><businessType>A62</businessType>"
+    "<in_Domain.mRID>10YNL----------L</in_Domain.mRID>"
+    "<currency_Unit.name>EUR</currency_Unit.name><curveType>A01</curveType>"
+    "<Period><timeInterval><start>{start}</start><end>{end}</end></timeInterval>"
+    "<resolution>PT60M</resolution>{points}</Period></TimeSeries>"
+    "</Publication_MarketDocument>"
+)
+
+
+def _api_time(value):
+    return datetime.strptime(value, "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
+
+
+def price_document(period_start, period_end):
+    """Hourly price document covering [period_start, period_end) in API time format."""
+    start, end = _api_time(period_start), _api_time(period_end)
+    hours = int((end - start).total_seconds() // 3600)
+    points = "".join(
+        f"<Point><position>{position}</position><price.amount>{position % 97}.5</price.amount></Point>"
+        for position in range(1, hours + 1)
+    )
+    return PRICE_DOCUMENT.format(
+        start=start.strftime("%Y-%m-%dT%H:%MZ"), end=end.strftime("%Y-%m-%dT%H:%MZ"), points=points
+    ).encode("utf-8")
+
+
+def day_document(index):
+    """Price document for day `index` (0-based) of 2024."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=index)
+    end = start + timedelta(days=1)
+    return price_document(start.strftime("%Y%m%d%H%M"), end.strftime("%Y%m%d%H%M"))
+
+
+class FakeResponse:
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, size):
+        for start in range(0, len(self._body), size):
+            yield self._body[start : start + size]
+
+
+class PriceSession:
+    """Answers every call with an hourly price document for the requested period."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.calls.append(dict(params))
+        return FakeResponse(200, price_document(params["periodStart"], params["periodEnd"]))
+
+
+def zip_documents(documents):
+    """ZIP archive with one XML member per document, as the API sends document-based data."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for index, document in enumerate(documents):
+            archive.writestr(f"document_{index:04d}.xml", document)
+    return buffer.getvalue()
+
+
+class PagedSession:
+    """
+    A document-capped endpoint holding `total` one-day documents.
+
+    Each call returns the page of up to `size` documents starting at the
+    request's offset as a ZIP archive; past the end it returns NO_DATA.
+    """
+
+    def __init__(self, total, size):
+        self.total = total
+        self.size = size
+        self.offsets = []
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        offset = int(params.get("offset", 0))
+        self.offsets.append(offset)
+        count = max(0, min(self.size, self.total - offset))
+        if not count:
+            return FakeResponse(200, NO_DATA)
+        return FakeResponse(200, zip_documents([day_document(offset + i) for i in range(count)]))
+
+
+NO_DATA = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<Acknowledgement_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">'
+    b"<mRID>x</mRID><Reason><code>999</code><text>No matching data found for Data item</text></Reason>"
+    b"</Acknowledgement_MarketDocument>"
+)
+
+
+class ZipSession:
+    """Answers every call with the same ZIP archive of documents."""
+
+    def __init__(self, documents):
+        self.body = zip_documents(documents)
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.calls += 1
+        return FakeResponse(200, self.body)
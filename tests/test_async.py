@@ -0,0 +1,75 @@
+import asyncio
+import threading
+from dataclasses import replace
+
+import httpx
+
+from entsoe_core import service
+from entsoe_core.ratelimit import SQLiteTokenBucket
+from entsoe_core.service import build_config, run_batch_async, setup_directories
+
+from fakes import price_document
+
+
+ZONES = ["10YNL----------L", "10YBE----------2", "10YFR-RTE------C", "10Y1001A1001A82H"]
+
+
+class RecordingBucket(SQLiteTokenBucket):
+    """Ledger bucket that remembers which threads took tokens."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.threads = []
+
+    def try_acquire(self, tokens=1):
+        self.threads.append(threading.current_thread())
+        return super().try_acquire(tokens)
+
+
+def _handler(request):
+    params = request.url.params
+    return httpx.Response(200, content=price_document(params["periodStart"], params["periodEnd"]))
+
+
+def test_batch_takes_tokens_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        service,
+        "create_async_client",
+        lambda config: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        rate_limit_per_minute=None,
+        request_delay=0,
+        circuit_breaker=False,
+        quota_ledger=None,
+        max_workers=3,
+    )
+    setup_directories(config)
+    bucket = RecordingBucket(tmp_path / "ledger.sqlite", "token", 1000.0, 10)
+    config = replace(config, rate_limiter=bucket)
+    batch = [
+        {
+            "name": zone,
+            "params": {
+                "documentType": "A44",
+                "in_Domain": zone,
+                "out_Domain": zone,
+                "periodStart": "202401010000",
+                "periodEnd": "202401020000",
+            },
+        }
+        for zone in ZONES
+    ]
+
+    loop_threads = []
+
+    async def run():
+        loop_threads.append(threading.current_thread())
+        return await run_batch_async(batch, config)
+
+    results = asyncio.run(run())["results"]
+    assert [result["success"] for result in results] == [True] * 4
+    assert len(bucket.threads) == 4
+    assert loop_threads[0] not in bucket.threads
@@ -0,0 +1,53 @@
+from entsoe_core.service import build_config, load_batch_documents, run_batch, setup_directories
+
+from fakes import PriceSession
+
+
+def _config(tmp_path, session, **overrides):
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=session,
+        rate_limit_per_minute=None,
+        request_delay=0,
+        circuit_breaker=False,
+        quota_ledger=None,
+        **overrides,
+    )
+    setup_directories(config)
+    return config
+
+
+def _prices(name, start, end):
+    return {
+        "name": name,
+        "params": {
+            "documentType": "A44",
+            "in_Domain": "10YNL----------L",
+            "out_Domain": "10YNL----------L",
+            "periodStart": start,
+            "periodEnd": end,
+        },
+    }
+
+
+def test_overlapping_historical_requests_share_a_fetch(tmp_path):
+    session = PriceSession()
+    config = _config(tmp_path, session)
+    batch = [
+        _prices("early", "201901010000", "202101010000"),
+        _prices("late", "202001010000", "202201010000"),
+        _prices("week", "202401010000", "202401080000"),
+    ]
+
+    results = run_batch(batch, config)["results"]
+    assert [result["success"] for result in results] == [True, True, True]
+    assert results[0]["shared_fetch"] == results[1]["shared_fetch"]
+    assert [result["summary"]["data_points"] for result in results] == [17544, 17544, 168]
+    # 2019-2022 in yearly chunks plus the week
+    assert len(session.calls) == 4
+
+    documents = load_batch_documents(results, config)
+    assert len(documents) == 3
+    # The overlapping year is counted once
+    assert [document.total_points for document in documents] == [17544, 8760, 168]
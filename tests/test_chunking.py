@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from entsoe_core.chunking import DEFAULT_MAX_SPAN, MaxSpan, max_query_span, plan_windows
+
+
+def test_ace_is_limited_to_a_day_but_imbalance_volumes_are_not():
+    assert max_query_span({"documentType": "A86", "businessType": "B33"}) == MaxSpan(days=1)
+    assert max_query_span({"documentType": "A86"}) == DEFAULT_MAX_SPAN
+    assert max_query_span({"documentType": "A86", "businessType": "A19"}) == DEFAULT_MAX_SPAN
+
+
+def test_limits_hold_for_any_process_type():
+    for process_type in (None, "A16", "A47"):
+        params = {"documentType": "A73", "processType": process_type}
+        assert max_query_span(params) == MaxSpan(days=1)
+    assert max_query_span({"documentType": "A37", "processType": "A51"}) == MaxSpan(days=1)
+    assert max_query_span({"documentType": "A65", "processType": "A01"}) == DEFAULT_MAX_SPAN
+
+
+def test_windows_are_the_fewest_valid_ones():
+    start, end = datetime(2023, 6, 15), datetime(2025, 1, 1)
+    assert plan_windows(start, end, DEFAULT_MAX_SPAN) == [
+        (datetime(2023, 6, 15), datetime(2024, 6, 15)),
+        (datetime(2024, 6, 15), datetime(2025, 1, 1)),
+    ]
+    assert len(plan_windows(datetime(2024, 1, 1), datetime(2024, 1, 4), MaxSpan(days=1))) == 3
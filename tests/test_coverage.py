@@ -0,0 +1,151 @@
+from entsoe_core.coverage import CoverageIndex, subtract_intervals
+from entsoe_core.payload import PayloadStore
+from entsoe_core.service import build_config, run_request, setup_directories
+
+from fakes import FakeResponse
+
+ACK = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<Acknowledgement_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">'
+    b"<mRID>x</mRID><Reason><code>999</code><text>No matching data found for Data item</text></Reason>"
+    b"</Acknowledgement_MarketDocument>"
+)
+LIMIT_ACK = ACK.replace(
+    b"No matching data found for Data item", b"The amount of requested data exceeds allowed limit"
+)
+
+
+def test_subtract_nothing_covered():
+    assert subtract_intervals(0, 10, []) == [(0, 10)]
+
+
+def test_subtract_fully_covered():
+    assert subtract_intervals(2, 8, [(0, 10)]) == []
+
+
+def test_subtract_leaves_inner_and_outer_gaps():
+    assert subtract_intervals(0, 20, [(12, 15), (3, 5)]) == [(0, 3), (5, 12), (15, 20)]
+
+
+def test_subtract_merges_overlapping_and_touching_segments():
+    assert subtract_intervals(0, 20, [(2, 6), (4, 8), (8, 10)]) == [(0, 2), (10, 20)]
+
+
+def test_subtract_ignores_segments_outside_window():
+    assert subtract_intervals(10, 20, [(0, 5), (25, 30)]) == [(10, 20)]
+
+
+def _payload(tmp_path, data):
+    writer = PayloadStore(tmp_path / "payloads").writer()
+    writer.write(data)
+    return writer.commit()
+
+
+def test_index_gaps_after_add(tmp_path):
+    index = CoverageIndex(tmp_path / "coverage")
+    params = {"documentType": "A44", "periodStart": "201001010000", "periodEnd": "201002010000"}
+    signature = index.signature("https://api", params)
+    index.add(signature, params, 100, 200, _payload(tmp_path, b"<xml/>"))
+    assert index.gaps(signature, 0, 300) == [(0, 100), (200, 300)]
+
+
+class _AckSession:
+    """Answers every call with an acknowledgement, like the API for a missing production type."""
+
+    def __init__(self, status_code, body=ACK):
+        self.status_code = status_code
+        self.body = body
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.calls += 1
+        return FakeResponse(self.status_code, self.body)
+
+
+def _incremental_config(tmp_path, session):
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=session,
+        rate_limit_per_minute=None,
+        request_delay=0,
+        incremental=True,
+        negative_cache=False,
+        circuit_breaker=False,
+        quota_ledger=None,
+    )
+    setup_directories(config)
+    return config
+
+
+def test_incremental_acknowledgement_is_covered(tmp_path):
+    session = _AckSession(400)
+    config = _incremental_config(tmp_path, session)
+    params = {"documentType": "A75", "psrType": "B01", "periodStart": "201501010000", "periodEnd": "201701010000"}
+
+    result = run_request(params, "ack", config)
+    assert result["success"]
+    assert result["error"] is None
+    assert result["status_code"] == 400
+    assert result["api_message"] == "No matching data found for Data item"
+    assert result["no_data_reason"]["code"] == "999"
+    calls = session.calls
+    assert calls > 0
+
+    again = run_request(params, "ack_again", config)
+    assert session.calls == calls
+    assert again["success"]
+    assert again["cache_hit"]
+    assert again["status_code"] == 400
+    assert again["no_data_reason"]["code"] == "999"
+
+
+def test_acknowledged_chunks_enter_negative_cache(tmp_path):
+    session = _AckSession(200)
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=session,
+        rate_limit_per_minute=None,
+        request_delay=0,
+        response_cache=False,
+        circuit_breaker=False,
+        quota_ledger=None,
+    )
+    setup_directories(config)
+    params = {"documentType": "A75", "psrType": "B01", "periodStart": "201501010000", "periodEnd": "201701010000"}
+
+    result = run_request(params, "ack", config)
+    assert result["no_data_reason"]["code"] == "999"
+    first_chunk = {**params, "periodEnd": "201601010000"}
+    assert config.negative_cache.get(config.base_url, first_chunk)["code"] == "999"
+    assert config.negative_cache.get(config.base_url, params)["code"] == "999"
+
+    calls = session.calls
+    run_request(first_chunk, "chunk", config)
+    assert session.calls == calls
+
+
+def test_error_acknowledgement_is_neither_covered_nor_negative_cached(tmp_path):
+    session = _AckSession(400, LIMIT_ACK)
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=session,
+        rate_limit_per_minute=None,
+        request_delay=0,
+        incremental=True,
+        circuit_breaker=False,
+        quota_ledger=None,
+    )
+    setup_directories(config)
+    params = {"documentType": "A75", "psrType": "B01", "periodStart": "201501010000", "periodEnd": "201701010000"}
+
+    run_request(params, "limit", config)
+    calls = session.calls
+    assert calls > 0
+    assert config.negative_cache.get(config.base_url, params) is None
+    assert config.negative_cache.get(config.base_url, {**params, "periodEnd": "201601010000"}) is None
+
+    run_request(params, "limit_again", config)
+    assert session.calls == 2 * calls
@@ -0,0 +1,78 @@
+from entsoe_core.service import build_config, run_batch, run_request, setup_directories
+
+from fakes import PriceSession
+
+
+def _config(tmp_path, session, **overrides):
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=session,
+        rate_limit_per_minute=None,
+        request_delay=0,
+        circuit_breaker=False,
+        quota_ledger=None,
+        **overrides,
+    )
+    setup_directories(config)
+    return config
+
+
+def _params(start, end):
+    return {
+        "documentType": "A44",
+        "in_Domain": "10YNL----------L",
+        "out_Domain": "10YNL----------L",
+        "periodStart": start,
+        "periodEnd": end,
+    }
+
+
+def _files(directory):
+    return sorted(str(path.relative_to(directory)) for path in directory.rglob("*") if path.is_file())
+
+
+def test_memory_mode_writes_nothing(tmp_path):
+    session = PriceSession()
+    config = _config(tmp_path, session, output_mode="memory")
+
+    single = run_request(_params("202401010000", "202401080000"), "week", config)
+    historical = run_request(_params("202001010000", "202201010000"), "years", config)
+    batch = run_batch(
+        [
+            {"name": "a", "params": _params("202301010000", "202302010000")},
+            {"name": "b", "params": _params("202301150000", "202303010000")},
+        ],
+        config,
+    )
+
+    assert single["document"].total_points == 168
+    assert historical["document"].total_points == 17544
+    assert [result["document"].total_points for result in batch["results"]] == [744, 1080]
+    assert all(not result["files"] for result in [single, historical, *batch["results"]])
+    assert _files(tmp_path) == []
+
+
+def test_memory_mode_incremental_writes_nothing(tmp_path):
+    session = PriceSession()
+    config = _config(tmp_path, session, output_mode="memory", incremental=True)
+    params = _params("202001010000", "202201010000")
+
+    result = run_request(params, "years", config)
+    assert result["document"].total_points == 17544
+    assert _files(tmp_path) == []
+
+    # Nothing was stored, so the period is fetched again
+    calls = len(session.calls)
+    assert run_request(params, "again", config)["document"].total_points == 17544
+    assert len(session.calls) == 2 * calls
+
+
+def test_raw_mode_keeps_only_xml(tmp_path):
+    session = PriceSession()
+    config = _config(tmp_path, session, output_mode="raw", response_cache=False)
+
+    result = run_request(_params("202401010000", "202401080000"), "week", config)
+    assert result["document"].total_points == 168
+    assert [entry["type"] for entry in result["files"]] == ["xml"]
+    assert [path for path in _files(tmp_path) if not path.startswith("cache/")] == ["xml/week.xml"]
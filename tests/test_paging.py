@@ -0,0 +1,94 @@
+import pytest
+
+from entsoe_core import chunking
+from entsoe_core.chunking import canonical_params
+from entsoe_core.service import build_config, run_request, setup_directories
+
+from fakes import PagedSession
+
+
+def _config(tmp_path, session):
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=session,
+        rate_limit_per_minute=None,
+        request_delay=0,
+        response_cache=False,
+        negative_cache=False,
+        circuit_breaker=False,
+        quota_ledger=None,
+    )
+    setup_directories(config)
+    return config
+
+
+def _small_pages(monkeypatch, size=2, max_offset=6):
+    monkeypatch.setitem(chunking.PAGE_SIZES, "A80", size)
+    monkeypatch.setattr(chunking, "MAX_OFFSET", max_offset)
+
+
+PARAMS = {
+    "documentType": "A80",
+    "BiddingZone_Domain": "10YNL----------L",
+    "periodStart": "202401010000",
+    "periodEnd": "202402010000",
+}
+
+
+def test_paging_stops_at_short_page(tmp_path, monkeypatch):
+    _small_pages(monkeypatch)
+    session = PagedSession(total=5, size=2)
+
+    result = run_request(PARAMS, "outages", _config(tmp_path, session))
+    assert session.offsets == [0, 2, 4]
+    assert result["pages"] == 3
+    assert not result.get("truncated")
+    assert result["summary"]["data_points"] == 5 * 24
+
+
+def test_paging_ends_at_max_offset(tmp_path, monkeypatch):
+    _small_pages(monkeypatch)
+    session = PagedSession(total=100, size=2)
+
+    result = run_request(PARAMS, "outages", _config(tmp_path, session))
+    assert session.offsets == [0, 2, 4, 6]
+    assert result["pages"] == 4
+    assert result["truncated"]
+    assert result["summary"]["data_points"] == 8 * 24
+
+
+def test_page_past_the_end_is_not_merged(tmp_path, monkeypatch):
+    _small_pages(monkeypatch)
+    session = PagedSession(total=4, size=2)
+
+    result = run_request(PARAMS, "outages", _config(tmp_path, session))
+    # The third page is an acknowledgement: two pages of data, complete
+    assert session.offsets == [0, 2, 4]
+    assert result["pages"] == 2
+    assert not result.get("truncated")
+    assert result["summary"]["data_points"] == 4 * 24
+
+
+def test_explicit_offset_is_not_paged(tmp_path, monkeypatch):
+    _small_pages(monkeypatch)
+    session = PagedSession(total=100, size=2)
+
+    result = run_request({**PARAMS, "offset": "4"}, "page", _config(tmp_path, session))
+    assert session.offsets == [4]
+    assert result["summary"]["data_points"] == 2 * 24
+
+
+def test_capitalised_offset_is_an_explicit_page(tmp_path, monkeypatch):
+    _small_pages(monkeypatch)
+    session = PagedSession(total=100, size=2)
+
+    result = run_request({**PARAMS, "Offset": "4"}, "page", _config(tmp_path, session))
+    assert session.offsets == [4]
+    assert result["params"]["offset"] == "4"
+    assert "Offset" not in result["params"]
+
+
+def test_conflicting_offsets_are_rejected():
+    with pytest.raises(ValueError):
+        canonical_params({**PARAMS, "offset": "0", "Offset": "4"})
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from entsoe_core import parser
+from entsoe_core.parse_cache import ParseCache, decode_document, encode_document
+from entsoe_core.parser import parse_entsoe_columnar
+from entsoe_core.service import build_config, run_request, setup_directories
+
+from fakes import PriceSession
+
+DATA = Path(__file__).parent / "data"
+
+
+def test_encoded_document_roundtrips():
+    doc = parse_entsoe_columnar(str(DATA / "imbalance_categories.xml"))
+    assert decode_document(encode_document(doc)).to_dict() == doc.to_dict()
+
+
+def test_unchanged_payload_is_not_parsed_again(tmp_path, monkeypatch):
+    cache = ParseCache(tmp_path / "parsed")
+    path = str(DATA / "prices_ns.xml")
+    first = parse_entsoe_columnar(path, streaming=True, cache=cache)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed again")
+
+    monkeypatch.setattr(parser, "ENTSOEStreamingParser", fail)
+    monkeypatch.setattr(parser, "ENTSOEXMLParser", fail)
+    assert parse_entsoe_columnar(path, streaming=True, cache=cache).to_dict() == first.to_dict()
+
+
+def test_read_only_cache_stores_nothing(tmp_path):
+    cache = ParseCache(tmp_path / "parsed", read_only=True)
+    parse_entsoe_columnar(str(DATA / "prices_ns.xml"), cache=cache)
+    assert not (tmp_path / "parsed").exists()
+
+
+def test_repeated_request_loads_the_parse_cache(tmp_path, monkeypatch):
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=PriceSession(),
+        rate_limit_per_minute=None,
+        request_delay=0,
+        response_cache=False,
+        circuit_breaker=False,
+        quota_ledger=None,
+    )
+    setup_directories(config)
+    params = {"documentType": "A44", "periodStart": "202401010000", "periodEnd": "202401020000"}
+    assert run_request(params, "day", config)["summary"]["data_points"] == 24
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed again")
+
+    monkeypatch.setattr(parser, "ENTSOEStreamingParser", fail)
+    again = run_request(params, "day_again", config)
+    assert again["error"] is None
+    assert again["summary"]["data_points"] == 24
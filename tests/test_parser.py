@@ -0,0 +1,94 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from entsoe_core import parser
+from entsoe_core.parser import (
+    get_process_pool,
+    parse_and_merge_xml_folder,
+    parse_entsoe_columnar,
+    parse_in_pool,
+)
+from entsoe_core.service import build_config, run_request, setup_directories
+
+from fakes import ZipSession, day_document, zip_documents
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">
+  <mRID>doc</mRID>
+  <type>A44</type>
+  <period.timeInterval><start>{start}</start><end>{end}</end></period.timeInterval>
+  <TimeSeries>
+    <mRID>1</mRID>
+    <businessType>A62</businessType>
+    <in_Domain.mRID>10YNL----------L</in_Domain.mRID>
+    <currency_Unit.name>EUR</currency_Unit.name>
+    <curveType>A01</curveType>
+    <Period>
+      <timeInterval><start>{start}</start><end>{end}</end></timeInterval>
+      <resolution>PT60M</resolution>
+      <Point><position>1</position><price.amount>10.5</price.amount></Point>
+      <Point><position>2</position><price.amount>11.5</price.amount></Point>
+    </Period>
+  </TimeSeries>
+</Publication_MarketDocument>
+"""
+
+
+def _write(path, start="2024-01-01T00:00Z", end="2024-01-01T02:00Z"):
+    path.write_text(DOCUMENT.format(start=start, end=end), encoding="utf-8")
+    return str(path)
+
+
+def _break_pool():
+    with pytest.raises(BrokenProcessPool):
+        get_process_pool().submit(os._exit, 1).result()
+
+
+def test_parse_recovers_from_broken_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(parser, "PROCESS_PARSE_MIN_BYTES", 0)
+    path = _write(tmp_path / "a.xml")
+    _break_pool()
+
+    doc = parse_in_pool(path, os.path.getsize(path)).result(timeout=60)
+    assert doc.total_points == 2
+    assert parse_in_pool(path, os.path.getsize(path)).result(timeout=60).total_points == 2
+
+
+def test_folder_parse_recovers_from_broken_pool(tmp_path):
+    folder = tmp_path / "chunks"
+    folder.mkdir()
+    _write(folder / "2024.xml")
+    _write(folder / "2025.xml", "2025-01-01T00:00Z", "2025-01-01T02:00Z")
+    _break_pool()
+
+    merged = parse_and_merge_xml_folder(str(folder), workers=2)
+    assert sum(len(p["points"]) for ts in merged["timeseries"] for p in ts["periods"]) == 4
+
+
+def test_every_zip_member_is_parsed(tmp_path):
+    path = tmp_path / "response.zip"
+    path.write_bytes(zip_documents([day_document(0), day_document(1)]))
+
+    for streaming in (False, True):
+        doc = parse_entsoe_columnar(str(path), streaming)
+        assert doc.total_points == 48
+        assert doc.extra["chunksWithData"] == 2
+
+
+def test_request_answered_with_a_two_member_zip(tmp_path):
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=ZipSession([day_document(0), day_document(1)]),
+        rate_limit_per_minute=None,
+        request_delay=0,
+        circuit_breaker=False,
+        quota_ledger=None,
+    )
+    setup_directories(config)
+    params = {"documentType": "A44", "periodStart": "202401010000", "periodEnd": "202401030000"}
+
+    result = run_request(params, "two_days", config)
+    assert result["summary"]["data_points"] == 48
@@ -0,0 +1,60 @@
+"""
+The parsed JSON and CSV output must stay byte-identical to the original
+tree-walking parser's. The files under data/expected/ were written by that
+parser from the sample documents next to them.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from entsoe_core.parser import (
+    parse_and_merge_xml_folder,
+    parse_entsoe_columnar,
+    parse_entsoe_xml,
+    parsed_to_csv,
+)
+
+DATA = Path(__file__).parent / "data"
+EXPECTED = DATA / "expected"
+
+SAMPLES = [
+    "prices_ns",  # namespaced, PT60M, A03 curve with gaps, consecutive series merged
+    "prices_no_ns",  # the same without namespace
+    "load_pt15m",  # PT15M across the DST change
+    "generation_p1d",  # P1D, one series per production type
+    "imbalance_categories",  # one column per imbalance price category
+]
+
+
+def _assert_same(path, expected_name):
+    assert path.read_bytes() == (EXPECTED / expected_name).read_bytes()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("sample", SAMPLES)
+def test_json_matches_baseline(tmp_path, sample, streaming):
+    parse_entsoe_xml(str(DATA / f"{sample}.xml"), str(tmp_path / "out.json"), streaming=streaming)
+    _assert_same(tmp_path / "out.json", f"{sample}.json")
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("sample", SAMPLES)
+def test_csv_matches_baseline(tmp_path, sample, streaming):
+    parsed_to_csv(parse_entsoe_columnar(str(DATA / f"{sample}.xml"), streaming), str(tmp_path / "out.csv"))
+    _assert_same(tmp_path / "out.csv", f"{sample}.csv")
+
+
+@pytest.mark.parametrize("sample", SAMPLES)
+def test_csv_from_dict_matches_baseline(tmp_path, sample):
+    parsed_to_csv(parse_entsoe_xml(str(DATA / f"{sample}.xml")), str(tmp_path / "out.csv"))
+    _assert_same(tmp_path / "out.csv", f"{sample}.csv")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_historical_merge_matches_baseline(tmp_path, workers):
+    parse_and_merge_xml_folder(
+        str(DATA / "historical"), str(tmp_path / "out.json"), str(tmp_path / "out.csv"), workers=workers
+    )
+    _assert_same(tmp_path / "out.json", "historical.json")
+    _assert_same(tmp_path / "out.csv", "historical.csv")
@@ -0,0 +1,83 @@
+import hashlib
+
+from entsoe_core import payload as payload_module
+from entsoe_core.payload import MemoryPayloadWriter, PayloadStore
+from entsoe_core.service import build_config, run_request, setup_directories
+
+from fakes import PriceSession
+
+
+def _commit(writer, chunks):
+    for chunk in chunks:
+        writer.write(chunk)
+    return writer.commit()
+
+
+def test_spooled_body_is_hashed_and_deduplicated(tmp_path):
+    store = PayloadStore(tmp_path / "payloads")
+    first = _commit(store.writer(), [b"<xml>", b"body", b"</xml>"])
+    assert first.sha256 == hashlib.sha256(b"<xml>body</xml>").hexdigest()
+    assert first.size == 15
+    assert first.path.read_bytes() == b"<xml>body</xml>"
+
+    second = _commit(store.writer(), [b"<xml>body</xml>"])
+    assert second.path == first.path
+    assert list((tmp_path / "payloads").glob("*.tmp")) == []
+
+
+def test_save_to_hard_links_the_body(tmp_path):
+    payload = _commit(PayloadStore(tmp_path / "payloads").writer(), [b"<xml/>"])
+    destination = tmp_path / "out" / "response.xml"
+    payload.save_to(destination)
+
+    assert destination.read_bytes() == b"<xml/>"
+    assert destination.stat().st_ino == payload.path.stat().st_ino
+    # Saving again over the same file keeps it and leaves no temporary file
+    payload.save_to(destination)
+    assert sorted(path.name for path in destination.parent.iterdir()) == ["response.xml"]
+
+
+def test_save_to_copies_when_linking_fails(tmp_path, monkeypatch):
+    payload = _commit(PayloadStore(tmp_path / "payloads").writer(), [b"<xml/>"])
+
+    def no_link(source, destination):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(payload_module.os, "link", no_link)
+    destination = tmp_path / "out" / "response.xml"
+    payload.save_to(destination)
+    assert destination.read_bytes() == b"<xml/>"
+    assert destination.stat().st_ino != payload.path.stat().st_ino
+
+
+def test_memory_payload_stays_off_disk(tmp_path):
+    payload = _commit(MemoryPayloadWriter(), [b"<xml>", b"</xml>"])
+    assert payload.path is None
+    assert payload.source().read() == b"<xml></xml>"
+    assert payload.sha256 == hashlib.sha256(b"<xml></xml>").hexdigest()
+
+    payload.save_to(tmp_path / "response.xml")
+    assert (tmp_path / "response.xml").read_bytes() == b"<xml></xml>"
+
+
+def test_saved_response_shares_the_spooled_file(tmp_path):
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=PriceSession(),
+        rate_limit_per_minute=None,
+        request_delay=0,
+        circuit_breaker=False,
+        quota_ledger=None,
+    )
+    setup_directories(config)
+    params = {"documentType": "A44", "periodStart": "202401010000", "periodEnd": "202401020000"}
+
+    result = run_request(params, "day", config)
+    xml_path = tmp_path / "xml" / "day.xml"
+    assert [entry["path"] for entry in result["files"] if entry["type"] == "xml"] == [str(xml_path)]
+    spooled = [path for path in (tmp_path / "cache" / "payloads").glob("*/*.body")]
+    assert len(spooled) == 1
+    # Spool, output file and response cache entry are one file on disk
+    assert xml_path.stat().st_ino == spooled[0].stat().st_ino
+    assert xml_path.stat().st_nlink == 3
@@ -0,0 +1,61 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from entsoe_core.pipeline import BoundedExecutor
+
+
+def test_submit_blocks_at_the_limit():
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        bounded = BoundedExecutor(pool, 2)
+        first = bounded.submit(release.wait)
+        second = bounded.submit(release.wait)
+
+        submitted = threading.Event()
+
+        def produce():
+            bounded.submit(lambda: None).result()
+            submitted.set()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        # Both slots are held by unfinished tasks, so the producer waits
+        assert not submitted.wait(0.2)
+
+        release.set()
+        assert submitted.wait(5)
+        producer.join(5)
+        assert first.result() and second.result()
+
+
+def test_unfinished_tasks_never_exceed_the_limit():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def task():
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        threading.Event().wait(0.01)
+        with lock:
+            running.pop()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        bounded = BoundedExecutor(pool, 3)
+        futures = [bounded.submit(task) for _ in range(20)]
+        for future in futures:
+            future.result()
+    assert max(peak) <= 3
+
+
+def test_failed_submit_frees_its_slot():
+    pool = ThreadPoolExecutor(max_workers=1)
+    bounded = BoundedExecutor(pool, 1)
+    pool.shutdown()
+    # The second attempt would block forever if the first kept its slot
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            bounded.submit(lambda: None)
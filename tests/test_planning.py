@@ -0,0 +1,60 @@
+from entsoe_core.planning import plan_batch
+
+
+def _request(name, start, end, **extra):
+    params = {"documentType": "A65", "outBiddingZone_Domain": "10YNL----------L", **extra}
+    params.update(periodStart=start, periodEnd=end)
+    return {"name": name, "params": params}
+
+
+def test_overlapping_periods_share_one_query():
+    batch = [
+        _request("week", "202401240000", "202401310000"),
+        _request("month", "202401010000", "202401310000"),
+    ]
+    planned = plan_batch(batch)
+    assert len(planned) == 1
+    assert planned[0].members == [0, 1]
+    assert planned[0].shared
+    assert planned[0].params["periodStart"] == "202401010000"
+    assert planned[0].params["periodEnd"] == "202401310000"
+
+
+def test_touching_periods_merge_into_their_union():
+    batch = [
+        _request("feb", "202402010000", "202403010000"),
+        _request("jan", "202401010000", "202402010000"),
+    ]
+    planned = plan_batch(batch)
+    assert [query.members for query in planned] == [[0, 1]]
+    assert planned[0].params["periodStart"] == "202401010000"
+    assert planned[0].params["periodEnd"] == "202403010000"
+
+
+def test_disjoint_periods_stay_separate():
+    batch = [
+        _request("jan", "202401010000", "202401100000"),
+        _request("mar", "202403010000", "202403100000"),
+    ]
+    planned = plan_batch(batch)
+    assert [query.members for query in planned] == [[0], [1]]
+    assert not any(query.shared for query in planned)
+
+
+def test_different_data_sets_are_not_merged():
+    batch = [
+        _request("nl", "202401010000", "202401310000"),
+        _request("be", "202401010000", "202401310000", outBiddingZone_Domain="10YBE----------2"),
+    ]
+    assert [query.members for query in plan_batch(batch)] == [[0], [1]]
+
+
+def test_offset_and_invalid_period_are_never_merged():
+    batch = [
+        _request("paged", "202401010000", "202401310000", offset="100"),
+        _request("plain", "202401010000", "202401310000"),
+        _request("reversed", "202401310000", "202401010000"),
+    ]
+    planned = plan_batch(batch)
+    assert [query.members for query in planned] == [[0], [1], [2]]
+    assert planned[0].params["offset"] == "100"
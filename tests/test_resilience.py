@@ -0,0 +1,150 @@
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from entsoe_core.resilience import CircuitBreaker, parse_retry_after
+from entsoe_core.service import build_config, make_request
+
+from fakes import FakeResponse, day_document
+
+
+def _open_breaker(cooldown=0.05):
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=cooldown)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    assert breaker.retry_in() > 0
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+
+
+def test_half_open_allows_single_probe():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow()
+    assert breaker.snapshot()["state"] == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_aborted_probe_reopens_instead_of_sticking_half_open():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_abort()
+    assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+    time.sleep(0.06)
+    assert breaker.allow()
+
+
+def test_lost_probe_is_replaced_after_cooldown():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+
+def test_abort_while_closed_is_ignored():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60)
+    breaker.record_abort()
+    assert breaker.allow()
+
+
+def test_retry_after_seconds():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-5") == 0.0
+
+
+def test_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=90)
+    delay = parse_retry_after(format_datetime(when, usegmt=True))
+    assert 85 <= delay <= 90
+
+
+def test_retry_after_date_in_the_past():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_retry_after_missing_or_invalid():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+
+class _StatusSession:
+    """Answers calls with the given status codes in turn."""
+
+    def __init__(self, *status_codes):
+        self.status_codes = list(status_codes)
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        status_code = self.status_codes.pop(0)
+        return FakeResponse(status_code, day_document(0) if status_code == 200 else b"error")
+
+
+def _breaker_config(tmp_path, session, breaker):
+    config = build_config(
+        "token",
+        output_dir=tmp_path,
+        session=session,
+        rate_limit_per_minute=None,
+        request_delay=0,
+        retry_policy=None,
+        circuit_breaker=False,
+        response_cache=False,
+        negative_cache=False,
+        quota_ledger=None,
+    )
+    return replace(config, circuit_breaker=breaker)
+
+
+PARAMS = {"documentType": "A44", "periodStart": "202401010000", "periodEnd": "202401020000"}
+
+
+def test_throttling_does_not_reset_failure_count(tmp_path):
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    config = _breaker_config(tmp_path, _StatusSession(503, 429, 503), breaker)
+    make_request(PARAMS, config)
+    make_request(PARAMS, config)
+    assert breaker.snapshot()["consecutive_failures"] == 1
+    make_request(PARAMS, config)
+    assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+
+
+def test_throttled_probe_keeps_circuit_open(tmp_path):
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    config = _breaker_config(tmp_path, _StatusSession(429, 200), breaker)
+    assert make_request(PARAMS, config)["status_code"] == 429
+    assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+    time.sleep(0.06)
+    assert make_request(PARAMS, config)["status_code"] == 200
+    assert breaker.snapshot()["state"] == CircuitBreaker.CLOSED
@@ -0,0 +1,111 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from entsoe_core.parse_cache import LruBudget
+from entsoe_core.response_cache import (
+    DEFAULT_RECENT_TTL,
+    DEFAULT_UNSETTLED_TTL,
+    ResponseCache,
+    freshness_ttl,
+)
+from entsoe_core.payload import PayloadStore
+
+
+def test_settled_period_never_expires():
+    end = datetime.now(timezone.utc) - timedelta(days=31)
+    assert freshness_ttl(end, timedelta(days=30)) is None
+
+
+def test_unsettled_period_gets_unsettled_ttl():
+    end = datetime.now(timezone.utc) - timedelta(days=2)
+    assert freshness_ttl(end, timedelta(days=30)) == DEFAULT_UNSETTLED_TTL
+
+
+def test_window_reaching_now_gets_recent_ttl():
+    end = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert freshness_ttl(end) == DEFAULT_RECENT_TTL
+
+
+def test_missing_period_end_gets_recent_ttl():
+    assert freshness_ttl(None) == DEFAULT_RECENT_TTL
+
+
+def _store_payload(store, data):
+    writer = store.writer()
+    writer.write(data)
+    return writer.commit()
+
+
+def test_response_cache_roundtrip_ignores_token(tmp_path):
+    store = PayloadStore(tmp_path / "payloads")
+    cache = ResponseCache(tmp_path / "responses")
+    params = {"documentType": "A44", "periodStart": "202001010000", "periodEnd": "202001020000"}
+    cache.put("https://api", {**params, "securityToken": "a"}, 200, _store_payload(store, b"<xml/>"))
+
+    hit = cache.get("https://api", {**params, "securityToken": "b"})
+    assert hit["status_code"] == 200
+    assert hit["payload"].path.read_bytes() == b"<xml/>"
+    assert cache.get("https://other", params) is None
+
+
+def _write(directory, name, size, mtime):
+    path = directory / "ab" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_budget_prunes_oldest_only_when_over(tmp_path):
+    now = time.time()
+    budget = LruBudget(tmp_path, "*/*.body", max_bytes=300)
+    old = _write(tmp_path, "old.body", 100, now - 30)
+    budget.add(100)
+    _write(tmp_path, "mid.body", 100, now - 20)
+    budget.add(100)
+    _write(tmp_path, "new.body", 100, now - 10)
+    budget.add(100)
+    assert old.exists()
+
+    _write(tmp_path, "newest.body", 100, now)
+    budget.add(100)
+    # Pruned below the low-water mark, oldest first
+    assert not old.exists()
+    assert sorted(p.name for p in tmp_path.glob("*/*.body")) == ["new.body", "newest.body"]
+
+
+def _cache_files(directory, suffix):
+    return sorted(path.stem for path in directory.glob(f"*/*{suffix}"))
+
+
+def test_evicted_body_takes_its_metadata_along(tmp_path):
+    store = PayloadStore(tmp_path / "payloads")
+    cache = ResponseCache(tmp_path / "responses", max_bytes=250)
+    params = [
+        {"documentType": "A44", "periodStart": f"2020010{day}0000", "periodEnd": f"2020010{day + 1}0000"}
+        for day in (1, 2, 3)
+    ]
+    cache.put("https://api", params[0], 200, _store_payload(store, b"a" * 100))
+    cache.put("https://api", params[1], 200, _store_payload(store, b"b" * 100))
+    oldest = cache.key("https://api", params[0])
+    body = next((tmp_path / "responses").glob(f"*/{oldest}.body"))
+    os.utime(body, (time.time() - 60, time.time() - 60))
+
+    cache.put("https://api", params[2], 200, _store_payload(store, b"c" * 100))
+    responses = tmp_path / "responses"
+    assert oldest not in _cache_files(responses, ".resp")
+    assert _cache_files(responses, ".resp") == _cache_files(responses, ".body")
+    assert cache.get("https://api", params[0]) is None
+    assert cache.get("https://api", params[2]) is not None
+
+
+def test_entry_without_body_is_a_miss_and_removed(tmp_path):
+    store = PayloadStore(tmp_path / "payloads")
+    cache = ResponseCache(tmp_path / "responses")
+    params = {"documentType": "A44", "periodStart": "202001010000", "periodEnd": "202001020000"}
+    cache.put("https://api", params, 200, _store_payload(store, b"<xml/>"))
+    next((tmp_path / "responses").glob("*/*.body")).unlink()
+
+    assert cache.get("https://api", params) is None
+    assert list((tmp_path / "responses").glob("*/*.resp")) == []
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from entsoe_core.singleflight import AsyncSingleflight
+
+
+def test_followers_share_the_leaders_result():
+    group = AsyncSingleflight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "data"
+
+    async def main():
+        return await asyncio.gather(*(group.do("key", fetch) for _ in range(3)))
+
+    results = asyncio.run(main())
+    assert results == [("data", False), ("data", True), ("data", True)]
+    assert len(calls) == 1
+
+
+def test_cancelled_leader_does_not_cancel_follower():
+    group = AsyncSingleflight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "data"
+
+    async def main():
+        leader = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    # The follower takes over the call instead of being cancelled with the leader
+    assert asyncio.run(main()) == ("data", False)
+    assert len(calls) == 2